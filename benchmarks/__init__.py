@@ -0,0 +1,14 @@
+"""Benchmarks for the game's hot paths, run with `python -m benchmarks`."""
+
+import os
+import sys
+
+try:
+    import game  # noqa: F401
+except ModuleNotFoundError as error:
+    # Running from a fresh checkout without `poetry install`.
+    if error.name != "game":
+        raise
+    sys.path.insert(
+        0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+    )
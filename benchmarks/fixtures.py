@@ -0,0 +1,54 @@
+from typing import Optional
+from game.service.array_farm_system import ArrayFarmSystem
+from game.service.farm_system import FarmSystem
+from game.service.game_state import GameState
+from game.utils.clock import FakeClock
+
+SIZES = (9, 1_000, 100_000, 1_000_000)
+FARMS = {"list": FarmSystem, "array": ArrayFarmSystem}
+START = 1_700_000_000.0
+
+
+def build_game(
+    size: int,
+    farm: str = "list",
+    seed: int = 0,
+    save_file: Optional[str] = None,
+    save_format: str = "json",
+) -> GameState:
+    """A seeded farm of `size` plots at a fixed instant: two plots in three
+    planted with rotating crops, planted at staggered times so some are ready
+    and some are still growing."""
+    clock = FakeClock(start=START)
+    game = GameState(
+        farm=FARMS[farm](size=size, clock=clock),
+        clock=clock,
+        save_format=save_format,
+        save_file=save_file,
+        seed=seed,
+    )
+    game.player.money = 1_000_000
+    plant(game, every=3)
+    return game
+
+
+def plant(game: GameState, every: int = 1):
+    """Plant into every empty plot except each `every`-th one, spreading
+    planting times over the longest growth time."""
+    crops = list(game.crop_system.available_crops.values())
+    longest = max(crop.growth_time for crop in crops)
+    for i in range(len(game.farm.plots)):
+        if every > 1 and i % every == every - 1:
+            continue
+        age = (i * 7919) % (2 * longest)
+        game.clock.advance(-age)
+        game.farm.plant_crop(i, crops[i % len(crops)])
+        game.clock.advance(age)
+
+
+def ripen(game: GameState):
+    """Fill every plot and move the clock until all of them are ready."""
+    plant(game)
+    game.clock.advance(
+        max(crop.growth_time for crop in game.crop_system.available_crops.values())
+    )
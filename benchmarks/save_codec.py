@@ -0,0 +1,48 @@
+"""Compare the JSON and binary save codecs on farms from 9 to 1,000,000 plots.
+
+python -m benchmarks.save_codec [--sizes 9 1000 100000 1000000] [--farm array]
+"""
+
+import argparse
+import time
+from benchmarks.fixtures import FARMS, SIZES, build_game
+from game.service.game_state import GameState
+from game.service.save_codec import SAVE_CODECS
+
+
+def measure(game: GameState, codec_name: str, repeat: int) -> dict[str, float]:
+    game.codec = SAVE_CODECS[codec_name]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        payload = game.encode()
+    save_time = (time.perf_counter() - started) / repeat
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        game.codec.decode(payload, type(game.farm), game.clock)
+    load_time = (time.perf_counter() - started) / repeat
+
+    return {"bytes": len(payload), "save_s": save_time, "load_s": load_time}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--farm", choices=FARMS, default="array")
+    args = parser.parse_args()
+
+    print(f"{'plots':>10} {'codec':>7} {'bytes':>12} {'save ms':>10} {'load ms':>10}")
+    for size in args.sizes:
+        game = build_game(size, args.farm)
+        repeat = max(1, 10_000 // size)
+        for codec_name in SAVE_CODECS:
+            result = measure(game, codec_name, repeat)
+            print(
+                f"{size:>10} {codec_name:>7} {result['bytes']:>12,} "
+                f"{result['save_s'] * 1000:>10.2f} {result['load_s'] * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
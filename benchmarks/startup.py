@@ -0,0 +1,107 @@
+"""Cold-start time of the game's entry points, against a startup budget.
+
+python benchmarks/startup.py [--runs 20] [--budget-ms 50] [--importtime 15]
+
+Every command runs in a fresh interpreter. The source tree is byte-compiled
+first, as an installed package would be. The budget covers the time spent
+above a bare `python -c pass`, because interpreter startup is outside our
+control. Exits 1 when a command goes over budget.
+"""
+
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / "src"
+
+COMMANDS = {
+    "import": ["-c", "import game.main"],
+    "help": ["-m", "game", "--help"],
+    "simulate": ["-m", "game", "--seed", "1", "simulate", "--days", "1"],
+}
+
+
+def environment() -> dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    return env
+
+
+def measure(args: list[str], runs: int, env: dict[str, str]) -> list[float]:
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args], env=env, stdout=subprocess.DEVNULL, check=True
+        )
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def importtime(env: dict[str, str], top: int) -> list[tuple[int, int, str]]:
+    """The `top` slowest modules behind `import game.main` as
+    (self us, cumulative us, module), from `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import game.main"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument(
+        "--importtime",
+        type=int,
+        default=15,
+        metavar="N",
+        help="list the N slowest imports (0 to skip)",
+    )
+    args = parser.parse_args()
+
+    compileall.compile_dir(str(SRC), quiet=1)
+    env = environment()
+
+    baseline = statistics.median(measure(["-c", "pass"], args.runs, env))
+    print(f"python -c pass: {baseline * 1000:.1f} ms (not counted)")
+    print(f"{'command':>10} {'min ms':>8} {'median ms':>10} {'over python':>12}")
+
+    over_budget = []
+    for name, command in COMMANDS.items():
+        times = measure(command, args.runs, env)
+        overhead = (statistics.median(times) - baseline) * 1000
+        print(
+            f"{name:>10} {min(times) * 1000:>8.1f} "
+            f"{statistics.median(times) * 1000:>10.1f} {overhead:>12.1f}"
+        )
+        if overhead > args.budget_ms:
+            over_budget.append(name)
+
+    if args.importtime:
+        print(f"\n{'self ms':>8} {'cumul ms':>9}  module")
+        for self_us, cumulative_us, module in importtime(env, args.importtime):
+            print(f"{self_us / 1000:>8.2f} {cumulative_us / 1000:>9.2f}  {module}")
+
+    if over_budget:
+        print(f"\nOver the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
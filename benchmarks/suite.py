@@ -0,0 +1,223 @@
+"""Time the game's hot paths on generated farms of 9 to 1,000,000 plots.
+
+python -m benchmarks [--sizes 9 1000] [--farms list array] [--cases harvest ...]
+                     [--output results.json] [--compare baseline.json]
+
+Each case runs until it has at least MIN_REPEAT samples and --min-time
+seconds have passed. Fast cases are batched like timeit, so one sample is
+never shorter than about CALIBRATE_TIME. With --compare, a case whose best
+time is more than --threshold slower than the baseline counts as a
+regression, and the run exits 1.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Optional
+from benchmarks.fixtures import FARMS, SIZES, build_game, plant, ripen
+from game.service.game_state import GameState
+from game.service.render_system import ScreenRenderer
+from game.service.save_codec import SAVE_CODECS
+from game.service.tui_system import TerminalUI
+
+MIN_REPEAT = 3
+MAX_REPEAT = 1000
+CALIBRATE_TIME = 0.005
+
+
+class Case:
+    """`run` is timed. `setup`, when given, runs untimed before every sample."""
+
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[], Any],
+        setup: Optional[Callable[[], Any]] = None,
+    ):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+def build_cases(game: GameState, workdir: str) -> list[Case]:
+    ui = TerminalUI(game)
+    ui.renderer = ScreenRenderer(io.StringIO())
+    days = iter(range(game.time_system.day, sys.maxsize))
+
+    def next_day():
+        # next_day costs a heart, keep the player awake for every sample.
+        game.player.full_restore()
+        game.next_day()
+
+    def use_codec(codec_name: str) -> Callable[[], None]:
+        def setup():
+            game.codec = SAVE_CODECS[codec_name]
+            game.save_file = os.path.join(workdir, "bench" + game.codec.EXTENSION)
+
+        return setup
+
+    cases = [
+        Case("display_farm", ui.display_farm),
+        Case("next_day", next_day),
+        Case("event_update", lambda: game.event_system.update(next(days))),
+        Case(
+            "apply_growth_bonus",
+            lambda: game.farm.apply_growth_bonus(100),
+            lambda: plant(game, every=3),
+        ),
+        Case(
+            "harvest_ready_crops",
+            game.farm.harvest_ready_crops,
+            lambda: ripen(game),
+        ),
+    ]
+    # Loading replaces the farm, so the save/load cases go last.
+    cases += [Case(f"save[{name}]", game.save, use_codec(name)) for name in SAVE_CODECS]
+    cases += [Case(f"load[{name}]", game.load, use_codec(name)) for name in SAVE_CODECS]
+    return cases
+
+
+def calibrate(run: Callable[[], Any]) -> int:
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - started >= CALIBRATE_TIME or number >= 1 << 20:
+            return number
+        number *= 2
+
+
+def measure(case: Case, min_time: float) -> dict[str, Any]:
+    number = 1 if case.setup is not None else calibrate(case.run)
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < MIN_REPEAT or (
+        time.perf_counter() - started < min_time and len(samples) < MAX_REPEAT
+    ):
+        if case.setup is not None:
+            case.setup()
+        sample_started = time.perf_counter()
+        for _ in range(number):
+            case.run()
+        samples.append((time.perf_counter() - sample_started) / number)
+    return {
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "repeat": len(samples),
+        "number": number,
+    }
+
+
+def result_key(result: dict[str, Any]) -> tuple[str, str, int]:
+    return result["case"], result["farm"], result["plots"]
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> list[tuple[str, str, int]]:
+    """Print each result against the baseline, returns the regressions."""
+    before = {result_key(result): result for result in baseline["results"]}
+    regressions = []
+    print(
+        f"\n{'case':<22} {'farm':>5} {'plots':>9} {'baseline':>10} "
+        f"{'now':>10} {'ratio':>7}"
+    )
+    for result in results:
+        old = before.get(result_key(result))
+        if old is None:
+            continue
+        ratio = result["min_s"] / old["min_s"] if old["min_s"] else 1.0
+        verdict = ""
+        if ratio > 1 + threshold:
+            verdict = "  REGRESSION"
+            regressions.append(result_key(result))
+        elif ratio < 1 - threshold:
+            verdict = "  faster"
+        print(
+            f"{result['case']:<22} {result['farm']:>5} {result['plots']:>9,} "
+            f"{format_time(old['min_s']):>10} {format_time(result['min_s']):>10} "
+            f"{ratio:>6.2f}x{verdict}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument(
+        "--farms", choices=sorted(FARMS), nargs="+", default=sorted(FARMS)
+    )
+    parser.add_argument(
+        "--cases", nargs="+", help="only run cases whose name starts with these"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.5, help="seconds to spend per case"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON written by --output")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="slowdown that counts as a regression (0.15 = 15%%)",
+    )
+    args = parser.parse_args(argv)
+
+    results = []
+    print(
+        f"{'case':<22} {'farm':>5} {'plots':>9} {'min':>10} {'median':>10} {'runs':>7}"
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for farm in args.farms:
+            for size in args.sizes:
+                game = build_game(size, farm, args.seed)
+                for case in build_cases(game, workdir):
+                    if args.cases and not case.name.startswith(tuple(args.cases)):
+                        continue
+                    result = {"case": case.name, "farm": farm, "plots": size}
+                    result.update(measure(case, args.min_time))
+                    results.append(result)
+                    print(
+                        f"{case.name:<22} {farm:>5} {size:>9,} "
+                        f"{format_time(result['min_s']):>10} "
+                        f"{format_time(result['median_s']):>10} "
+                        f"{result['repeat'] * result['number']:>7}"
+                    )
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
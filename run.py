@@ -1,11 +1,14 @@
+import os
 import sys
-from pathlib import Path
 
-PYTHONPATH = str(Path(__file__).parent / "src" / "game")
-
-sys.path.append(PYTHONPATH)
-
-from main import main
+try:
+    from game.main import main
+except ModuleNotFoundError as error:
+    # Running from a fresh checkout without `poetry install`.
+    if error.name != "game":
+        raise
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+    from game.main import main
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,3 @@
+from game.main import main
+
+main()
@@ -0,0 +1,78 @@
+import random
+from typing import Optional, Sequence
+
+
+class Collection:
+    """A fixed catalogue of names with the found ones kept as a bitset.
+
+    Membership is one bit test. The indices still missing sit in a list with
+    a position map, so drawing a random missing entry and removing it are
+    both O(1).
+    """
+
+    def __init__(self, names: Sequence[str], bits: int = 0):
+        self.names = tuple(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.bits = 0
+        self.count = 0
+        self._missing = list(range(len(self.names)))
+        self._missing_pos = {i: i for i in self._missing}
+        for i in range(len(self.names)):
+            if bits >> i & 1:
+                self._mark(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        i = self.index.get(name)
+        return i is not None and bool(self.bits >> i & 1)
+
+    @property
+    def complete(self) -> bool:
+        return self.count == len(self.names)
+
+    def has_index(self, i: int) -> bool:
+        return bool(self.bits >> i & 1)
+
+    def _mark(self, i: int):
+        self.bits |= 1 << i
+        self.count += 1
+        # Swap-remove from the missing list.
+        pos = self._missing_pos.pop(i)
+        last = self._missing.pop()
+        if last != i:
+            self._missing[pos] = last
+            self._missing_pos[last] = pos
+
+    def add(self, name: str) -> bool:
+        """Mark `name` found, returns True if it was new."""
+        i = self.index.get(name)
+        if i is None or self.bits >> i & 1:
+            return False
+        self._mark(i)
+        return True
+
+    def draw_missing(self, rng: random.Random) -> Optional[str]:
+        if not self._missing:
+            return None
+        return self.names[self._missing[rng.randrange(len(self._missing))]]
+
+    def found(self) -> list[str]:
+        return [name for i, name in enumerate(self.names) if self.bits >> i & 1]
+
+
+class CollectionRule:
+    """Unlocks once `collection` holds `threshold` entries (None: all)."""
+
+    def __init__(
+        self,
+        name: str,
+        collection: str,
+        threshold: Optional[int],
+        message: str,
+    ):
+        self.name = name
+        self.collection = collection
+        self.threshold = threshold
+        self.message = message
@@ -1,7 +1,7 @@
 from typing import Any
 
 
-from interfaces.serializable import ISerializable
+from game.interfaces.serializable import ISerializable
 
 
 class Crop(ISerializable):
@@ -0,0 +1,18 @@
+from typing import Any, Callable, Optional
+
+
+class EventDefinition:
+    def __init__(
+        self,
+        name: str,
+        weight: float,
+        effect: Callable[[Any], Optional[str]],
+        condition: Optional[Callable[[Any], bool]] = None,
+    ):
+        self.name = name
+        self.weight = weight
+        self.effect = effect
+        self.condition = condition
+
+    def is_possible(self, system: Any) -> bool:
+        return self.condition is None or self.condition(system)
@@ -0,0 +1,57 @@
+from typing import Any, Callable
+
+
+class ItemEffect:
+    """What buying an item does, and how to tell the player already has it."""
+
+    def __init__(
+        self,
+        apply: Callable[[Any], str],
+        owned: Callable[[Any], bool],
+    ):
+        self.apply = apply
+        self.owned = owned
+
+
+class MerchantItem:
+    def __init__(
+        self,
+        key: str,
+        price: int,
+        effect: str,
+        description: str = "",
+        narrative: bool = False,
+    ):
+        self.key = key
+        self.price = price
+        self.effect = effect
+        self.description = description
+        self.narrative = narrative
+
+
+class MerchantSeed:
+    def __init__(self, key: str, crop: str, price: int):
+        self.key = key
+        self.crop = crop
+        self.price = price
+
+
+class Offer:
+    """One row of the shop as it stands today: the price to pay right now
+    and whether buying it would do anything."""
+
+    def __init__(
+        self,
+        key: str,
+        kind: str,
+        price: int,
+        owned: bool,
+        description: str,
+        narrative: bool = False,
+    ):
+        self.key = key
+        self.kind = kind
+        self.price = price
+        self.owned = owned
+        self.description = description
+        self.narrative = narrative
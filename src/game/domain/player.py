@@ -1,9 +1,23 @@
 from datetime import datetime
 from typing import Any, Optional
-from interfaces.serializable import ISerializable
+from game.interfaces.serializable import ISerializable
+from game.utils.clock import DEFAULT_CLOCK
+from game.utils.tracking import Tracked
 
 
-class Player(ISerializable):
+class Player(Tracked, ISerializable):
+    TRACKED = frozenset(
+        (
+            "money",
+            "stamina",
+            "max_stamina",
+            "last_sleep_time",
+            "has_farmdex",
+            "has_lantern",
+            "can_sleep_anytime",
+        )
+    )
+
     def __init__(
         self,
         money: int = 50,
@@ -14,10 +28,9 @@ class Player(ISerializable):
         self.money = money
         self.stamina = stamina
         self.max_stamina = max_stamina
-        self.last_sleep_time = last_sleep_time or datetime.now()
+        self.last_sleep_time = last_sleep_time or DEFAULT_CLOCK.now()
         self.has_farmdex = False
         self.has_lantern = False
-        self.fossils_found = []
         self.can_sleep_anytime = False
 
     def can_afford(self, amount: int) -> bool:
@@ -49,7 +62,6 @@ class Player(ISerializable):
             "last_sleep_time": self.last_sleep_time.isoformat(),
             "has_farmdex": getattr(self, "has_farmdex", False),
             "has_lantern": getattr(self, "has_lantern", False),
-            "fossils_found": getattr(self, "fossils_found", []),
             "can_sleep_anytime": getattr(self, "can_sleep_anytime", False),
         }
 
@@ -63,6 +75,5 @@ class Player(ISerializable):
         )
         obj.has_farmdex = data.get("has_farmdex", False)
         obj.has_lantern = data.get("has_lantern", False)
-        obj.fossils_found = data.get("fossils_found", [])
         obj.can_sleep_anytime = data.get("can_sleep_anytime", False)
         return obj
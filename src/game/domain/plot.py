@@ -1,16 +1,21 @@
 from datetime import datetime
 from typing import Optional, Any
 
-from interfaces.serializable import ISerializable
-from domain.crop import Crop
+from game.interfaces.serializable import ISerializable
+from game.domain.crop import Crop
+from game.utils.clock import DEFAULT_CLOCK, GameClock
 
 
 class Plot(ISerializable):
     def __init__(
-        self, crop: Optional[Crop] = None, planted_at: Optional[datetime] = None
+        self,
+        crop: Optional[Crop] = None,
+        planted_at: Optional[datetime] = None,
+        clock: Optional[GameClock] = None,
     ):
         self.crop = crop
         self.planted_at = planted_at
+        self.clock = clock or DEFAULT_CLOCK
 
     @property
     def is_empty(self) -> bool:
@@ -21,8 +26,9 @@ class Plot(ISerializable):
         if self.is_empty or self.planted_at is None:
             return 0.0
 
-        elapsed = (datetime.now() - self.planted_at).total_seconds()
-        return min(1.0, elapsed / self.crop.growth_time)
+        elapsed = (self.clock.now() - self.planted_at).total_seconds()
+        # Clamped, a clock behind planted_at must not give negative progress.
+        return min(1.0, max(0.0, elapsed / self.crop.growth_time))
 
     @property
     def is_ready(self) -> bool:
@@ -30,7 +36,7 @@ class Plot(ISerializable):
 
     def plant(self, crop: Crop):
         self.crop = crop
-        self.planted_at = datetime.now()
+        self.planted_at = self.clock.now()
 
     def harvest(self) -> int:
         if self.is_empty or not self.is_ready:
@@ -48,11 +54,14 @@ class Plot(ISerializable):
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Plot":
+    def from_dict(
+        cls, data: dict[str, Any], clock: Optional[GameClock] = None
+    ) -> "Plot":
         crop_data = data["crop"]
         planted_at = data["planted_at"]
 
         return cls(
             crop=Crop.from_dict(crop_data) if crop_data else None,
             planted_at=datetime.fromisoformat(planted_at) if planted_at else None,
+            clock=clock,
         )
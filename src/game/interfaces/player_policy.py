@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Any, Tuple
+
+
+class IPlayerPolicy(ABC):
+    @abstractmethod
+    def decide(self, game: Any) -> Tuple[Any, ...]:
+        pass
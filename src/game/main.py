@@ -1,16 +1,34 @@
+import argparse
+import os
 import time
 import sys
-from service.game_state import GameState
-from service.tui_system import TerminalUI
 
+# The web frontend next to src/ in a checkout, absent from installed copies.
+WEB_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "web")
 
-def main():
-    game_state: GameState = GameState()
-    ui: TerminalUI = TerminalUI(game_state)
+
+def play(args: argparse.Namespace):
+    from game.service.game_state import GameState
+    from game.service.tui_system import TerminalUI
+    from game.utils.clock import GameClock
+
+    game_state: GameState = GameState(
+        clock=GameClock(speed=args.speed),
+        save_format=args.save_format,
+        seed=args.seed,
+    )
+    ui: TerminalUI = TerminalUI(game_state, fps=args.fps)
+    if args.profile:
+        ui.overlay = True
+        ui.watch_metrics()
 
     if not game_state.load():
         print("Starting new game...")
         time.sleep(1)
+    elif game_state.offline_progress and game_state.offline_progress.away_seconds > 60:
+        print(game_state.offline_progress.summary())
+        time.sleep(2)
+    game_state.enable_journal()
 
     try:
         ui.start_game_loop()
@@ -20,5 +38,233 @@ def main():
         sys.exit()
 
 
+def policy(name: str) -> str:
+    """--policy type, so the policies are only imported by the commands
+    that take one."""
+    from game.service.policy_system import POLICIES
+
+    if name not in POLICIES:
+        raise argparse.ArgumentTypeError(f"choose from {', '.join(sorted(POLICIES))}")
+    return name
+
+
+def simulate(args: argparse.Namespace):
+    from game.service.policy_system import POLICIES
+    from game.service.simulation_system import HeadlessRunner
+
+    runner = HeadlessRunner(POLICIES[args.policy](), seed=args.seed)
+    report = runner.run(args.days)
+
+    print(f"Policy: {args.policy} (seed {runner.game.rng.seed})")
+    print(f"Simulated {report.days} days / {report.actions} actions")
+    print(f"Elapsed: {report.elapsed:.3f}s")
+    print(f"Days/sec: {report.days_per_second:,.0f}")
+    print(f"Actions/sec: {report.actions_per_second:,.0f}")
+    print(f"Final money: ${report.money}")
+    print(f"Fishing unlocked: {report.fishing_unlocked}")
+    print(f"Unlocked crops: {', '.join(report.unlocked_crops)}")
+
+    if args.profile:
+        from game.utils.metrics import METRICS
+
+        print(f"\n{'call':<36} {'calls':>9} {'mean us':>9} {'total ms':>9}")
+        for name, timer in METRICS.slowest(15):
+            print(
+                f"{name:<36} {timer.count:>9,} {timer.mean * 1e6:>9.1f} "
+                f"{timer.total * 1000:>9.1f}"
+            )
+
+
+def montecarlo(args: argparse.Namespace):
+    from game.service.montecarlo_system import MonteCarloSimulator
+
+    simulator = MonteCarloSimulator(
+        policy=args.policy,
+        days=args.days,
+        seed=args.seed or 0,
+        workers=args.workers,
+    )
+
+    if args.scaling:
+        reports = simulator.scaling(args.runs)
+        base = reports[0].runs_per_second
+        print(f"{'workers':>8} {'runs/sec':>10} {'days/sec':>12} {'speedup':>8}")
+        for report in reports:
+            speedup = report.runs_per_second / base if base else 0.0
+            print(
+                f"{report.workers:>8} {report.runs_per_second:>10,.1f} "
+                f"{report.days_per_second:>12,.0f} {speedup:>7.2f}x"
+            )
+        return
+
+    report = simulator.run(args.runs)
+    print(
+        f"{report.runs} runs x {report.days} days on {report.workers} workers "
+        f"in {report.elapsed:.2f}s ({report.runs_per_second:,.1f} runs/sec)"
+    )
+    print(
+        f"{'metric':<24} {'runs':>6} {'mean':>10} {'p10':>10} "
+        f"{'p50':>10} {'p90':>10} {'p99':>10}"
+    )
+    for name, dist in sorted(report.metrics.items()):
+        print(
+            f"{name:<24} {dist.count:>6} {dist.mean:>10,.0f} "
+            + " ".join(f"{dist.percentile(q):>10,.0f}" for q in (10, 50, 90, 99))
+        )
+
+    final_money = report.metrics.get("final_money")
+    if final_money:
+        print("\nFinal money")
+        histogram = final_money.histogram(10)
+        peak = max(count for _, _, count in histogram)
+        for low, high, count in histogram:
+            bar = "#" * round(40 * count / peak) if peak else ""
+            print(f"{low:>12,.0f} - {high:>12,.0f} {count:>6} {bar}")
+
+
+def serve(args: argparse.Namespace):
+    import asyncio
+    from game.service.server_system import GameServer
+
+    server = GameServer(save_dir=args.save_dir, save_format=args.save_format)
+    try:
+        asyncio.run(
+            server.serve(
+                args.host,
+                args.port,
+                args.unix,
+                args.metrics_port,
+                args.http_port,
+                args.web_dir,
+            )
+        )
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="terminal-farm")
+    subparsers = parser.add_subparsers(dest="command")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="game time multiplier, e.g. 60 makes one game minute last one second",
+    )
+    parser.add_argument(
+        "--save-format",
+        choices=["json", "binary"],
+        default="json",
+        help="format of the save file (binary is much smaller for large farms)",
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=4.0,
+        help="redraws per second while crops grow or messages are shown",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed for every random stream, the same seed replays the same game",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time the game's systems (press d in the game for the overlay)",
+    )
+    parser.add_argument(
+        "--metrics-jsonl",
+        metavar="PATH",
+        help="profile and append a metrics snapshot to PATH periodically",
+    )
+    parser.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=10.0,
+        help="seconds between --metrics-jsonl snapshots",
+    )
+    subparsers.add_parser("play", help="play in the terminal (default)")
+
+    simulate_parser = subparsers.add_parser(
+        "simulate", help="run the game headlessly through a player policy"
+    )
+    simulate_parser.add_argument("--days", type=int, default=1000)
+    simulate_parser.add_argument(
+        "--policy", type=policy, default="greedy", help="greedy (default) or sleepy"
+    )
+
+    montecarlo_parser = subparsers.add_parser(
+        "montecarlo", help="economy distributions over many seeded runs"
+    )
+    montecarlo_parser.add_argument("--runs", type=int, default=1000)
+    montecarlo_parser.add_argument("--days", type=int, default=365)
+    montecarlo_parser.add_argument(
+        "--policy", type=policy, default="greedy", help="greedy (default) or sleepy"
+    )
+    montecarlo_parser.add_argument(
+        "--workers", type=int, help="worker processes (default: CPU count)"
+    )
+    montecarlo_parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="report throughput at 1, 2, 4, ... workers instead of distributions",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="host many farms over a line-oriented socket protocol"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=7777)
+    serve_parser.add_argument("--unix", help="listen on a Unix socket path instead")
+    serve_parser.add_argument(
+        "--save-dir", help="persist each farm as <save-dir>/<farm name>"
+    )
+    serve_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="profile and serve Prometheus metrics at http://<host>:PORT/metrics",
+    )
+    serve_parser.add_argument(
+        "--http-port",
+        type=int,
+        help="serve the JSON API and the web frontend at http://<host>:PORT/",
+    )
+    serve_parser.add_argument(
+        "--web-dir",
+        default=WEB_DIR if os.path.isdir(WEB_DIR) else None,
+        help="static files for the web frontend (default: the repo's web/)",
+    )
+
+    args = parser.parse_args(argv)
+
+    dumper = None
+    if args.metrics_jsonl or getattr(args, "metrics_port", None):
+        args.profile = True
+    if args.profile:
+        from game.service.profiling_system import PROFILER
+
+        PROFILER.enable()
+        if args.metrics_jsonl:
+            from game.utils.metrics import JsonlDumper
+
+            dumper = JsonlDumper(
+                PROFILER.metrics, args.metrics_jsonl, args.metrics_interval
+            ).start()
+
+    try:
+        if args.command == "simulate":
+            simulate(args)
+        elif args.command == "montecarlo":
+            montecarlo(args)
+        elif args.command == "serve":
+            serve(args)
+        else:
+            play(args)
+    finally:
+        if dumper is not None:
+            dumper.stop()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,381 @@
+import random
+from array import array
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from game.domain.crop import Crop
+from game.domain.plot import Plot
+from game.service.farm_system import FarmSystem
+from game.utils.clock import DEFAULT_CLOCK, GameClock
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the array module is enough to run.
+    np = None
+
+
+EMPTY = -1
+
+
+class PlotView(Plot):
+    """A Plot that reads and writes one slot of an ArrayFarmSystem."""
+
+    def __init__(self, farm: "ArrayFarmSystem", index: int):
+        self._farm = farm
+        self._index = index
+        self.clock = farm.clock
+
+    @property
+    def crop(self) -> Optional[Crop]:
+        crop_id = self._farm.crop_ids[self._index]
+        return None if crop_id == EMPTY else self._farm.crop_table[crop_id]
+
+    @crop.setter
+    def crop(self, crop: Optional[Crop]):
+        self._farm.crop_ids[self._index] = (
+            EMPTY if crop is None else self._farm.intern_crop(crop)
+        )
+
+    @property
+    def planted_at(self) -> Optional[datetime]:
+        if self._farm.crop_ids[self._index] == EMPTY:
+            return None
+        return datetime.fromtimestamp(self._farm.planted_at[self._index])
+
+    @planted_at.setter
+    def planted_at(self, planted_at: Optional[datetime]):
+        self._farm.planted_at[self._index] = (
+            planted_at.timestamp() if planted_at else 0.0
+        )
+
+
+class PlotsView:
+    """Sequence of PlotView objects, so code written against FarmSystem.plots
+    keeps working on the array store."""
+
+    def __init__(self, farm: "ArrayFarmSystem"):
+        self._farm = farm
+
+    def __len__(self) -> int:
+        return len(self._farm.crop_ids)
+
+    def __getitem__(self, index: int) -> PlotView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("plot index out of range")
+        return PlotView(self._farm, index)
+
+    def __setitem__(self, index: int, plot: Plot):
+        self._farm.set_plot(index, plot.crop, plot.planted_at)
+
+    def __iter__(self):
+        return (PlotView(self._farm, i) for i in range(len(self)))
+
+
+class ArrayFarmSystem(FarmSystem):
+    """Struct-of-arrays farm: crop ids in an int16 array, planted-at as float
+    epoch seconds. Bulk operations use NumPy when it is installed, and ready
+    queries are vectorized scans rather than the heap index of FarmSystem."""
+
+    def __init__(self, size: int = 9, clock: Optional[GameClock] = None):
+        self.clock = clock or DEFAULT_CLOCK
+        self.crop_ids = array("h", [EMPTY]) * size
+        self.planted_at = array("d", [0.0]) * size
+        self.crop_table: list[Crop] = []
+        self.crop_index: dict[str, int] = {}
+        self.rng = random.Random()
+        self.listener = None
+        self._touch_all()
+
+    @property
+    def plots(self) -> PlotsView:
+        return PlotsView(self)
+
+    @plots.setter
+    def plots(self, plots):
+        size = len(plots)
+        self.crop_ids = array("h", [EMPTY]) * size
+        self.planted_at = array("d", [0.0]) * size
+        for i, plot in enumerate(plots):
+            self.set_plot(i, plot.crop, plot.planted_at)
+        self._touch_all()
+
+    def intern_crop(self, crop: Crop) -> int:
+        crop_id = self.crop_index.get(crop.name)
+        if crop_id is None:
+            crop_id = len(self.crop_table)
+            self.crop_table.append(crop)
+            self.crop_index[crop.name] = crop_id
+        return crop_id
+
+    def set_plot(
+        self, plot_index: int, crop: Optional[Crop], planted_at: Optional[datetime]
+    ):
+        if crop is None:
+            self.crop_ids[plot_index] = EMPTY
+            self.planted_at[plot_index] = 0.0
+        else:
+            self.crop_ids[plot_index] = self.intern_crop(crop)
+            self.planted_at[plot_index] = (
+                planted_at.timestamp() if planted_at else self.clock.time()
+            )
+
+    def _replace_plot(self, plot_index: int, plot: Plot):
+        self.set_plot(plot_index, plot.crop, plot.planted_at)
+
+    def plant_crop(self, plot_index: int, crop: Crop):
+        if 0 <= plot_index < len(self.crop_ids):
+            self.set_plot(plot_index, crop, None)
+            self._emit(["plant", plot_index, crop.name, self.planted_at[plot_index]])
+
+    def get_plot_status(self, plot_index: int) -> Tuple[Optional[Crop], float]:
+        if plot_index not in range(len(self.crop_ids)):
+            return None, 0.0
+
+        crop_id = self.crop_ids[plot_index]
+        if crop_id == EMPTY:
+            return None, 0.0
+
+        crop = self.crop_table[crop_id]
+        elapsed = self.clock.time() - self.planted_at[plot_index]
+        return crop, max(0.0, min(1.0, elapsed / crop.growth_time))
+
+    def _tables(self):
+        growth_times = np.array(
+            [crop.growth_time for crop in self.crop_table] + [np.inf], dtype=np.float64
+        )
+        values = np.array(
+            [crop.value for crop in self.crop_table] + [0], dtype=np.int64
+        )
+        # Index -1 (EMPTY) picks the trailing sentinel: never ready, worth nothing.
+        return growth_times, values
+
+    def ready_mask(self, now: Optional[float] = None):
+        now = self.clock.time() if now is None else now
+        if np is not None:
+            ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+            planted_at = np.frombuffer(self.planted_at, dtype=np.float64)
+            growth_times, _ = self._tables()
+            return now - planted_at >= growth_times[ids]
+
+        growth_times = [crop.growth_time for crop in self.crop_table]
+        return [
+            crop_id != EMPTY and now - planted_at >= growth_times[crop_id]
+            for crop_id, planted_at in zip(self.crop_ids, self.planted_at)
+        ]
+
+    def ready_count(self, now: Optional[float] = None) -> int:
+        mask = self.ready_mask(now)
+        return int(mask.sum()) if np is not None else sum(mask)
+
+    def next_ready_at(self, now: Optional[float] = None) -> Optional[float]:
+        now = self.clock.time() if now is None else now
+        if np is not None:
+            ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+            planted_at = np.frombuffer(self.planted_at, dtype=np.float64)
+            growth_times, _ = self._tables()
+            ready_at = planted_at + growth_times[ids]
+            # Empty plots are ready at inf through the sentinel, not growing.
+            growing = ready_at[(ids != EMPTY) & (ready_at > now)]
+            return float(growing.min()) if len(growing) else None
+
+        growth_times = [crop.growth_time for crop in self.crop_table]
+        return min(
+            (
+                planted_at + growth_times[crop_id]
+                for crop_id, planted_at in zip(self.crop_ids, self.planted_at)
+                if crop_id != EMPTY and planted_at + growth_times[crop_id] > now
+            ),
+            default=None,
+        )
+
+    def harvest_ready_crops(self) -> int:
+        now = self.clock.time()
+        if np is not None:
+            ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+            planted_at = np.frombuffer(self.planted_at, dtype=np.float64)
+            growth_times, values = self._tables()
+            mask = now - planted_at >= growth_times[ids]
+            total = int(values[ids[mask]].sum())
+            if mask.any():
+                self._emit(["clear", np.flatnonzero(mask).tolist()])
+            ids[mask] = EMPTY
+            planted_at[mask] = 0.0
+            return total
+
+        total = 0
+        harvested = []
+        crop_ids, planted = self.crop_ids, self.planted_at
+        for i, crop_id in enumerate(crop_ids):
+            if crop_id == EMPTY:
+                continue
+            crop = self.crop_table[crop_id]
+            if now - planted[i] >= crop.growth_time:
+                total += crop.value
+                crop_ids[i] = EMPTY
+                planted[i] = 0.0
+                harvested.append(i)
+        if harvested:
+            self._emit(["clear", harvested])
+        return total
+
+    def empty_plots(self, plot_indices: Optional[list[int]] = None) -> list[int]:
+        if np is not None:
+            ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+            if plot_indices is None:
+                return np.flatnonzero(ids == EMPTY).tolist()
+            selected = np.asarray(plot_indices, dtype=np.intp)
+            return selected[ids[selected] == EMPTY].tolist()
+
+        crop_ids = self.crop_ids
+        candidates = range(len(crop_ids)) if plot_indices is None else plot_indices
+        return [i for i in candidates if crop_ids[i] == EMPTY]
+
+    def _plant_plots(self, plot_indices: list[int], crop: Crop, planted_at: float):
+        crop_id = self.intern_crop(crop)
+        if np is not None:
+            selected = np.asarray(plot_indices, dtype=np.intp)
+            np.frombuffer(self.crop_ids, dtype=np.int16)[selected] = crop_id
+            np.frombuffer(self.planted_at, dtype=np.float64)[selected] = planted_at
+            return
+
+        for i in plot_indices:
+            self.crop_ids[i] = crop_id
+            self.planted_at[i] = planted_at
+
+    def harvest_plots(self, plot_indices: list[int]) -> int:
+        now = self.clock.time()
+        if np is not None:
+            ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+            planted_at = np.frombuffer(self.planted_at, dtype=np.float64)
+            growth_times, values = self._tables()
+            # Unique, so a plot listed twice is not paid for twice.
+            selected = np.unique(np.asarray(plot_indices, dtype=np.intp))
+            ready = selected[now - planted_at[selected] >= growth_times[ids[selected]]]
+            if not len(ready):
+                return 0
+            total = int(values[ids[ready]].sum())
+            ids[ready] = EMPTY
+            planted_at[ready] = 0.0
+            self._emit(["clear", ready.tolist()])
+            return total
+
+        total = 0
+        harvested = []
+        crop_ids, planted = self.crop_ids, self.planted_at
+        for i in plot_indices:
+            crop_id = crop_ids[i]
+            if crop_id == EMPTY:
+                continue
+            crop = self.crop_table[crop_id]
+            if now - planted[i] >= crop.growth_time:
+                total += crop.value
+                crop_ids[i] = EMPTY
+                planted[i] = 0.0
+                harvested.append(i)
+        if harvested:
+            self._emit(["clear", sorted(harvested)])
+        return total
+
+    def damage_random_crop(self):
+        if np is not None:
+            occupied_plots = np.flatnonzero(
+                np.frombuffer(self.crop_ids, dtype=np.int16) != EMPTY
+            )
+            if not len(occupied_plots):
+                return None
+            plot_idx = int(occupied_plots[self.rng.randrange(len(occupied_plots))])
+        else:
+            occupied_plots = [
+                i for i, crop_id in enumerate(self.crop_ids) if crop_id != EMPTY
+            ]
+            if not occupied_plots:
+                return None
+            plot_idx = self.rng.choice(occupied_plots)
+
+        self.set_plot(plot_idx, None, None)
+        self._emit(["clear", [plot_idx]])
+        return "A storm came! Some crops were damaged."
+
+    def apply_growth_bonus(self, bonus_percent: float):
+        if np is not None:
+            ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+            planted_at = np.frombuffer(self.planted_at, dtype=np.float64)
+            growth_times, _ = self._tables()
+            occupied = ids != EMPTY
+            planted_at[occupied] -= growth_times[ids[occupied]] * (bonus_percent / 100)
+        else:
+            bonus_times = [
+                crop.growth_time * (bonus_percent / 100) for crop in self.crop_table
+            ]
+            planted = self.planted_at
+            for i, crop_id in enumerate(self.crop_ids):
+                if crop_id != EMPTY:
+                    planted[i] -= bonus_times[crop_id]
+        self._emit(["bonus", bonus_percent])
+        return "Sunny day bonus! Crops grow faster today."
+
+    def export_columns(self) -> Tuple[list[Crop], array, array, array]:
+        if np is None:
+            occupied = [
+                i for i, crop_id in enumerate(self.crop_ids) if crop_id != EMPTY
+            ]
+            return (
+                list(self.crop_table),
+                array("I", occupied),
+                array("H", [self.crop_ids[i] for i in occupied]),
+                array("q", [round(self.planted_at[i] * 1000) for i in occupied]),
+            )
+
+        ids = np.frombuffer(self.crop_ids, dtype=np.int16)
+        planted_at = np.frombuffer(self.planted_at, dtype=np.float64)
+        occupied = np.flatnonzero(ids != EMPTY)
+        indices = array("I", occupied.astype(np.uint32).tobytes())
+        crop_ids = array("H", ids[occupied].astype(np.uint16).tobytes())
+        planted_ms = array(
+            "q", np.round(planted_at[occupied] * 1000).astype(np.int64).tobytes()
+        )
+        return list(self.crop_table), indices, crop_ids, planted_ms
+
+    @classmethod
+    def from_columns(
+        cls,
+        size: int,
+        crops: list[Crop],
+        indices: array,
+        crop_ids: array,
+        planted_ms: array,
+        clock: Optional[GameClock] = None,
+    ) -> "ArrayFarmSystem":
+        farm = cls(size=size, clock=clock)
+        for crop in crops:
+            farm.intern_crop(crop)
+
+        if np is not None:
+            rows = np.frombuffer(indices, dtype=np.uint32)
+            np.frombuffer(farm.crop_ids, dtype=np.int16)[rows] = np.frombuffer(
+                crop_ids, dtype=np.uint16
+            )
+            np.frombuffer(farm.planted_at, dtype=np.float64)[rows] = (
+                np.frombuffer(planted_ms, dtype=np.int64) / 1000
+            )
+            return farm
+
+        for i, crop_id, planted in zip(indices, crop_ids, planted_ms):
+            farm.crop_ids[i] = crop_id
+            farm.planted_at[i] = planted / 1000
+        return farm
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"plots": [plot.to_dict() for plot in self.plots]}
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], clock: Optional[GameClock] = None
+    ) -> "ArrayFarmSystem":
+        farm = cls(size=len(data["plots"]), clock=clock)
+        for i, plot_data in enumerate(data["plots"]):
+            plot = Plot.from_dict(plot_data)
+            if plot.crop is not None:
+                farm.set_plot(i, plot.crop, plot.planted_at)
+        return farm
@@ -0,0 +1,85 @@
+from typing import Any, Optional, Sequence
+from game.domain.collection import Collection, CollectionRule
+from game.interfaces.serializable import ISerializable
+from game.utils.constants import FishingConstants, GameStateConstants
+
+
+class CollectionSystem(ISerializable):
+    """Fossils dug up, fish species caught and crops grown, plus the
+    achievements they unlock.
+
+    Rules are indexed by collection and only the rules of the collection
+    that just grew are checked, so an unlock costs O(1) instead of a rescan.
+    Saves store each collection as a hex bitmask.
+    """
+
+    RULES = (
+        CollectionRule("first_fossil", "fossils", 1, "ACHIEVEMENT: First fossil!"),
+        CollectionRule(
+            "museum_curator", "fossils", None, "ACHIEVEMENT: The Farmdex is complete!"
+        ),
+        CollectionRule(
+            "angler", "fish", None, "ACHIEVEMENT: Caught every kind of fish!"
+        ),
+        CollectionRule(
+            "green_thumb", "crops", None, "ACHIEVEMENT: Grew every kind of crop!"
+        ),
+    )
+
+    def __init__(self, crop_names: Sequence[str]):
+        self.collections = {
+            "fossils": Collection(GameStateConstants.FOSSILS),
+            "fish": Collection(FishingConstants.FISHES),
+            "crops": Collection(crop_names),
+        }
+        self.rules: dict[str, list[CollectionRule]] = {}
+        for rule in self.RULES:
+            self.rules.setdefault(rule.collection, []).append(rule)
+        self.achievements: set[str] = set()
+        self.messages: list[str] = []
+
+    def __getitem__(self, name: str) -> Collection:
+        return self.collections[name]
+
+    def add(self, collection_name: str, name: str) -> bool:
+        collection = self.collections[collection_name]
+        if not collection.add(name):
+            return False
+
+        for rule in self.rules.get(collection_name, ()):
+            threshold = len(collection) if rule.threshold is None else rule.threshold
+            if collection.count == threshold and rule.name not in self.achievements:
+                self.achievements.add(rule.name)
+                self.messages.append(rule.message)
+        return True
+
+    def drain_messages(self) -> list[str]:
+        messages, self.messages = self.messages, []
+        return messages
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            name: format(collection.bits, "x")
+            for name, collection in self.collections.items()
+        }
+        data["achievements"] = sorted(self.achievements)
+        return data
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        crop_names: Sequence[str],
+        fossils_found: Optional[Sequence[str]] = None,
+    ) -> "CollectionSystem":
+        """`fossils_found` migrates saves from before collections existed."""
+        system = cls(crop_names)
+        for name, collection in system.collections.items():
+            if name in data:
+                system.collections[name] = Collection(
+                    collection.names, int(data[name], 16)
+                )
+        for fossil in fossils_found or ():
+            system.collections["fossils"].add(fossil)
+        system.achievements = set(data.get("achievements", []))
+        return system
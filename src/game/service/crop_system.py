@@ -1,9 +1,12 @@
 from typing import Optional, Any, List
-from domain.crop import Crop
-from interfaces.serializable import ISerializable
+from game.domain.crop import Crop
+from game.interfaces.serializable import ISerializable
+from game.utils.tracking import Tracked
 
 
-class CropSystem(ISerializable):
+class CropSystem(Tracked, ISerializable):
+    TRACKED = frozenset(("unlocked_crops",))
+
     def __init__(self):
         self.available_crops = self._load_default_crops()
         self.unlocked_crops = ["wheat"]
@@ -27,6 +30,7 @@ class CropSystem(ISerializable):
             return None
 
         self.unlocked_crops.append(name)
+        self.touch("unlocked_crops")
         return f"NEW CROP UNLOCKED: {name.capitalize()}!"
 
     def get_unlocked_crops(self) -> List[Crop]:
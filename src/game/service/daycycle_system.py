@@ -1,16 +1,20 @@
-from datetime import datetime
-from typing import Any
-from interfaces.serializable import ISerializable
-from service.time_system import TimeSystem
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from game.interfaces.serializable import ISerializable
+from game.service.time_system import TimeSystem
+from game.utils.clock import DEFAULT_CLOCK, GameClock
+from game.utils.tracking import Tracked
 
 
-class DayCycleSystem(ISerializable):
+class DayCycleSystem(Tracked, ISerializable):
+    TRACKED = frozenset(("current_part_index", "last_update_time"))
     PARTS = ["morning", "afternoon", "evening", "night"]
 
-    def __init__(self, time_system: TimeSystem):
+    def __init__(self, time_system: TimeSystem, clock: Optional[GameClock] = None):
         self.time_system = time_system
+        self.clock = clock or DEFAULT_CLOCK
         self.current_part_index = 0
-        self.last_update_time = datetime.now()
+        self.last_update_time = self.clock.now()
         self.durations = self.get_durations_for_current_season()
 
     def get_season(self) -> str:
@@ -28,7 +32,7 @@ class DayCycleSystem(ISerializable):
             return {"morning": 3, "afternoon": 3, "evening": 3, "night": 3}
 
     def update(self):
-        now = datetime.now()
+        now = self.clock.now()
         current_part = self.PARTS[self.current_part_index]
         duration_minutes = self.durations[current_part]
 
@@ -39,6 +43,39 @@ class DayCycleSystem(ISerializable):
             return f"Part of the day changed: {self.get_current_part().capitalize()}!"
         return None
 
+    def skip_part(self):
+        """Move to the next part right away, it then lasts its full length."""
+        self.current_part_index = (self.current_part_index + 1) % len(self.PARTS)
+        self.last_update_time = self.clock.now()
+
+    def next_change_at(self) -> float:
+        """Epoch seconds at which update() will move to the next part."""
+        duration = self.durations[self.get_current_part()] * 60
+        return self.last_update_time.timestamp() + duration
+
+    def catch_up(self, now: Optional[datetime] = None) -> int:
+        """Apply every part-of-day change since last_update_time at once and
+        return how many happened. Whole cycles are divided out, so this costs
+        the same after a minute or a year away."""
+        now = now or self.clock.now()
+        elapsed = (now - self.last_update_time).total_seconds()
+        if elapsed <= 0:
+            return 0
+
+        durations = [self.durations[part] * 60 for part in self.PARTS]
+        cycles, elapsed = divmod(elapsed, sum(durations))
+        consumed = cycles * sum(durations)
+        passed = int(cycles) * len(self.PARTS)
+        while elapsed >= durations[self.current_part_index]:
+            elapsed -= durations[self.current_part_index]
+            consumed += durations[self.current_part_index]
+            self.current_part_index = (self.current_part_index + 1) % len(self.PARTS)
+            passed += 1
+
+        # Keep the phase: the current part started at a boundary, not at `now`.
+        self.last_update_time += timedelta(seconds=consumed)
+        return passed
+
     def get_current_part(self) -> str:
         return self.PARTS[self.current_part_index]
 
@@ -52,8 +89,13 @@ class DayCycleSystem(ISerializable):
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]):
-        instance = cls(TimeSystem())
+    def from_dict(
+        cls,
+        data: dict[str, Any],
+        time_system: Optional[TimeSystem] = None,
+        clock: Optional[GameClock] = None,
+    ):
+        instance = cls(time_system or TimeSystem(), clock)
         instance.current_part_index = data["current_part_index"]
         instance.last_update_time = datetime.fromisoformat(data["last_update_time"])
         return instance
@@ -1,46 +1,133 @@
 import random
-from interfaces.game_system import IGameSystem
-from service.farm_system import FarmSystem
-from domain.player import Player
-from domain.fish import Fish
-from utils.constants import EventConstants, FishingConstants
+from collections import deque
+from typing import Any, Optional, Tuple
+from game.interfaces.game_system import IGameSystem
+from game.service.farm_system import FarmSystem
+from game.domain.event import EventDefinition
+from game.domain.player import Player
+from game.domain.fish import Fish
+from game.utils.alias import AliasTable
+from game.utils.constants import EventConstants, FishingConstants
 
 
 class EventSystem(IGameSystem):
-    BASE_CHANCE_TO_EVENT = 0.4
+    """Rolls at most one random event per day from the EVENTS table.
+
+    Picks use alias tables, so a roll costs O(1) however many events exist.
+    An event whose condition fails is redrawn from a table over the events
+    that are possible right now. That gives the same odds as weighting only
+    the possible events, and the tables are cached per set of possible events
+    until a weight changes.
+    """
 
-    def __init__(self, farm: FarmSystem, player: Player):
+    BASE_CHANCE_TO_EVENT = 0.4
+    LUCKY_EGG_CHANCE_TO_EVENT = 0.8
+
+    def __init__(
+        self,
+        farm: FarmSystem,
+        player: Player,
+        rng: Optional[random.Random] = None,
+        rolls: Optional[random.Random] = None,
+    ):
         self.farm = farm
         self.player = player
+        self.rng = rng or random.Random()
+        # Each day's roll comes from its own stream, two draws a day, so days
+        # rolled ahead by queue_days() and days rolled one at a time leave
+        # `rng` (redraws and the events' own draws) in the same place.
+        self.rolls = rolls or self.rng
         self.last_event_day = -1
+        self.events = [
+            EventDefinition(event.name, event.weight, event.effect, event.condition)
+            for event in self.EVENTS
+        ]
+        self._tables: dict[Tuple[int, ...], Tuple[AliasTable, Tuple[int, ...]]] = {}
+        self._queued: deque[Tuple[float, int]] = deque()
+
+    @property
+    def chance(self) -> float:
+        if getattr(self.player, "event_bonus", None) == "lucky_egg":
+            return self.LUCKY_EGG_CHANCE_TO_EVENT
+        return self.BASE_CHANCE_TO_EVENT
+
+    def set_weight(self, name: str, weight: float):
+        for event in self.events:
+            if event.name == name:
+                event.weight = weight
+                self._tables.clear()
+                self._queued.clear()
+                return
+        raise KeyError(name)
+
+    def _table(self, candidates: Tuple[int, ...]) -> Tuple[AliasTable, Tuple[int, ...]]:
+        entry = self._tables.get(candidates)
+        if entry is None:
+            table = AliasTable([self.events[i].weight for i in candidates])
+            entry = self._tables[candidates] = (table, candidates)
+        return entry
+
+    def roll_days(self, days: int) -> list[Tuple[float, int]]:
+        """Pre-roll `days` days as (chance draw, event index) pairs.
+
+        Whether an event fires is decided when the day is played, against the
+        chance at that moment, so buying the lucky egg mid-batch still counts.
+        """
+        table, candidates = self._table(tuple(range(len(self.events))))
+        draw, sample = self.rolls.random, table.sample
+        return [(draw(), candidates[sample(draw())]) for _ in range(days)]
+
+    def queue_days(self, days: int):
+        """Roll the next `days` days in one batch, `update` consumes them."""
+        self._queued.extend(self.roll_days(days))
+
+    def to_dict(self) -> dict[str, Any]:
+        # The stream has moved past queued rolls, so they are saved with it.
+        return {"queued": [list(day) for day in self._queued]}
+
+    def load_queue(self, data: dict[str, Any]):
+        self._queued = deque((draw, index) for draw, index in data.get("queued", []))
 
     def update(self, current_day: int):
-        if (
-            random.random() >= self.BASE_CHANCE_TO_EVENT
-            or self.last_event_day == current_day
-        ):
+        if not self._queued:
+            self.queue_days(1)
+        chance_draw, index = self._queued.popleft()
+
+        if chance_draw >= self.chance or self.last_event_day == current_day:
             return None
 
         self.last_event_day = current_day
-        event = random.choice(
-            [
-                self._storm_event,
-                self._sunny_bonus_event,
-                self._found_money_event,
-                self._found_energy_event,
-                self._fish_rain_event,
-                self._plague_event,
-                self._spirit_farmer_event,
-                self._lazy_day_event,
-                self._starry_night_event,
-                self._inflated_market_event,
-                self._night_robbery_event,
-                self._perfect_fishing_day_event,
-                self._rich_farmer_patron_event,
-                self._sugar_daddy_marriage_event,
-            ]
+        return self.trigger(index)
+
+    def trigger(self, index: int) -> Optional[str]:
+        event = self.events[index]
+        if not event.is_possible(self):
+            possible = tuple(
+                i for i, event in enumerate(self.events) if event.is_possible(self)
+            )
+            if not possible:
+                return None
+            table, candidates = self._table(possible)
+            event = self.events[candidates[table.sample(self.rng.random())]]
+        return event.effect(self)
+
+    def _has_crops(self) -> bool:
+        return bool(self.farm.ready_count()) or self.farm.next_ready_at() is not None
+
+    def _can_fish(self) -> bool:
+        return hasattr(self, "game") and self.game.fishing_unlocked
+
+    def _ghost_locked(self) -> bool:
+        return (
+            hasattr(self, "game")
+            and "lazy_ghost" not in self.game.crop_system.unlocked_crops
         )
-        return event()
+
+    def _can_get_lazy(self) -> bool:
+        return self.player.max_stamina > 1
+
+    def _has_money(self) -> bool:
+        return self.player.money > 0
 
     def _rich_farmer_patron_event(self):
         amount = 500
@@ -59,7 +146,7 @@ class EventSystem(IGameSystem):
         return self.farm.apply_growth_bonus(20)
 
     def _found_money_event(self):
-        amount = random.randint(10, 50)
+        amount = self.rng.randint(10, 50)
         self.player.earn_money(amount)
         return f"You found money on the ground! (+${amount})"
 
@@ -68,12 +155,10 @@ class EventSystem(IGameSystem):
         return "You found an energy drink! (+1 heart)"
 
     def _fish_rain_event(self):
-        if not hasattr(self, "game") or not hasattr(self.game, "fishing_system"):
-            return
-
         skyfish: Fish = FishingConstants.FISH_TYPES["skyfish"]
 
         self.game.fishing_system.caught_fish.append(skyfish)
+        self.game.collection_system.add("fish", "skyfish")
         return f"A mysterious rain dropped a {skyfish.name} into your bucket! (+${skyfish.price})"
 
     def _plague_event(self):
@@ -81,15 +166,10 @@ class EventSystem(IGameSystem):
             return "A mysterious plague destroyed some crops!"
 
     def _spirit_farmer_event(self):
-        if hasattr(self, "game") and hasattr(self.game, "crop_system"):
-            if "lazy_ghost" not in self.game.crop_system.unlocked_crops:
-                self.game.crop_system.unlocked_crops.append("lazy_ghost")
+        self.game.crop_system.unlock_crop("lazy_ghost")
         return "A benevolent spirit gifted you a Lazy Ghost Seed!"
 
     def _lazy_day_event(self):
-        if self.player.max_stamina <= 1:
-            return
-
         self.player.max_stamina -= EventConstants.DEBUFF_STAMINA_LAZY_DAY
         self.player.stamina = min(self.player.stamina, self.player.max_stamina)
 
@@ -115,3 +195,20 @@ class EventSystem(IGameSystem):
         if hasattr(self, "game"):
             self.game.fishing_bonus = True
         return "The fish are biting! (+50% fish value today!)"
+
+    EVENTS = (
+        EventDefinition("storm", 1.0, _storm_event, _has_crops),
+        EventDefinition("sunny_bonus", 1.0, _sunny_bonus_event, _has_crops),
+        EventDefinition("found_money", 1.0, _found_money_event),
+        EventDefinition("found_energy", 1.0, _found_energy_event),
+        EventDefinition("fish_rain", 1.0, _fish_rain_event, _can_fish),
+        EventDefinition("plague", 1.0, _plague_event, _has_crops),
+        EventDefinition("spirit_farmer", 1.0, _spirit_farmer_event, _ghost_locked),
+        EventDefinition("lazy_day", 1.0, _lazy_day_event, _can_get_lazy),
+        EventDefinition("starry_night", 1.0, _starry_night_event, _has_crops),
+        EventDefinition("inflated_market", 1.0, _inflated_market_event),
+        EventDefinition("night_robbery", 1.0, _night_robbery_event, _has_money),
+        EventDefinition("perfect_fishing_day", 1.0, _perfect_fishing_day_event),
+        EventDefinition("rich_farmer_patron", 1.0, _rich_farmer_patron_event),
+        EventDefinition("sugar_daddy_marriage", 1.0, _sugar_daddy_marriage_event),
+    )
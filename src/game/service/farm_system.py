@@ -1,26 +1,185 @@
-from datetime import timedelta
+from array import array
+from datetime import datetime, timedelta
+import heapq
 import random
-from typing import Optional, Tuple, Any
-from domain.crop import Crop
-from domain.plot import Plot
-from interfaces.serializable import ISerializable
+from typing import Optional, Tuple, Any, Callable
+from game.domain.crop import Crop
+from game.domain.plot import Plot
+from game.interfaces.serializable import ISerializable
+from game.utils.clock import DEFAULT_CLOCK, GameClock
+from game.utils.tracking import next_version
 
 
 class FarmSystem(ISerializable):
-    def __init__(self, size: int = 9):
-        self.plots = [Plot() for _ in range(size)]
+    """Plots plus an index of when each one becomes ready.
+
+    Growing plots sit in a min-heap of (ready timestamp, plot index,
+    generation). Changing a plot bumps its generation instead of searching the
+    heap, and stale entries are skipped when they reach the top. Entries whose
+    time has come move to the `_ready` set, so harvesting touches only the
+    ready plots and "how many are ready" / "when is the next one" need no scan.
+
+    Plots are tracked here rather than one by one: every operation passed to
+    the listener also stamps `version` and adds the plots it touched to
+    `dirty_plots`, where None means all of them.
+    """
+
+    def __init__(self, size: int = 9, clock: Optional[GameClock] = None):
+        self.clock = clock or DEFAULT_CLOCK
+        self.dirty_plots: Optional[set[int]] = None
+        self.plots = [Plot(clock=self.clock) for _ in range(size)]
+        self.rng = random.Random()
+        self.listener: Optional[Callable[[list[Any]], None]] = None
+
+    @property
+    def plots(self) -> list[Plot]:
+        return self._plots
+
+    @plots.setter
+    def plots(self, plots: list[Plot]):
+        self._plots = plots
+        self._rebuild_ready_index()
+        self._touch_all()
+
+    def _emit(self, op: list[Any]):
+        self._track(op)
+        if self.listener is not None:
+            self.listener(op)
+
+    def _track(self, op: list[Any]):
+        self.version = next_version()
+        if op[0] == "bonus":
+            self.dirty_plots = None
+        elif self.dirty_plots is not None:
+            if op[0] == "plant":
+                self.dirty_plots.add(op[1])
+            else:
+                self.dirty_plots.update(op[1])
+
+    def _touch_all(self):
+        self.version = next_version()
+        self.dirty_plots = None
+
+    def drain_plots(self) -> Optional[list[int]]:
+        """Indices of the plots changed since the last drain, None when any
+        plot may have changed."""
+        dirty, self.dirty_plots = self.dirty_plots, set()
+        return None if dirty is None else sorted(dirty)
+
+    @staticmethod
+    def _ready_time(plot: Plot) -> float:
+        return plot.planted_at.timestamp() + plot.crop.growth_time
+
+    def _rebuild_ready_index(self):
+        self._generation = [0] * len(self._plots)
+        self._ready: set[int] = set()
+        self._heap = [
+            (self._ready_time(plot), i, 0)
+            for i, plot in enumerate(self._plots)
+            if not plot.is_empty and plot.planted_at is not None
+        ]
+        heapq.heapify(self._heap)
+
+    def _index_plot(self, plot_index: int):
+        self._generation[plot_index] += 1
+        self._ready.discard(plot_index)
+        plot = self._plots[plot_index]
+        if not plot.is_empty and plot.planted_at is not None:
+            heapq.heappush(
+                self._heap,
+                (self._ready_time(plot), plot_index, self._generation[plot_index]),
+            )
+            # Replanting leaves stale entries behind; don't let them pile up.
+            if len(self._heap) > 2 * len(self._plots) + 64:
+                self._rebuild_ready_index()
+
+    def _replace_plot(self, plot_index: int, plot: Plot):
+        self._plots[plot_index] = plot
+        self._index_plot(plot_index)
+
+    def _collect_ready(self):
+        now = self.clock.time()
+        heap, generation = self._heap, self._generation
+        while heap and (heap[0][0] <= now or heap[0][2] != generation[heap[0][1]]):
+            _, plot_index, plot_generation = heapq.heappop(heap)
+            if plot_generation == generation[plot_index]:
+                self._ready.add(plot_index)
+
+    def _ready_times(self):
+        for plot in self._plots:
+            if not plot.is_empty:
+                yield plot.planted_at.timestamp() + plot.crop.growth_time
+
+    # With an explicit `now` these only look: collecting at a future `now`
+    # would let the next harvest take crops that are not ripe yet.
+    def ready_count(self, now: Optional[float] = None) -> int:
+        if now is not None:
+            return sum(1 for ready_at in self._ready_times() if ready_at <= now)
+        self._collect_ready()
+        return len(self._ready)
+
+    def next_ready_at(self, now: Optional[float] = None) -> Optional[float]:
+        """Epoch seconds at which the next growing crop becomes ready, or None
+        when nothing is still growing."""
+        if now is not None:
+            return min(
+                (ready_at for ready_at in self._ready_times() if ready_at > now),
+                default=None,
+            )
+        self._collect_ready()
+        return self._heap[0][0] if self._heap else None
 
     def plant_crop(self, plot_index: int, crop: Crop):
         if 0 <= plot_index < len(self.plots):
-            self.plots[plot_index].plant(crop)
+            plot = self.plots[plot_index]
+            plot.plant(crop)
+            self._index_plot(plot_index)
+            self._emit(["plant", plot_index, crop.name, plot.planted_at.timestamp()])
 
-    def harvest_ready_crops(self) -> int:
+    def empty_plots(self, plot_indices: Optional[list[int]] = None) -> list[int]:
+        """The empty plots among `plot_indices`, or on the whole farm."""
+        plots = self._plots
+        candidates = range(len(plots)) if plot_indices is None else plot_indices
+        return [i for i in candidates if plots[i].is_empty]
+
+    def plant_many(self, plot_indices: list[int], crop: Crop):
+        """Plant `crop` in every given plot at the same instant, recorded as
+        one operation."""
+        planted_at = self.clock.time()
+        self._plant_plots(plot_indices, crop, planted_at)
+        self._emit(["plant_many", list(plot_indices), crop.name, planted_at])
+
+    def _plant_plots(self, plot_indices: list[int], crop: Crop, planted_at: float):
+        when = datetime.fromtimestamp(planted_at)
+        for i in plot_indices:
+            self._replace_plot(i, Plot(crop, when, self.clock))
+
+    def _take_ready(self, harvested: list[int]) -> int:
         total = 0
-        for plot in self.plots:
-            if not plot.is_empty and plot.is_ready:
-                total += plot.harvest()
+        for i in harvested:
+            plot = self._plots[i]
+            total += plot.crop.value
+            plot.crop = None
+            plot.planted_at = None
+            self._generation[i] += 1
+        self._ready.difference_update(harvested)
+        self._emit(["clear", harvested])
         return total
 
+    def harvest_ready_crops(self) -> int:
+        self._collect_ready()
+        if not self._ready:
+            return 0
+        return self._take_ready(sorted(self._ready))
+
+    def harvest_plots(self, plot_indices: list[int]) -> int:
+        """Harvest the ready plots among `plot_indices`, returns their value."""
+        self._collect_ready()
+        harvested = sorted(self._ready.intersection(plot_indices))
+        if not harvested:
+            return 0
+        return self._take_ready(harvested)
+
     def get_plot_status(self, plot_index: int) -> Tuple[Optional[Crop], float]:
         if plot_index not in range(len(self.plots)):
             return None, 0.0
@@ -33,8 +192,9 @@ class FarmSystem(ISerializable):
         if not occupied_plots:
             return None
 
-        plot_idx = random.choice(occupied_plots)
-        self.plots[plot_idx] = Plot()
+        plot_idx = self.rng.choice(occupied_plots)
+        self._replace_plot(plot_idx, Plot(clock=self.clock))
+        self._emit(["clear", [plot_idx]])
         return "A storm came! Some crops were damaged."
 
     def apply_growth_bonus(self, bonus_percent: float):
@@ -42,13 +202,78 @@ class FarmSystem(ISerializable):
             if not plot.is_empty and plot.planted_at:
                 bonus_time = plot.crop.growth_time * (bonus_percent / 100)
                 plot.planted_at -= timedelta(seconds=bonus_time)
+        # Every ready time moved by a different amount, re-heapify once.
+        self._rebuild_ready_index()
+        self._emit(["bonus", bonus_percent])
         return "Sunny day bonus! Crops grow faster today."
 
+    def apply_op(self, op: list[Any], crops: dict[str, Crop]):
+        """Replay one operation recorded by the listener."""
+        kind = op[0]
+        if kind != "bonus":
+            self._track(op)
+        if kind == "plant":
+            _, plot_index, crop_name, planted_at = op
+            self._replace_plot(
+                plot_index,
+                Plot(crops[crop_name], datetime.fromtimestamp(planted_at), self.clock),
+            )
+        elif kind == "plant_many":
+            _, plot_indices, crop_name, planted_at = op
+            self._plant_plots(plot_indices, crops[crop_name], planted_at)
+        elif kind == "clear":
+            for plot_index in op[1]:
+                self._replace_plot(plot_index, Plot(clock=self.clock))
+        elif kind == "bonus":
+            listener, self.listener = self.listener, None
+            self.apply_growth_bonus(op[1])
+            self.listener = listener
+
+    def export_columns(self) -> Tuple[list[Crop], array, array, array]:
+        """Occupied plots as (crop table, plot indices, crop ids, planted-at ms)."""
+        crops: list[Crop] = []
+        crop_index: dict[str, int] = {}
+        indices, crop_ids, planted_ms = array("I"), array("H"), array("q")
+        for i, plot in enumerate(self.plots):
+            if plot.is_empty:
+                continue
+            crop_id = crop_index.get(plot.crop.name)
+            if crop_id is None:
+                crop_id = crop_index[plot.crop.name] = len(crops)
+                crops.append(plot.crop)
+            indices.append(i)
+            crop_ids.append(crop_id)
+            planted_ms.append(round(plot.planted_at.timestamp() * 1000))
+        return crops, indices, crop_ids, planted_ms
+
+    @classmethod
+    def from_columns(
+        cls,
+        size: int,
+        crops: list[Crop],
+        indices: array,
+        crop_ids: array,
+        planted_ms: array,
+        clock: Optional[GameClock] = None,
+    ) -> "FarmSystem":
+        farm = cls(size=size, clock=clock)
+        plots = farm.plots
+        for i, crop_id, planted in zip(indices, crop_ids, planted_ms):
+            plots[i] = Plot(
+                crops[crop_id], datetime.fromtimestamp(planted / 1000), farm.clock
+            )
+        farm.plots = plots
+        return farm
+
     def to_dict(self) -> dict[str, Any]:
         return {"plots": [plot.to_dict() for plot in self.plots]}
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "FarmSystem":
-        farm = cls(size=len(data["plots"]))
-        farm.plots = [Plot.from_dict(plot_data) for plot_data in data["plots"]]
+    def from_dict(
+        cls, data: dict[str, Any], clock: Optional[GameClock] = None
+    ) -> "FarmSystem":
+        farm = cls(size=len(data["plots"]), clock=clock)
+        farm.plots = [
+            Plot.from_dict(plot_data, clock=farm.clock) for plot_data in data["plots"]
+        ]
         return farm
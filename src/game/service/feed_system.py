@@ -0,0 +1,195 @@
+import asyncio
+import heapq
+import json
+from typing import Any, Optional
+from game.service.game_state import GameState
+from game.service.server_system import GameSession
+
+# A subscriber this many events behind is dropped, EventSource reconnects
+# and starts over from a snapshot.
+MAX_BACKLOG = 64
+
+PlotView = Optional[tuple[str, float, bool]]
+
+
+def plot_view(plot) -> PlotView:
+    if plot.is_empty:
+        return None
+    return plot.crop.name, plot.planted_at.timestamp(), plot.is_ready
+
+
+def header_view(game: GameState) -> dict[str, Any]:
+    """Everything a live client draws except the plots."""
+    player = game.player
+    day_cycle = game.day_cycle_system
+    return {
+        "day": game.time_system.day,
+        "part": day_cycle.get_current_part(),
+        "season": day_cycle.get_season(),
+        "weather": game.weather_system.get_weather(),
+        "money": player.money,
+        "stamina": player.stamina,
+        "max_stamina": player.max_stamina,
+        "can_sleep_anytime": getattr(player, "can_sleep_anytime", False),
+        "fishing_unlocked": game.fishing_unlocked,
+        "unlocked_crops": list(game.crop_system.unlocked_crops),
+    }
+
+
+def encode_plot(plot: PlotView) -> Optional[dict[str, Any]]:
+    if plot is None:
+        return None
+    crop, planted_at, ready = plot
+    return {"crop": crop, "planted_at": planted_at, "ready": ready}
+
+
+def sse_event(event: str, data: dict[str, Any], event_id: int) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n".encode()
+
+
+class FarmFeed:
+    """Pushes what changed on one farm to every live subscriber.
+
+    The feed wakes after each command its GameSession runs and at the
+    game's next deadline (a part of the day ending, a crop coming ready),
+    never on a timer of its own. It takes the changed plots from
+    GameState.drain_changes(), and finds crops coming ready in its own heap
+    of ready times, so a delta costs the number of changed plots, not the
+    size of the farm. Each delta is encoded once and the same bytes go on
+    every subscriber's queue.
+    """
+
+    def __init__(self, session: GameSession):
+        self.session = session
+        self.game: GameState = session.game
+        self.subscribers: set[asyncio.Queue] = set()
+        self.header: dict[str, Any] = {}
+        self.plots: list[PlotView] = []
+        self.growing: list[tuple[float, int, float]] = []
+        self.version = self.game.version
+        self.command_version = self.game.version
+        self.messages: list[str] = []
+        self.event_id = 0
+        self.wake = asyncio.Event()
+        with self.game.clock.frame():
+            self.game.drain_changes()
+            self.header = header_view(self.game)
+            self._update_plots(None)
+        session.listeners.append(self.on_command)
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    def on_command(self, command: str, response: str):
+        # A command that changed the farm is news for everyone watching it.
+        if response.startswith("OK ") and self.game.version != self.command_version:
+            self.messages.append(response[3:])
+        self.command_version = self.game.version
+        self.wake.set()
+
+    async def _run(self):
+        while True:
+            timeout = self.game.scheduler.seconds_until_next()
+            try:
+                await asyncio.wait_for(self.wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+            self.publish()
+
+    def _view(self, plot_index: int, plot) -> PlotView:
+        view = plot_view(plot)
+        if view is not None and not view[2]:
+            ready_at = view[1] + plot.crop.growth_time
+            heapq.heappush(self.growing, (ready_at, plot_index, view[1]))
+        return view
+
+    def _update_plots(self, indices: Optional[list[int]]) -> dict[str, PlotView]:
+        """Refresh the given plots (None for all), returns the changed ones."""
+        plots = self.game.farm.plots
+        changed = {}
+        if indices is None:
+            old = self.plots
+            self.growing = []
+            self.plots = [self._view(i, plot) for i, plot in enumerate(plots)]
+            for i, view in enumerate(self.plots):
+                if i >= len(old) or old[i] != view:
+                    changed[str(i)] = view
+            return changed
+
+        for i in indices:
+            view = self._view(i, plots[i])
+            if self.plots[i] != view:
+                self.plots[i] = view
+                changed[str(i)] = view
+
+        now = self.game.clock.time()
+        growing = self.growing
+        while growing and growing[0][0] <= now:
+            _, i, planted_at = heapq.heappop(growing)
+            view = self.plots[i]
+            # Replanted or harvested since it was pushed.
+            if view is None or view[1] != planted_at or view[2]:
+                continue
+            self.plots[i] = view = (view[0], planted_at, True)
+            changed[str(i)] = view
+        return changed
+
+    def publish(self):
+        with self.game.clock.frame():
+            self.messages += self.game.tick()
+            messages, self.messages = self.messages, []
+            if self.game.version == self.version and not messages:
+                return
+            self.version = self.game.version
+
+            changes = self.game.drain_changes()
+            header = header_view(self.game)
+            plot_count = len(self.plots)
+            plots = self._update_plots(changes["plots"])
+
+        delta = {
+            key: value for key, value in header.items() if self.header[key] != value
+        }
+        self.header = header
+        if plots:
+            delta["plots"] = {i: encode_plot(view) for i, view in plots.items()}
+        if len(self.plots) != plot_count:
+            delta["size"] = len(self.plots)
+        if messages:
+            delta["messages"] = messages
+        if not delta:
+            return
+
+        delta["version"] = self.version
+        self.event_id += 1
+        self.broadcast(sse_event("delta", delta, self.event_id))
+
+    def broadcast(self, event: bytes):
+        for queue in list(self.subscribers):
+            if queue.qsize() >= MAX_BACKLOG:
+                self.subscribers.discard(queue)
+                queue.put_nowait(None)
+            else:
+                queue.put_nowait(event)
+
+    def subscribe(self) -> asyncio.Queue:
+        """A queue of encoded events, starting with a snapshot of the farm.
+        None on the queue means the subscriber was dropped."""
+        self.publish()
+        snapshot = dict(self.header)
+        snapshot["plots"] = [encode_plot(view) for view in self.plots]
+        snapshot["version"] = self.version
+        queue: asyncio.Queue = asyncio.Queue()
+        queue.put_nowait(sse_event("snapshot", snapshot, self.event_id))
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def close(self):
+        self.session.listeners.remove(self.on_command)
+        self.task.cancel()
+        for queue in self.subscribers:
+            queue.put_nowait(None)
+        self.subscribers.clear()
@@ -1,12 +1,14 @@
 import random
-from domain.player import Player
-from domain.fish import Fish
-from utils.constants import FishingConstants
+from typing import Optional
+from game.domain.player import Player
+from game.domain.fish import Fish
+from game.utils.constants import FishingConstants
 
 
 class FishingSystem:
-    def __init__(self, player: Player):
+    def __init__(self, player: Player, rng: Optional[random.Random] = None):
         self.player = player
+        self.rng = rng or random.Random()
         self.game = None
         self.caught_fish: list[Fish] = []
 
@@ -16,8 +18,11 @@ class FishingSystem:
 
         self.player.use_stamina(FishingConstants.STAMINA_TO_FISH)
 
-        fish: Fish = FishingConstants.FISH_TYPES[random.choice(FishingConstants.FISHES)]
+        fish_key = self.rng.choice(FishingConstants.FISHES)
+        fish: Fish = FishingConstants.FISH_TYPES[fish_key]
         self.caught_fish.append(fish)
+        if self.game is not None:
+            self.game.collection_system.add("fish", fish_key)
         return f"You caught a {fish.name} worth ${fish.price}!"
 
     def sell_all_fish(self) -> str:
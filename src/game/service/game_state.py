@@ -1,72 +1,409 @@
-import random
-import json
 import os
-from interfaces.serializable import ISerializable
-from domain.player import Player
-from service.farm_system import FarmSystem
-from service.crop_system import CropSystem
-from service.weather_system import WeatherSystem
-from service.time_system import TimeSystem
-from service.event_system import EventSystem
-from service.merchant_system import MerchantSystem
-from service.fishing_system import FishingSystem
-from service.daycycle_system import DayCycleSystem
-from typing import Optional, Any, Tuple
-from datetime import datetime
-from utils.constants import GameStateConstants, EventConstants
+import time
+from game.interfaces.serializable import ISerializable
+from game.domain.player import Player
+from game.service.farm_system import FarmSystem
+from game.service.crop_system import CropSystem
+from game.service.weather_system import WeatherSystem
+from game.service.time_system import TimeSystem
+from game.service.daycycle_system import DayCycleSystem
+from game.service.collection_system import CollectionSystem
+from game.service.save_codec import SAVE_CODECS
+from game.service.save_system import SaveJournal, write_atomic
+from game.service.scheduler_system import DeadlineScheduler
+from typing import TYPE_CHECKING, Optional, Any, Tuple
+from game.utils.constants import GameStateConstants, EventConstants
+from game.utils.clock import GameClock
+from game.utils.rng import RandomStreams, derive_seed
+from game.utils.tracking import next_version
+
+if TYPE_CHECKING:
+    from game.service.event_system import EventSystem
+    from game.service.fishing_system import FishingSystem
+    from game.service.merchant_system import MerchantSystem
+
+
+class DayAdvanceResult:
+    def __init__(self, game: "GameState"):
+        self.start_day = self.end_day = game.time_system.day
+        self.start_money = self.end_money = game.player.money
+        self.messages: list[Tuple[int, str]] = []
+        self.unlocked_crops: list[str] = []
+        self.fossils_found: list[str] = []
+        self._crops_before = list(game.crop_system.unlocked_crops)
+        self._fossils_before = game.collection_system["fossils"].bits
+
+    @property
+    def days(self) -> int:
+        return self.end_day - self.start_day
+
+    @property
+    def money_delta(self) -> int:
+        return self.end_money - self.start_money
+
+    def finish(self, game: "GameState") -> "DayAdvanceResult":
+        self.end_day = game.time_system.day
+        self.end_money = game.player.money
+        self.unlocked_crops = [
+            crop
+            for crop in game.crop_system.unlocked_crops
+            if crop not in self._crops_before
+        ]
+        fossils = game.collection_system["fossils"]
+        new_bits = fossils.bits & ~self._fossils_before
+        self.fossils_found = [
+            name for i, name in enumerate(fossils.names) if new_bits >> i & 1
+        ]
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start_day": self.start_day,
+            "end_day": self.end_day,
+            "money_delta": self.money_delta,
+            "messages": self.messages,
+            "unlocked_crops": self.unlocked_crops,
+            "fossils_found": self.fossils_found,
+        }
+
+
+class OfflineProgress:
+    def __init__(
+        self,
+        away_seconds: float,
+        day_parts_passed: int,
+        current_part: str,
+        crops_matured: int,
+        stamina_restored: float,
+    ):
+        self.away_seconds = away_seconds
+        self.day_parts_passed = day_parts_passed
+        self.current_part = current_part
+        self.crops_matured = crops_matured
+        self.stamina_restored = stamina_restored
+
+    def summary(self) -> str:
+        hours, rest = divmod(int(self.away_seconds), 3600)
+        return (
+            f"You were away for {hours}h {rest // 60}m: "
+            f"{self.day_parts_passed} parts of the day went by, it is now "
+            f"{self.current_part}. {self.crops_matured} crops matured and you "
+            f"recovered {self.stamina_restored:g} hearts."
+        )
 
 
 class GameState(ISerializable):
     SAVE_FILE = "terminal_farmer_save.json"
+    # Sections of _state_to_dict() whose objects track their own changes.
+    TRACKED_SECTIONS = (
+        "player",
+        "crop_system",
+        "weather_system",
+        "time_system",
+        "day_cycle_system",
+    )
 
-    def __init__(self):
-        self.player = Player()
-        self.farm = FarmSystem()
+    def __init__(
+        self,
+        farm: Optional[FarmSystem] = None,
+        clock: Optional[GameClock] = None,
+        save_format: str = "json",
+        save_file: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        self.save_format = save_format
+        self.codec = SAVE_CODECS[save_format]
+        self.save_file = os.path.splitext(save_file or self.SAVE_FILE)[0] + (
+            self.codec.EXTENSION
+        )
+        self.clock = clock or (farm.clock if farm else GameClock())
+        self.rng = RandomStreams(seed)
+        self.player = Player(last_sleep_time=self.clock.now())
+        self.farm = farm or FarmSystem(clock=self.clock)
         self.farm.game = self
+        self.farm.rng = self.rng["farm"]
         self.crop_system = CropSystem()
-        self.weather_system = WeatherSystem()
+        self.weather_system = WeatherSystem(self.rng["weather"])
         self.time_system = TimeSystem()
-        self.event_system = EventSystem(self.farm, self.player)
-        self.event_system.game = self
-        self.day_cycle_system = DayCycleSystem(self.time_system)
-        self.merchant_system = MerchantSystem(self.crop_system, self.player)
-        self.fishing_system = FishingSystem(self.player)
-        self.fishing_system.game = self
+        self.day_cycle_system = DayCycleSystem(self.time_system, self.clock)
+        self._reset_lazy_systems()
+        self.collection_system = CollectionSystem(
+            list(self.crop_system.available_crops)
+        )
         self.lazy_day_active = False
+        self.market_inflated = False
+        self.fishing_bonus = False
+        self.saved_at: Optional[float] = None
+        # Wall clock time of the save, the game's clock resumes from both.
+        self.saved_wall_time: Optional[float] = None
+        self.offline_progress: Optional[OfflineProgress] = None
+        self.scheduler = DeadlineScheduler(self.clock)
+        self.journal: Optional[SaveJournal] = None
+        self._journal_seq = 0
+        # Versions of the tracked sections in the last journal record.
+        self._journaled: dict[str, int] = {}
+        # For changes outside the tracked objects (fishing, the merchant,
+        # collections), bumped by _record() and tick().
+        self._version = next_version()
+
+    def _reset_lazy_systems(self, fishing_unlocked: bool = False):
+        # Events, the merchant and fishing are built (and their modules
+        # imported) on first use, which keeps startup and one-shot commands
+        # cheap. Loading a save throws them away so they rebind to the new
+        # player, farm and random streams.
+        self._event_system: Optional["EventSystem"] = None
+        self._merchant_system: Optional["MerchantSystem"] = None
+        self._fishing_system: Optional["FishingSystem"] = None
+        self._fishing_unlocked = fishing_unlocked
+
+    @property
+    def event_system(self) -> "EventSystem":
+        if self._event_system is None:
+            from game.service.event_system import EventSystem
+
+            self._event_system = EventSystem(
+                self.farm, self.player, self.rng["events"], self.rng["event_rolls"]
+            )
+            self._event_system.game = self
+        return self._event_system
+
+    @property
+    def merchant_system(self) -> "MerchantSystem":
+        if self._merchant_system is None:
+            from game.service.merchant_system import MerchantSystem
+
+            self._merchant_system = MerchantSystem(self.crop_system, self.player)
+            self._merchant_system.game = self
+            self._merchant_system.fishing_unlocked = self._fishing_unlocked
+        return self._merchant_system
+
+    @property
+    def fishing_system(self) -> "FishingSystem":
+        if self._fishing_system is None:
+            from game.service.fishing_system import FishingSystem
+
+            self._fishing_system = FishingSystem(self.player, self.rng["fishing"])
+            self._fishing_system.game = self
+        return self._fishing_system
+
+    @property
+    def fishing_unlocked(self) -> bool:
+        """Answered without building the merchant."""
+        if self._merchant_system is None:
+            return self._fishing_unlocked
+        return self._merchant_system.fishing_unlocked
+
+    @property
+    def merchant_available(self) -> bool:
+        """Answered without building the merchant."""
+        return (
+            self.day_cycle_system.get_current_part() == GameStateConstants.MERCHANT_PART
+        )
 
     def next_day(self) -> Tuple[bool, Optional[str]]:
         """Advance to next day, returns (success, event_message)"""
+        success, message = self.__advance_day()
+        if success:
+            self._record("next_day")
+        return success, message
+
+    def __advance_day(self) -> Tuple[bool, Optional[str]]:
         if not self.player.has_stamina(1.0):
             return False, None
 
         self.player.use_stamina(1.0)
-        self.time_system.update()
         self.weather_system.update()
-        self.day_cycle_system = DayCycleSystem(self.time_system)
-        self.__unlock_fossil()
+        unlock_message, _, event_message = self.__pass_night()
+        self.day_cycle_system = DayCycleSystem(self.time_system, self.clock)
+        return True, unlock_message or event_message
 
+    def __pass_night(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Move to the next day, returns (unlock, fossil, event) messages"""
+        self.time_system.update()
+        fossil_message = self.__unlock_fossil()
         unlock_message = self.__unlock_seed_roadmap()
-
         self.__reset_day_bonus()
-
         event_message = self.event_system.update(self.time_system.day)
+        return unlock_message, fossil_message, event_message
 
-        return True, unlock_message or event_message
+    def advance_days(self, days: int) -> DayAdvanceResult:
+        """Let `days` days go by in one call, for idle catch-up and long
+        simulations. No stamina is spent. Weather is advanced in one batch,
+        events are pre-rolled together and the day cycle is rebuilt once at
+        the end; every message is collected in the result."""
+        result = DayAdvanceResult(self)
+        if days <= 0:
+            return result
+
+        self.event_system.queue_days(days)
+        messages = result.messages
+        for _ in range(days):
+            for message in self.__pass_night():
+                if message:
+                    messages.append((self.time_system.day, message))
+        self.weather_system.advance(days)
+        self.day_cycle_system = DayCycleSystem(self.time_system, self.clock)
+        self._record("advance_days")
+        return result.finish(self)
+
+    def tick(self) -> list[str]:
+        """Fire every deadline that has passed and arm the next ones.
+
+        Time-driven state (parts of the day, crops coming ready) only changes
+        here, so a UI or server loop can sleep for
+        scheduler.seconds_until_next() instead of polling.
+        """
+        fired = self.scheduler.fired
+        messages = self.scheduler.run_due() + self.collection_system.drain_messages()
+        if self.scheduler.fired != fired:
+            self._version = next_version()
+        self.scheduler.schedule(
+            "day_part", self.day_cycle_system.next_change_at(), self.__on_day_part
+        )
+        ready_at = self.farm.next_ready_at()
+        if ready_at is None:
+            self.scheduler.cancel("crops_ready")
+        else:
+            self.scheduler.schedule("crops_ready", ready_at, self.__on_crops_ready)
+        return messages
+
+    def __on_day_part(self) -> Optional[str]:
+        return self.day_cycle_system.update()
+
+    def __on_crops_ready(self) -> str:
+        return f"Crops ready to harvest: {self.farm.ready_count()}"
+
+    def can_work(self) -> bool:
+        return not self.day_cycle_system.is_night() or getattr(
+            self.player, "has_lantern", False
+        )
+
+    def can_sleep(self) -> bool:
+        return self.day_cycle_system.is_night() or getattr(
+            self.player, "can_sleep_anytime", False
+        )
+
+    def plant(self, plot_index: int, crop_name: str) -> Tuple[bool, str]:
+        """Plant an unlocked crop, returns (success, message)"""
+        crop = self.crop_system.get_crop(crop_name)
+        if crop is None or crop_name not in self.crop_system.unlocked_crops:
+            return False, "Invalid choice!"
+
+        if not self.player.has_stamina(crop.stamina_cost):
+            return False, "Not enough stamina!"
 
-    def __unlock_fossil(self) -> None:
+        if not self.player.can_afford(crop.cost):
+            return False, "Not enough money!"
+
+        if (
+            plot_index not in range(len(self.farm.plots))
+            or not self.farm.plots[plot_index].is_empty
+        ):
+            return False, "Invalid or occupied plot!"
+
+        self.player.spend_money(crop.cost)
+        self.player.use_stamina(crop.stamina_cost)
+        self.farm.plant_crop(plot_index, crop)
+        self.collection_system.add("crops", crop_name)
+        self._record("plant")
+        return True, f"Planted {crop.name} in plot {plot_index + 1}!"
+
+    def plant_many(
+        self, crop_name: str, plot_indices: Optional[list[int]] = None
+    ) -> Tuple[bool, str]:
+        """Plant an unlocked crop in every empty plot of the selection (None
+        for the whole farm), returns (success, message). Either every plot is
+        planted, paid for at once, or none is."""
+        crop = self.crop_system.get_crop(crop_name)
+        if crop is None or crop_name not in self.crop_system.unlocked_crops:
+            return False, "Invalid choice!"
+
+        if plot_indices is not None and not self._valid_selection(plot_indices):
+            return False, "Invalid plot!"
+
+        targets = self.farm.empty_plots(plot_indices)
+        if not targets:
+            return False, "No empty plots there!"
+
+        count = len(targets)
+        plots = f"{count} plot{'s' if count > 1 else ''}"
+        if not self.player.has_stamina(crop.stamina_cost * count):
+            return False, f"Not enough stamina for {plots}!"
+
+        if not self.player.can_afford(crop.cost * count):
+            return False, f"Not enough money for {plots}!"
+
+        self.player.spend_money(crop.cost * count)
+        self.player.use_stamina(crop.stamina_cost * count)
+        self.farm.plant_many(targets, crop)
+        self.collection_system.add("crops", crop_name)
+        self._record("plant_many")
+        return True, f"Planted {crop.name} in {plots}!"
+
+    def _valid_selection(self, plot_indices: list[int]) -> bool:
+        size = len(self.farm.plots)
+        return len(set(plot_indices)) == len(plot_indices) and all(
+            i in range(size) for i in plot_indices
+        )
+
+    def harvest(self, plot_indices: Optional[list[int]] = None) -> Tuple[bool, int]:
+        """Harvest the ready plots of the selection (None for every plot),
+        returns (had_stamina, harvested_value)"""
+        if plot_indices is not None and not self._valid_selection(plot_indices):
+            raise ValueError("plots must be on the farm and selected once")
+        if not self.player.has_stamina(0.5):
+            return False, 0
+
+        if plot_indices is None:
+            harvested_value = self.farm.harvest_ready_crops()
+        else:
+            harvested_value = self.farm.harvest_plots(plot_indices)
+        if harvested_value > 0:
+            self.player.earn_money(harvested_value)
+            self.player.use_stamina(0.5)
+            self._record("harvest")
+        return True, harvested_value
+
+    def sleep(self) -> Optional[str]:
+        """Sleep until the next day and fully restore stamina, returns event_message"""
+        _, message = self.__advance_day()
+        self.player.full_restore()
+        self.player.last_sleep_time = self.clock.now()
+        self._record("sleep")
+        return message
+
+    def nap(self) -> None:
+        self.player.restore_stamina(1)
+        self.day_cycle_system.skip_part()
+        self._record("nap")
+
+    def buy_seed(self, seed_key: str) -> Optional[str]:
+        message = self.merchant_system.buy_seed(seed_key)
+        self._record("buy_seed")
+        return message
+
+    def buy_item(self, item_key: str) -> Optional[str]:
+        message = self.merchant_system.buy_item(item_key)
+        self._record("buy_item")
+        return message
+
+    def fish(self) -> str:
+        message = self.fishing_system.fish()
+        self._record("fish")
+        return message
+
+    def sell_fish(self) -> str:
+        message = self.fishing_system.sell_all_fish()
+        self._record("sell_fish")
+        return message
+
+    def __unlock_fossil(self) -> Optional[str]:
         if self.player.has_farmdex and self.time_system.day % 2 == 0:
-            if random.random() < 0.75 and len(self.player.fossils_found) < len(
-                GameStateConstants.FOSSILS
-            ):
-                undiscovered = [
-                    f
-                    for f in GameStateConstants.FOSSILS
-                    if f not in self.player.fossils_found
-                ]
-                if undiscovered:
-                    found = random.choice(undiscovered)
-                    self.player.fossils_found.append(found)
-                    return True, f"NEW FOSSIL DISCOVERED: {found}!"
+            fossils = self.collection_system["fossils"]
+            if self.rng["fossils"].random() < 0.75 and not fossils.complete:
+                found = fossils.draw_missing(self.rng["fossils"])
+                self.collection_system.add("fossils", found)
+                return f"NEW FOSSIL DISCOVERED: {found}!"
 
     def __unlock_seed_roadmap(self) -> str:
         crop = GameStateConstants.UNLOCK_SEED_ROADMAP_DAYS.get(self.time_system.day)
@@ -77,73 +414,218 @@ class GameState(ISerializable):
     def __reset_day_bonus(self) -> None:
         self.market_inflated = False
         self.fishing_bonus = False
-        self.lazy_day_active = False
 
         if self.lazy_day_active:
+            self.lazy_day_active = False
             self.player.max_stamina += EventConstants.DEBUFF_STAMINA_LAZY_DAY
             if self.player.stamina > self.player.max_stamina:
                 self.player.stamina = self.player.max_stamina
 
+    def enable_journal(self):
+        """Record every action to the save journal from now on."""
+        self.journal = SaveJournal(self.save_file, self.codec, self._journal_seq)
+        self.farm.listener = self.journal.farm_op
+        self.save()
+
+    @property
+    def version(self) -> int:
+        """Grows whenever anything a save or a client could see changes."""
+        return max(
+            self._version,
+            self.farm.version,
+            *(getattr(self, section).version for section in self.TRACKED_SECTIONS),
+        )
+
+    def drain_changes(self) -> dict[str, Any]:
+        """What changed since the last drain: {section: {attribute: value}}
+        for the tracked sections, plus "plots", the changed plot indices or
+        None for all of them. Meant for a single consumer, such as a feed."""
+        changes: dict[str, Any] = {}
+        for section in self.TRACKED_SECTIONS:
+            dirty = getattr(self, section).drain()
+            if dirty:
+                changes[section] = dirty
+        changes["plots"] = self.farm.drain_plots()
+        return changes
+
+    def _journal_state(self) -> dict[str, Any]:
+        """_state_to_dict() without the tracked sections that are unchanged
+        since the last record or snapshot."""
+        state = self._state_to_dict()
+        for section in self.TRACKED_SECTIONS:
+            version = getattr(self, section).version
+            if self._journaled.get(section) == version:
+                del state[section]
+            else:
+                self._journaled[section] = version
+        return state
+
+    def _record(self, action: str):
+        self._version = next_version()
+        if self.journal is None:
+            return
+
+        self.journal.append(action, self._journal_state())
+        if self.journal.needs_compaction:
+            self.save()
+
     def save(self) -> bool:
         try:
-            with open(self.SAVE_FILE, "w") as f:
-                json.dump(self.to_dict(), f)
+            if self.journal is not None:
+                self.journal.snapshot(self._state_to_dict(), self.farm)
+                self._journaled = {
+                    section: getattr(self, section).version
+                    for section in self.TRACKED_SECTIONS
+                }
+            else:
+                write_atomic(self.save_file, self.encode())
+                SaveJournal.discard(self.save_file)
             return True
         except Exception as e:
             print(f"Error saving game: {e}")
             return False
 
+    def encode(self) -> bytes:
+        """The game as save file bytes in the current codec."""
+        return self.codec.encode(self._state_to_dict(), self.farm)
+
     def load(self) -> bool:
         try:
-            if not os.path.exists(self.SAVE_FILE):
+            if not os.path.exists(self.save_file):
                 return False
 
-            with open(self.SAVE_FILE, "r") as f:
-                data = json.load(f)
-                self.from_dict(data, fallback=True)
-
-            time_passed = datetime.now() - self.player.last_sleep_time
-            hours_passed = time_passed.total_seconds() / 3600
-            stamina_to_restore = min(
-                int(hours_passed / 2), self.player.max_stamina - self.player.stamina
-            )
-            if stamina_to_restore > 0:
-                self.player.restore_stamina(stamina_to_restore)
+            with open(self.save_file, "rb") as f:
+                data, farm = self.codec.decode(f.read(), type(self.farm), self.clock)
+            self._install(data, farm, fallback=True)
+            self.replay(SaveJournal.read(self.save_file, self._journal_seq))
+            if self.saved_at is not None:
+                self.clock.resume(self.saved_at, self.saved_wall_time)
+            self.offline_progress = self.catch_up()
             return True
 
         except Exception as e:
             print(f"Error loading game: {e}")
             return False
 
+    def catch_up(self) -> OfflineProgress:
+        """Account for the time since the save was written, in O(1) for the
+        day cycle whatever the gap. Seasons follow the day counter, which
+        only moves when the player sleeps, so they don't change offline."""
+        now = self.clock.now()
+        saved_at = self.saved_at if self.saved_at is not None else now.timestamp()
+
+        ready_at_save = self.farm.ready_count(saved_at)
+        crops_matured = self.farm.ready_count(now.timestamp()) - ready_at_save
+        day_parts_passed = self.day_cycle_system.catch_up(now)
+
+        time_passed = now - self.player.last_sleep_time
+        hours_passed = time_passed.total_seconds() / 3600
+        stamina_to_restore = min(
+            int(hours_passed / 2), self.player.max_stamina - self.player.stamina
+        )
+        if stamina_to_restore > 0:
+            self.player.restore_stamina(stamina_to_restore)
+
+        return OfflineProgress(
+            max(0.0, now.timestamp() - saved_at),
+            day_parts_passed,
+            self.day_cycle_system.get_current_part(),
+            max(0, crops_matured),
+            max(0, stamina_to_restore),
+        )
+
     def new_game(self):
-        self.__init__()
+        journal = self.journal
+        self.__init__(
+            farm=type(self.farm)(size=len(self.farm.plots), clock=self.clock),
+            clock=self.clock,
+            save_format=self.save_format,
+            save_file=self.save_file,
+            seed=derive_seed(self.rng.seed, "new_game", self.time_system.day),
+        )
+        if journal is not None:
+            self.journal = journal
+            self.farm.listener = journal.farm_op
+            self.save()
+
+    def replay(self, records: list[dict[str, Any]]):
+        """Apply journal records written after the snapshot that was loaded."""
+        self._journal_seq = records[-1]["seq"] if records else self._journal_seq
+        if not records:
+            return
+
+        crops = {crop.name: crop for crop in self.crop_system.available_crops.values()}
+        for record in records:
+            for op in record["farm"]:
+                self.farm.apply_op(op, crops)
+
+        # Records only carry the tracked sections that changed, newest wins.
+        state = self._state_to_dict()
+        for record in records:
+            state.update(record["state"])
+        self._state_from_dict(state)
 
     def to_dict(self) -> dict[str, Any]:
+        data = self._state_to_dict()
+        data["farm"] = self.farm.to_dict()
+        return data
+
+    def _state_to_dict(self) -> dict[str, Any]:
         return {
             "player": self.player.to_dict(),
-            "farm": self.farm.to_dict(),
             "crop_system": self.crop_system.to_dict(),
             "weather_system": self.weather_system.to_dict(),
             "time_system": self.time_system.to_dict(),
             "day_cycle_system": self.day_cycle_system.to_dict(),
-            "merchant": {"fishing_unlocked": self.merchant_system.fishing_unlocked},
+            "merchant": {"fishing_unlocked": self.fishing_unlocked},
+            "events": (
+                self._event_system.to_dict()
+                if self._event_system is not None
+                else {"queued": []}
+            ),
+            "rng": self.rng.to_dict(),
+            "collections": self.collection_system.to_dict(),
+            "saved_at": self.clock.time(),
+            "saved_wall_time": time.time(),
         }
 
     def from_dict(self, data: dict[str, Any], fallback: bool = False):
-        self.player = Player.from_dict(data["player"])
-        self.farm = FarmSystem.from_dict(data["farm"])
+        farm = type(self.farm).from_dict(data["farm"], clock=self.clock)
+        self._install(data, farm, fallback)
+
+    def _install(self, data: dict[str, Any], farm: FarmSystem, fallback: bool):
+        self._journal_seq = data.get("journal_seq", 0)
+        self.farm = farm
         self.farm.game = self
+        if self.journal is not None:
+            self.farm.listener = self.journal.farm_op
+        self._state_from_dict(data, fallback)
+
+    def _state_from_dict(self, data: dict[str, Any], fallback: bool = False):
+        if "rng" in data:
+            self.rng = RandomStreams.from_dict(data["rng"])
+        self.farm.rng = self.rng["farm"]
+        self.saved_at = data.get("saved_at")
+        self.saved_wall_time = data.get("saved_wall_time")
+        self.player = Player.from_dict(data["player"])
         self.crop_system = CropSystem.from_dict(data["crop_system"])
-        self.weather_system = WeatherSystem.from_dict(data["weather_system"])
+        self.weather_system = WeatherSystem.from_dict(
+            data["weather_system"], self.rng["weather"]
+        )
         self.time_system = TimeSystem.from_dict(data["time_system"])
         if "day_cycle_system" in data:
-            self.day_cycle_system = DayCycleSystem.from_dict(data["day_cycle_system"])
+            self.day_cycle_system = DayCycleSystem.from_dict(
+                data["day_cycle_system"], self.time_system, self.clock
+            )
         elif fallback:
-            self.day_cycle_system = DayCycleSystem(self.time_system)
-        self.event_system = EventSystem(self.farm, self.player)
-        self.event_system.game = self
-        self.merchant_system = MerchantSystem(self.crop_system, self.player)
-        self.fishing_system = FishingSystem(self.player)
-        self.fishing_system.game = self
-        if "merchant" in data and data["merchant"].get("fishing_unlocked"):
-            self.merchant_system.fishing_unlocked = True
+            self.day_cycle_system = DayCycleSystem(self.time_system, self.clock)
+        self._reset_lazy_systems(
+            data.get("merchant", {}).get("fishing_unlocked", False)
+        )
+        if data.get("events", {}).get("queued"):
+            self.event_system.load_queue(data["events"])
+        self.collection_system = CollectionSystem.from_dict(
+            data.get("collections", {}),
+            list(self.crop_system.available_crops),
+            data["player"].get("fossils_found"),
+        )
@@ -0,0 +1,408 @@
+import asyncio
+import json
+import mimetypes
+import os
+import time
+from typing import Any, Awaitable, Callable, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+from game.service.crop_system import CropSystem
+from game.service.feed_system import FarmFeed
+from game.service.server_system import FARM_NAME, GameServer, GameSession
+
+KEEP_ALIVE_TIMEOUT = 60.0
+# Farms the API loaded are let go after this long without a request.
+SESSION_IDLE_TIMEOUT = 300.0
+# Comment lines on idle event streams, so dead clients get noticed.
+STREAM_PING = 15.0
+MAX_HEADER_LINES = 100
+MAX_BODY = 64 * 1024
+
+REASONS = {
+    200: "OK",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+# Action name -> the JSON fields it takes, in the order the command wants them.
+# A plot can be a selection such as "1-9" or "all", see parse_plots.
+ACTIONS = {
+    "plant": ("plot", "crop"),
+    "harvest": (),
+    "next_day": (),
+    "sleep": (),
+    "nap": (),
+    "buy": ("item",),
+    "fish": (),
+    "sell_fish": (),
+}
+# Fields an action may leave out, they go after the required ones.
+OPTIONAL_FIELDS = {
+    "harvest": ("plots",),
+}
+
+JSON = "application/json"
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class HttpRequest:
+    def __init__(
+        self,
+        method: str,
+        target: str,
+        version: str,
+        headers: dict[str, str],
+        body: bytes = b"",
+    ):
+        url = urlsplit(target)
+        self.method = method
+        self.path = unquote(url.path)
+        self.query = parse_qs(url.query)
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def not_modified(self, etag: str) -> bool:
+        match = self.headers.get("if-none-match")
+        if match is None:
+            return False
+        tags = [tag.strip().removeprefix("W/") for tag in match.split(",")]
+        return "*" in tags or etag in tags
+
+    def json(self) -> dict[str, Any]:
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except ValueError:
+            raise HttpError(400, "body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "body must be a JSON object")
+        return data
+
+
+class HttpResponse:
+    def __init__(
+        self,
+        status: int = 200,
+        body: bytes = b"",
+        content_type: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        stream: Optional[Callable[[asyncio.StreamWriter], Awaitable[None]]] = None,
+    ):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.headers = headers or {}
+        # A streamed body runs until it returns and then closes the connection.
+        self.stream = stream
+
+    @classmethod
+    def json(cls, status: int, data: Any, **headers: str) -> "HttpResponse":
+        return cls(status, json.dumps(data).encode(), JSON, headers)
+
+    def encode(self, keep_alive: bool, head: bool = False) -> bytes:
+        lines = [f"HTTP/1.1 {self.status} {REASONS.get(self.status, '')}"]
+        if self.content_type:
+            lines.append(f"Content-Type: {self.content_type}")
+        if self.stream is not None:
+            keep_alive = False
+        elif self.status != 304:  # It has no body, not an empty one.
+            lines.append(f"Content-Length: {len(self.body)}")
+        lines.extend(f"{name}: {value}" for name, value in self.headers.items())
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        header = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        if head or self.status == 304:
+            return header
+        return header + self.body
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[HttpRequest]:
+    """The next request on a connection, or None once the client hung up."""
+    line = await reader.readline()
+    while line in (b"\r\n", b"\n"):
+        line = await reader.readline()
+    if not line:
+        return None
+
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise HttpError(400, "malformed request line")
+    method, target, version = parts
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(400, "too many headers")
+
+    if "transfer-encoding" in headers:
+        raise HttpError(411, "send a Content-Length instead of chunks")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(400, "bad Content-Length")
+    if length > MAX_BODY:
+        raise HttpError(413, f"bodies are limited to {MAX_BODY} bytes")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return HttpRequest(method, target, version, headers, body)
+
+
+class FarmApi:
+    """JSON over HTTP/1.1 for the web frontend, next to the line protocol.
+
+    GET /api/farms/<name> is the farm's to_dict() snapshot, tagged with an
+    ETag built from GameState.version. A client that sends the tag back in
+    If-None-Match gets 304 while the farm is unchanged, without anything
+    being serialized, and changed farms are serialized once per version
+    however many clients ask. GET /api/farms/<name>/events is a
+    Server-Sent Events stream of what changes, see FarmFeed. POST /api/farms/<name>/<action> runs one of
+    ACTIONS through the farm's GameSession queue, so HTTP, socket and TUI
+    players of the same farm never interleave. Connections are kept alive
+    until the client closes them or sits idle for KEEP_ALIVE_TIMEOUT.
+
+    The API only serves farms that exist, hosted by the server or saved in
+    its save directory, and creates none: players start farms over the line
+    protocol. Farms it loaded itself are let go after SESSION_IDLE_TIMEOUT
+    without requests or event streams.
+
+    Any other GET is a file from `web_dir`, when one is given.
+    """
+
+    def __init__(self, server: GameServer, web_dir: Optional[str] = None):
+        self.server = server
+        self.web_dir = os.path.realpath(web_dir) if web_dir else None
+        # Server start time, so tags from before a restart never match.
+        self.boot = f"{int(time.time()):x}"
+        self.sessions: dict[str, GameSession] = {}
+        self.last_used: dict[str, float] = {}
+        self.snapshots: dict[str, tuple[int, bytes]] = {}
+        self.feeds: dict[str, FarmFeed] = {}
+        self.crops = json.dumps(
+            {
+                name: crop.to_dict()
+                for name, crop in CropSystem().available_crops.items()
+            }
+        ).encode()
+        self.reaper = asyncio.get_running_loop().create_task(self._reap())
+
+    def session(self, name: str) -> GameSession:
+        if not FARM_NAME.match(name):
+            raise HttpError(404, "farm names are letters, digits, - and _")
+        session = self.sessions.get(name)
+        if session is None:
+            if not self.server.has_farm(name):
+                raise HttpError(404, f"no farm named {name}")
+            session = self.sessions[name] = self.server.attach(name)
+        self.last_used[name] = time.monotonic()
+        return session
+
+    async def _reap(self):
+        while True:
+            await asyncio.sleep(SESSION_IDLE_TIMEOUT / 4)
+            self.release_idle()
+
+    def release_idle(self, now: Optional[float] = None):
+        """Detach farms without a request for SESSION_IDLE_TIMEOUT and
+        nobody watching their event stream."""
+        now = time.monotonic() if now is None else now
+        for name, used in list(self.last_used.items()):
+            if now - used < SESSION_IDLE_TIMEOUT or name in self.feeds:
+                continue
+            del self.last_used[name]
+            self.snapshots.pop(name, None)
+            self.server.detach(self.sessions.pop(name))
+
+    def close(self):
+        self.reaper.cancel()
+        for feed in self.feeds.values():
+            feed.close()
+        self.feeds.clear()
+        for session in self.sessions.values():
+            self.server.detach(session)
+        self.sessions.clear()
+        self.last_used.clear()
+        self.snapshots.clear()
+
+    def etag(self, session: GameSession) -> str:
+        return f'"{self.boot}-{session.game.version}"'
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        read_request(reader), KEEP_ALIVE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    break
+                except HttpError as e:
+                    error = HttpResponse.json(e.status, {"error": e.message})
+                    writer.write(error.encode(keep_alive=False))
+                    break
+                if request is None:
+                    break
+
+                try:
+                    response = await self.dispatch(request)
+                except HttpError as e:
+                    response = HttpResponse.json(e.status, {"error": e.message})
+                except Exception as e:
+                    response = HttpResponse.json(500, {"error": str(e)})
+
+                head = request.method == "HEAD"
+                writer.write(response.encode(request.keep_alive, head=head))
+                await writer.drain()
+                if response.stream is not None:
+                    if not head:
+                        await response.stream(writer)
+                    break
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Browsers keep idle connections open, don't report them on shutdown.
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: HttpRequest) -> HttpResponse:
+        parts = request.path.strip("/").split("/")
+        reading = request.method in ("GET", "HEAD")
+
+        if parts[0] != "api":
+            if not reading:
+                raise HttpError(405, "only GET for files")
+            return self.get_file(request)
+        if parts[1:] == ["crops"] and reading:
+            return HttpResponse(200, self.crops, JSON)
+        if len(parts) == 3 and parts[1] == "farms":
+            if not reading:
+                raise HttpError(405, "GET the farm, POST to one of its actions")
+            return self.get_state(request, self.session(parts[2]))
+        if parts[1:2] == ["farms"] and parts[3:] == ["events"] and reading:
+            return self.get_events(self.session(parts[2]))
+        if len(parts) == 4 and parts[1] == "farms":
+            if request.method != "POST":
+                raise HttpError(405, "actions are POSTed")
+            return await self.post_action(request, self.session(parts[2]), parts[3])
+        raise HttpError(404, f"no such endpoint {request.path}")
+
+    def get_state(self, request: HttpRequest, session: GameSession) -> HttpResponse:
+        game = session.game
+        with game.clock.frame() as now:
+            game.tick()
+        headers = {
+            "ETag": self.etag(session),
+            "Cache-Control": "no-cache",
+            # Plot progress is planted_at against this, the snapshot only
+            # changes when the farm does.
+            "X-Game-Time": f"{now:.3f}",
+        }
+        if request.not_modified(headers["ETag"]):
+            return HttpResponse(304, headers=headers)
+
+        version, body = self.snapshots.get(session.name, (None, b""))
+        if version != game.version:
+            body = json.dumps(game.to_dict(), separators=(",", ":")).encode()
+            self.snapshots[session.name] = (game.version, body)
+        return HttpResponse(200, body, JSON, headers)
+
+    def get_events(self, session: GameSession) -> HttpResponse:
+        async def stream(writer: asyncio.StreamWriter):
+            feed = self.feeds.get(session.name)
+            if feed is None:
+                feed = self.feeds[session.name] = FarmFeed(session)
+            queue = feed.subscribe()
+            try:
+                while True:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), STREAM_PING)
+                    except asyncio.TimeoutError:
+                        event = b":\n\n"
+                    if event is None:
+                        break
+                    writer.write(event)
+                    await writer.drain()
+            finally:
+                feed.unsubscribe(queue)
+                if not feed.subscribers and self.feeds.get(session.name) is feed:
+                    feed.close()
+                    del self.feeds[session.name]
+                    # Idle from now on, not from when the stream was opened.
+                    self.last_used[session.name] = time.monotonic()
+
+        headers = {"Cache-Control": "no-cache"}
+        return HttpResponse(
+            200, content_type="text/event-stream", headers=headers, stream=stream
+        )
+
+    async def post_action(
+        self, request: HttpRequest, session: GameSession, action: str
+    ) -> HttpResponse:
+        if action not in ACTIONS:
+            raise HttpError(404, f"actions are {', '.join(ACTIONS)}")
+
+        data = request.json()
+        args = []
+        for field in ACTIONS[action]:
+            value = str(data.get(field, "")).strip()
+            if not value or len(value.split()) != 1:
+                raise HttpError(400, f"{action} needs {', '.join(ACTIONS[action])}")
+            args.append(value)
+        for field in OPTIONAL_FIELDS.get(action, ()):
+            value = str(data.get(field, "")).strip()
+            if len(value.split()) > 1:
+                raise HttpError(400, f"{field} is one selection like 1-9")
+            if value:
+                args.append(value)
+
+        response = await session.submit(" ".join([action, *args]))
+        status, _, message = response.partition(" ")
+        ok = status == "OK"
+        return HttpResponse.json(
+            200 if ok else 409,
+            {"ok": ok, "message": message, "version": session.game.version},
+            ETag=self.etag(session),
+        )
+
+    def get_file(self, request: HttpRequest) -> HttpResponse:
+        if self.web_dir is None:
+            raise HttpError(404, "no web directory is being served")
+        relative = request.path.lstrip("/") or "index.html"
+        path = os.path.realpath(os.path.join(self.web_dir, relative))
+        if not path.startswith(self.web_dir + os.sep) or not os.path.isfile(path):
+            raise HttpError(404, f"no such file {request.path}")
+
+        stat = os.stat(path)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if request.not_modified(etag):
+            return HttpResponse(304, headers=headers)
+        with open(path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return HttpResponse(200, body, content_type, headers)
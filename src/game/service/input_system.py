@@ -0,0 +1,57 @@
+import os
+import select
+import sys
+from collections import deque
+from typing import Optional, TextIO
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows has no termios, the UI falls back to input().
+    termios = None
+    tty = None
+
+
+class KeyReader:
+    """Single keypresses from a POSIX terminal.
+
+    Inside `with KeyReader() as keys:` the terminal is in cbreak mode (no line
+    buffering, no echo, Ctrl-C still works) and `raw` is True. read_key()
+    waits at most `timeout` seconds, so a UI can redraw between keys. Escape
+    sequences such as arrow keys are dropped. Without a terminal `raw` stays
+    False and callers should read whole lines instead.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdin
+        self.raw = False
+        self._saved = None
+        self._pending: deque[str] = deque()
+
+    def __enter__(self) -> "KeyReader":
+        if termios is not None and self.stream.isatty():
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+            self.raw = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._saved is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved)
+            self._saved = None
+        self.raw = False
+
+    def read_key(self, timeout: Optional[float] = None) -> Optional[str]:
+        if not self._pending:
+            fd = self.stream.fileno()
+            readable, _, _ = select.select([fd], [], [], timeout)
+            if not readable:
+                return None
+            data = os.read(fd, 64).decode(errors="ignore")
+            if not data:
+                raise EOFError
+            if data.startswith("\x1b"):
+                return None
+            self._pending.extend(data)
+        return self._pending.popleft()
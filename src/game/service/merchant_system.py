@@ -1,125 +1,186 @@
-from domain.player import Player
-from domain.crop import Crop
-from service.crop_system import CropSystem
-from typing import Optional
+from game.domain.player import Player
+from game.domain.merchandise import ItemEffect, MerchantItem, MerchantSeed, Offer
+from game.service.crop_system import CropSystem
+from game.utils.constants import GameStateConstants
+from typing import Any, Callable, Optional, Tuple
+
+
+def _player_flag(name: str, value: Any = True) -> Callable[[Any], bool]:
+    return lambda merchant: getattr(merchant.player, name, None) == value
 
 
 class MerchantSystem:
+    """Joji's shop, driven by the SEEDS and ITEMS catalogues.
+
+    Each item names an effect in EFFECTS, which holds both the purchase
+    handler and the ownership check, so buying and the menu dispatch with
+    one dict lookup. Today's prices and ownership are built once into
+    offers() and only rebuilt after a purchase, a day rollover or a change
+    of market_inflated.
+    """
+
+    MARKET_INFLATION = 2
+
     def __init__(self, crop_system: CropSystem, player: Player):
         self.crop_system = crop_system
         self.player = player
+        self.game = None
         self.fishing_unlocked = False
 
-        if "Skyfish" not in [fish["name"] for fish in getattr(self, "fish_types", [])]:
-            pass
-        if "lazy_ghost" not in self.crop_system.available_crops:
-            self.crop_system.available_crops["lazy_ghost"] = Crop(
-                "lazy_ghost", 0, 30, 100, "white", 0
-            )
-
-        self.inventory = {
-            "seeds": {
-                "eggplant_seed": {"crop": "eggplant", "price": 80},
-                "blueberry_seed": {"crop": "blueberry", "price": 120},
-            },
-            "items": {
-                "farmdex_scanner": {
-                    "price": 300,
-                    "effect": "unlock_farmdex",
-                    "narrative": True,
-                },
-                "fishing_rod": {"price": 5000, "unlocks": "fishing"},
-                "golden_hat": {"price": 6666, "effect": "cosmetic", "narrative": True},
-                "lucky_egg": {"price": 5000, "effect": "increase_event_chance"},
-                "balatro_card": {"price": 8888, "effect": "increase_max_stamina"},
-                "lantern": {"price": 2000, "effect": "unlock_night_work"},
-                "sleep_pills": {
-                    "price": 3000,
-                    "effect": "unlock_anytime_sleep",
-                    "narrative": True,
-                },
-            },
-        }
+        self.seeds = {seed.key: seed for seed in self.SEEDS}
+        self.items = {item.key: item for item in self.ITEMS}
+        self._purchases = 0
+        self._offers: dict[str, Offer] = {}
+        self._offers_key: Optional[Tuple[int, bool, int]] = None
 
     def is_available(self, part_of_day: str) -> bool:
-        return part_of_day == "morning"
+        return part_of_day == GameStateConstants.MERCHANT_PART
+
+    @property
+    def market_inflated(self) -> bool:
+        return bool(getattr(self.game, "market_inflated", False))
+
+    def offers(self) -> dict[str, Offer]:
+        """Today's shop by key, seeds first, in catalogue order."""
+        day = self.game.time_system.day if self.game is not None else 0
+        key = (day, self.market_inflated, self._purchases)
+        if key != self._offers_key:
+            self._offers = self._build_offers()
+            self._offers_key = key
+        return self._offers
+
+    def offer(self, key: str) -> Optional[Offer]:
+        return self.offers().get(key)
+
+    def _build_offers(self) -> dict[str, Offer]:
+        factor = self.MARKET_INFLATION if self.market_inflated else 1
+        offers = {}
+        for seed in self.SEEDS:
+            offers[seed.key] = Offer(
+                seed.key,
+                "seed",
+                seed.price * factor,
+                seed.crop in self.crop_system.unlocked_crops,
+                f"Unlocks {seed.crop.capitalize()}",
+            )
+        for item in self.ITEMS:
+            offers[item.key] = Offer(
+                item.key,
+                "item",
+                item.price * factor,
+                self.EFFECTS[item.effect].owned(self),
+                item.description,
+                item.narrative,
+            )
+        return offers
+
+    def _pay(self, offer: Offer) -> bool:
+        if not self.player.can_afford(offer.price):
+            return False
+        self.player.spend_money(offer.price)
+        self._purchases += 1
+        return True
 
     def buy_seed(self, seed_key: str) -> Optional[str]:
-        if seed_key not in self.inventory["seeds"]:
+        offer = self.offer(seed_key)
+        if offer is None or offer.kind != "seed":
             return "Invalid seed."
 
-        seed = self.inventory["seeds"][seed_key]
-        price = seed["price"]
-        if hasattr(self.player, "game") and getattr(
-            self.player.game, "market_inflated", False
-        ):
-            price *= 2
-        if not self.player.can_afford(price):
+        seed = self.seeds[seed_key]
+        if not self._pay(offer):
             return "Not enough money."
 
-        self.player.spend_money(price)
-        result = self.crop_system.unlock_crop(seed["crop"])
-        return result or f"{seed['crop'].capitalize()} is already unlocked."
+        result = self.crop_system.unlock_crop(seed.crop)
+        return result or f"{seed.crop.capitalize()} is already unlocked."
 
     def buy_item(self, item_key: str) -> Optional[str]:
-        if item_key not in self.inventory["items"]:
+        offer = self.offer(item_key)
+        if offer is None or offer.kind != "item":
             return "Invalid item."
+        if offer.owned:
+            return "You already own this item."
+        if not self._pay(offer):
+            return "Not enough money."
 
-        item = self.inventory["items"][item_key]
+        return self.EFFECTS[self.items[item_key].effect].apply(self)
 
-        if item.get("unlocks") == "fishing" and self.fishing_unlocked:
-            return "You already own this item."
-        if (
-            item.get("effect") == "increase_event_chance"
-            and hasattr(self.player, "event_bonus")
-            and self.player.event_bonus == "lucky_egg"
-        ):
-            return "You already own this item."
-        if item.get("effect") == "increase_max_stamina" and self.player.max_stamina > 5:
-            return "You already own this item."
-        if (
-            item.get("effect") == "cosmetic"
-            and hasattr(self.player, "bought_hat")
-            and self.player.bought_hat
-        ):
-            return "You already own this item."
-        if item.get("effect") == "unlock_night_work" and getattr(
-            self.player, "has_lantern", False
-        ):
-            return "You already own this item."
-        if item.get("effect") == "unlock_farmdex" and getattr(
-            self.player, "has_farmdex", False
-        ):
-            return "You already own this item."
-        if item.get("effect") == "unlock_anytime_sleep" and getattr(
-            self.player, "can_sleep_anytime", False
-        ):
-            return "You already own this item."
+    def _unlock_fishing(self) -> str:
+        self.fishing_unlocked = True
+        return "You bought a fishing rod! Fishing is now available."
 
-        if not self.player.can_afford(item["price"]):
-            return "Not enough money."
+    def _increase_event_chance(self) -> str:
+        self.player.event_bonus = "lucky_egg"
+        return "You feel luckier already... (+Event Chance)"
+
+    def _increase_max_stamina(self) -> str:
+        self.player.max_stamina += 4
+        self.player.stamina = self.player.max_stamina
+        return "Your soul feels stronger... (+4 Max Stamina)"
+
+    def _cosmetic(self) -> str:
+        self.player.bought_hat = True
+        return "Cosmetic item? In a CLI game? Bro... you deserved to lose that money. I'm sorry."
+
+    def _unlock_night_work(self) -> str:
+        self.player.has_lantern = True
+        return "You bought a lantern! Now you can work through the night."
+
+    def _unlock_farmdex(self) -> str:
+        self.player.has_farmdex = True
+        return "Every two days, you have a 75% chance to discover a buried fossil! Help the local museum build the greatest dinosaur collection in history!"
+
+    def _unlock_anytime_sleep(self) -> str:
+        self.player.can_sleep_anytime = True
+        return "You bought Sleep Pills! Now you can sleep anytime to skip the day."
+
+    EFFECTS = {
+        "unlock_fishing": ItemEffect(
+            _unlock_fishing, lambda self: self.fishing_unlocked
+        ),
+        "increase_event_chance": ItemEffect(
+            _increase_event_chance, _player_flag("event_bonus", "lucky_egg")
+        ),
+        "increase_max_stamina": ItemEffect(
+            _increase_max_stamina, lambda self: self.player.max_stamina > 5
+        ),
+        "cosmetic": ItemEffect(_cosmetic, _player_flag("bought_hat")),
+        "unlock_night_work": ItemEffect(
+            _unlock_night_work, _player_flag("has_lantern")
+        ),
+        "unlock_farmdex": ItemEffect(_unlock_farmdex, _player_flag("has_farmdex")),
+        "unlock_anytime_sleep": ItemEffect(
+            _unlock_anytime_sleep, _player_flag("can_sleep_anytime")
+        ),
+    }
+
+    SEEDS = (
+        MerchantSeed("eggplant_seed", "eggplant", 80),
+        MerchantSeed("blueberry_seed", "blueberry", 120),
+    )
 
-        self.player.spend_money(item["price"])
-        if item.get("unlocks") == "fishing":
-            self.fishing_unlocked = True
-            return "You bought a fishing rod! Fishing is now available."
-        elif item.get("effect") == "increase_event_chance":
-            self.player.event_bonus = "lucky_egg"
-            return "You feel luckier already... (+Event Chance)"
-        elif item.get("effect") == "increase_max_stamina":
-            self.player.max_stamina += 4
-            self.player.stamina = self.player.max_stamina
-            return "Your soul feels stronger... (+4 Max Stamina)"
-        elif item.get("effect") == "cosmetic":
-            self.player.bought_hat = True
-            return "Cosmetic item? In a CLI game? Bro... you deserved to lose that money. I'm sorry."
-        elif item.get("effect") == "unlock_night_work":
-            self.player.has_lantern = True
-            return "You bought a lantern! Now you can work through the night."
-        elif item.get("effect") == "unlock_farmdex":
-            self.player.has_farmdex = True
-            return "Every two days, you have a 75% chance to discover a buried fossil! Help the local museum build the greatest dinosaur collection in history!"
-        elif item.get("effect") == "unlock_anytime_sleep":
-            self.player.can_sleep_anytime = True
-            return "You bought Sleep Pills! Now you can sleep anytime to skip the day."
-        return "Item purchased."
+    ITEMS = (
+        MerchantItem("farmdex_scanner", 300, "unlock_farmdex", narrative=True),
+        MerchantItem("fishing_rod", 5000, "unlock_fishing", "Unlocks Fishing"),
+        MerchantItem(
+            "golden_hat", 6666, "cosmetic", "Visual cosmetic item", narrative=True
+        ),
+        MerchantItem(
+            "lucky_egg",
+            5000,
+            "increase_event_chance",
+            "Boosts daily events: 80% chance to occur each day!",
+        ),
+        MerchantItem(
+            "balatro_card", 8888, "increase_max_stamina", "Double your max stamina"
+        ),
+        MerchantItem(
+            "lantern", 2000, "unlock_night_work", "Allow you to work at night"
+        ),
+        MerchantItem(
+            "sleep_pills",
+            3000,
+            "unlock_anytime_sleep",
+            "Sleep anytime to recover stamina",
+            narrative=True,
+        ),
+    )
@@ -0,0 +1,156 @@
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Optional, Sequence, Tuple
+from game.service.policy_system import POLICIES
+from game.service.simulation_system import HeadlessRunner
+from game.utils.rng import derive_seed
+from game.utils.stats import Distribution
+
+CHECKPOINTS = (7, 30, 90, 180, 365, 730)
+
+
+def simulate_runs(
+    policy: str,
+    days: int,
+    seed: int,
+    start: int,
+    stop: int,
+    checkpoints: Sequence[int] = CHECKPOINTS,
+) -> dict[str, Distribution]:
+    """Play runs start..stop-1 and summarize them. Runs in a worker process,
+    so only the summaries travel back, never the games."""
+    metrics: dict[str, Distribution] = defaultdict(Distribution)
+
+    for run in range(start, stop):
+        runner = HeadlessRunner(POLICIES[policy](), seed=derive_seed(seed, "run", run))
+        game = runner.game
+        first_day = game.time_system.day
+        pending = {first_day + day: day for day in checkpoints if day <= days}
+        reached: dict[str, int] = {}
+
+        def on_day(game):
+            elapsed = game.time_system.day - first_day
+            checkpoint = pending.pop(game.time_system.day, None)
+            if checkpoint is not None:
+                metrics[f"money_day_{checkpoint}"].add(game.player.money)
+            if "fishing_rod" not in reached and game.fishing_unlocked:
+                reached["fishing_rod"] = elapsed
+            if (
+                "all_fossils" not in reached
+                and game.collection_system["fossils"].complete
+            ):
+                reached["all_fossils"] = elapsed
+
+        runner.run(days, on_day)
+        metrics["final_money"].add(game.player.money)
+        metrics["fossils_found"].add(game.collection_system["fossils"].count)
+        metrics["actions"].add(runner.actions)
+        for milestone, day in reached.items():
+            metrics[f"days_to_{milestone}"].add(day)
+
+    return dict(metrics)
+
+
+class MonteCarloReport:
+    def __init__(
+        self,
+        runs: int,
+        days: int,
+        workers: int,
+        elapsed: float,
+        metrics: dict[str, Distribution],
+    ):
+        self.runs = runs
+        self.days = days
+        self.workers = workers
+        self.elapsed = elapsed
+        self.metrics = metrics
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.runs / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def days_per_second(self) -> float:
+        return self.runs * self.days / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "days": self.days,
+            "workers": self.workers,
+            "elapsed": self.elapsed,
+            "runs_per_second": self.runs_per_second,
+            "days_per_second": self.days_per_second,
+            "metrics": {name: dist.to_dict() for name, dist in self.metrics.items()},
+        }
+
+
+class MonteCarloSimulator:
+    """Plays many seeded games through a policy, fanned out over a process
+    pool, and merges the per-chunk summaries as they finish.
+
+    Run i always uses derive_seed(seed, "run", i), so results don't depend on
+    the worker count or on which worker picked up which chunk.
+    """
+
+    def __init__(
+        self,
+        policy: str = "greedy",
+        days: int = 365,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        checkpoints: Sequence[int] = CHECKPOINTS,
+    ):
+        self.policy = policy
+        self.days = days
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.checkpoints = tuple(checkpoints)
+
+    def _chunks(self, runs: int, workers: int) -> list[Tuple[int, int]]:
+        # Several chunks per worker keep every core busy until the end.
+        size = self.chunk_size or max(1, runs // (workers * 8))
+        return [(start, min(start + size, runs)) for start in range(0, runs, size)]
+
+    def run(self, runs: int, workers: Optional[int] = None) -> MonteCarloReport:
+        workers = workers or self.workers
+        metrics: dict[str, Distribution] = defaultdict(Distribution)
+        args = (self.policy, self.days, self.seed)
+        started = time.perf_counter()
+
+        if workers == 1:
+            for start, stop in self._chunks(runs, 1):
+                for name, dist in simulate_runs(
+                    *args, start, stop, self.checkpoints
+                ).items():
+                    metrics[name].merge(dist)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(simulate_runs, *args, start, stop, self.checkpoints)
+                    for start, stop in self._chunks(runs, workers)
+                ]
+                for future in as_completed(futures):
+                    for name, dist in future.result().items():
+                        metrics[name].merge(dist)
+
+        elapsed = time.perf_counter() - started
+        return MonteCarloReport(runs, self.days, workers, elapsed, dict(metrics))
+
+    def scaling(
+        self, runs: int, worker_counts: Optional[Sequence[int]] = None
+    ) -> list[MonteCarloReport]:
+        """Run the same workload at 1, 2, 4, ... workers up to the CPU count."""
+        if worker_counts is None:
+            worker_counts = []
+            count = 1
+            while count < self.workers:
+                worker_counts.append(count)
+                count *= 2
+            worker_counts.append(self.workers)
+        return [self.run(runs, workers) for workers in worker_counts]
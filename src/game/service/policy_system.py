@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING, Any, Tuple
+from game.interfaces.player_policy import IPlayerPolicy
+from game.utils.constants import FishingConstants
+
+if TYPE_CHECKING:
+    from game.service.game_state import GameState
+
+
+class SleepyPolicy(IPlayerPolicy):
+    """Does nothing but sleep, useful as a baseline for event-only income."""
+
+    def decide(self, game: "GameState") -> Tuple[Any, ...]:
+        return ("sleep",)
+
+
+class GreedyPolicy(IPlayerPolicy):
+    """Harvests whatever is ready, buys from the shopping list and fills every
+    empty plot with the most profitable crop it can afford."""
+
+    def __init__(
+        self,
+        shopping_list: Tuple[str, ...] = (
+            "farmdex_scanner",
+            "fishing_rod",
+            "balatro_card",
+            "lantern",
+        ),
+        money_reserve: int = 50,
+        stamina_reserve: float = 1.0,
+    ):
+        self.shopping_list = shopping_list
+        self.money_reserve = money_reserve
+        self.stamina_reserve = stamina_reserve
+
+    def decide(self, game: "GameState") -> Tuple[Any, ...]:
+        player = game.player
+
+        if player.has_stamina(0.5 + self.stamina_reserve) and game.farm.ready_count():
+            return ("harvest",)
+
+        if game.fishing_unlocked and game.fishing_system.caught_fish:
+            return ("sell_fish",)
+
+        offers = game.merchant_system.offers()
+        for offer in offers.values():
+            if (
+                offer.kind == "seed"
+                and not offer.owned
+                and player.money >= offer.price + self.money_reserve
+            ):
+                return ("buy_seed", offer.key)
+
+        for item_key in self.shopping_list:
+            offer = offers.get(item_key)
+            if (
+                offer
+                and not offer.owned
+                and player.money >= offer.price + self.money_reserve
+            ):
+                return ("buy_item", item_key)
+
+        empty_plot = next(
+            (i for i, plot in enumerate(game.farm.plots) if plot.is_empty), None
+        )
+        if empty_plot is not None:
+            affordable = [
+                key
+                for key in game.crop_system.unlocked_crops
+                if player.can_afford(game.crop_system.get_crop(key).cost)
+                and player.has_stamina(
+                    game.crop_system.get_crop(key).stamina_cost + self.stamina_reserve
+                )
+            ]
+            if affordable:
+                crop_key = max(
+                    affordable,
+                    key=lambda key: (
+                        game.crop_system.get_crop(key).value
+                        - game.crop_system.get_crop(key).cost
+                    ),
+                )
+                return ("plant", empty_plot, crop_key)
+
+        if game.fishing_unlocked and player.has_stamina(
+            FishingConstants.STAMINA_TO_FISH + self.stamina_reserve
+        ):
+            return ("fish",)
+
+        return ("sleep",)
+
+
+POLICIES = {
+    "greedy": GreedyPolicy,
+    "sleepy": SleepyPolicy,
+}
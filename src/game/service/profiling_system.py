@@ -0,0 +1,142 @@
+import functools
+import importlib
+import time
+from typing import Any, Callable
+from game.utils.metrics import METRICS, Metrics
+
+# (module, class, methods). Every subclass that overrides one of the methods
+# is timed under its own name, e.g. ArrayFarmSystem.harvest_ready_crops.
+HOOKS = (
+    ("game.interfaces.game_system", "IGameSystem", ("update",)),
+    (
+        "game.service.game_state",
+        "GameState",
+        ("next_day", "sleep", "advance_days", "tick", "save", "load", "catch_up"),
+    ),
+    ("game.service.daycycle_system", "DayCycleSystem", ("update",)),
+    (
+        "game.service.farm_system",
+        "FarmSystem",
+        (
+            "harvest_ready_crops",
+            "apply_growth_bonus",
+            "damage_random_crop",
+            "ready_count",
+            "next_ready_at",
+            "export_columns",
+            "from_columns",
+        ),
+    ),
+    (
+        "game.service.tui_system",
+        "TerminalUI",
+        (
+            "present",
+            "display_header",
+            "display_status",
+            "_display_farm",
+            "display_actions",
+        ),
+    ),
+    ("game.service.render_system", "ScreenRenderer", ("present",)),
+    ("game.service.server_system", "GameSession", ("execute",)),
+)
+
+# Subclasses only show up once their module is imported.
+SUBCLASS_MODULES = (
+    "game.service.event_system",
+    "game.service.time_system",
+    "game.service.weather_system",
+    "game.service.array_farm_system",
+)
+
+
+def _subclasses(cls: type) -> list[type]:
+    found = [cls]
+    for subclass in cls.__subclasses__():
+        found.extend(_subclasses(subclass))
+    return found
+
+
+def _timed(func: Callable, name: str, metrics: Metrics) -> Callable:
+    observe = metrics.observe
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        started = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            metrics.inc(f"{name}.errors")
+            raise
+        finally:
+            observe(name, perf_counter() - started)
+
+    return timed
+
+
+class Profiler:
+    """Times the methods listed in HOOKS by swapping timing wrappers into
+    their classes on enable() and putting the originals back on disable().
+
+    While disabled the classes hold their original functions, so
+    instrumentation costs nothing. Enabling imports the hooked modules,
+    including lazily loaded subsystems.
+    """
+
+    def __init__(self, metrics: Metrics = METRICS):
+        self.metrics = metrics
+        self.enabled = False
+        self._originals: list[tuple[type, str, Any]] = []
+
+    def enable(self):
+        if self.enabled:
+            return
+        for module in SUBCLASS_MODULES:
+            importlib.import_module(module)
+        for module, class_name, methods in HOOKS:
+            base = getattr(importlib.import_module(module), class_name)
+            for cls in _subclasses(base):
+                for method in methods:
+                    if method in cls.__dict__ and not getattr(
+                        cls.__dict__[method], "__isabstractmethod__", False
+                    ):
+                        self._wrap(cls, method)
+        self.enabled = True
+
+    def _wrap(self, cls: type, method: str):
+        original = cls.__dict__[method]
+        name = f"{cls.__name__}.{method}"
+        if isinstance(original, (classmethod, staticmethod)):
+            wrapped = type(original)(_timed(original.__func__, name, self.metrics))
+        elif callable(original):
+            wrapped = _timed(original, name, self.metrics)
+        else:
+            return
+        self._originals.append((cls, method, original))
+        setattr(cls, method, wrapped)
+
+    def disable(self):
+        for cls, method, original in reversed(self._originals):
+            setattr(cls, method, original)
+        self._originals.clear()
+        self.enabled = False
+
+    def toggle(self) -> bool:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def watch_game(self, game: Any):
+        """Gauges for one game, read only when metrics are exported."""
+        gauge = self.metrics.gauge
+        gauge("day", lambda: game.time_system.day)
+        gauge("money", lambda: game.player.money)
+        gauge("plots", lambda: len(game.farm.plots))
+        gauge("scheduler_fired", lambda: game.scheduler.fired)
+
+
+PROFILER = Profiler()
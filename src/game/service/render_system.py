@@ -0,0 +1,171 @@
+import re
+import shutil
+import sys
+import time
+import unicodedata
+from typing import Optional, TextIO
+
+ANSI_TOKEN = re.compile(r"(\x1B\[[0-?]*[ -/]*[@-~])")
+RESET = "\033[0m"
+ZERO_WIDTH = {"\u200d", "\ufe0e", "\ufe0f"}
+
+
+class Cell:
+    __slots__ = ("style", "text", "width", "exact")
+
+    def __init__(self, style: str, text: str, width: int, exact: bool):
+        self.style = style
+        self.text = text
+        self.width = width
+        # False when the terminal may draw this cell wider or narrower than we
+        # think (emoji with variation selectors); columns after it are not trusted.
+        self.exact = exact
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Cell)
+            and self.text == other.text
+            and self.style == other.style
+        )
+
+
+def parse_line(line: str) -> list[Cell]:
+    cells: list[Cell] = []
+    style = ""
+    for token in ANSI_TOKEN.split(line):
+        if not token:
+            continue
+        if token[0] == "\x1b":
+            style = "" if token == RESET else style + token
+            continue
+        for char in token:
+            if char in ZERO_WIDTH or unicodedata.combining(char):
+                if cells:
+                    previous = cells[-1]
+                    previous.text += char
+                    previous.exact = False
+                continue
+            wide = unicodedata.east_asian_width(char) in ("W", "F")
+            cells.append(Cell(style, char, 2 if wide else 1, True))
+    return cells
+
+
+class ScreenRenderer:
+    """Composes frames off-screen and repaints only the cells that changed."""
+
+    MERGE_GAP = 8
+    PROMPT_ROWS = 6
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+        self.previous_lines: list[str] = []
+        self.previous_cells: list[list[Cell]] = []
+        self.invalid = True
+        self.frames = 0
+        self.total_bytes = 0
+        self.last_frame_bytes = 0
+        self.last_frame_time = 0.0
+
+    def invalidate(self):
+        self.invalid = True
+
+    def present(self, frame: str, started: Optional[float] = None):
+        started = time.perf_counter() if started is None else started
+        lines = frame.rstrip("\n").split("\n")
+
+        # Anything printed below a frame that no longer fits scrolls the terminal,
+        # after which our row numbers are wrong; fall back to full repaints.
+        if len(lines) + self.PROMPT_ROWS > shutil.get_terminal_size().lines:
+            self.invalid = True
+
+        if self.invalid:
+            output = "\033[H\033[J" + "\n".join(lines)
+            cells = [parse_line(line) for line in lines]
+        else:
+            parts = []
+            cells = []
+            for row, line in enumerate(lines):
+                if row < len(self.previous_lines) and line == self.previous_lines[row]:
+                    cells.append(self.previous_cells[row])
+                    continue
+                new_cells = parse_line(line)
+                old_cells = (
+                    self.previous_cells[row] if row < len(self.previous_cells) else []
+                )
+                parts.append(self._diff_line(row + 1, old_cells, new_cells))
+                cells.append(new_cells)
+            output = "".join(parts) + f"\033[{len(lines)};1H"
+
+        output += "\n\033[J"
+        self.stream.write(output)
+        self.stream.flush()
+
+        self.previous_lines = lines
+        self.previous_cells = cells
+        self.invalid = False
+        self.frames += 1
+        self.last_frame_bytes = len(output.encode())
+        self.total_bytes += self.last_frame_bytes
+        self.last_frame_time = time.perf_counter() - started
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "frames": self.frames,
+            "last_frame_bytes": self.last_frame_bytes,
+            "avg_frame_bytes": self.total_bytes / self.frames if self.frames else 0,
+            "last_frame_ms": self.last_frame_time * 1000,
+        }
+
+    def _diff_line(self, row: int, old: list[Cell], new: list[Cell]) -> str:
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+
+        if not all(cell.exact for cell in new[:start]):
+            start = 0
+        column = 1 + sum(cell.width for cell in new[:start])
+
+        same_shape = len(old) == len(new) and all(
+            a.width == b.width and a.exact and b.exact
+            for a, b in zip(old[start:], new[start:])
+        )
+        if not same_shape:
+            return f"\033[{row};{column}H" + self._paint(new[start:]) + "\033[K"
+
+        parts = []
+        index = start
+        while index < len(new):
+            if old[index] == new[index]:
+                column += new[index].width
+                index += 1
+                continue
+
+            run_end = index
+            gap = 0
+            cursor = index
+            while cursor < len(new) and gap < self.MERGE_GAP:
+                if old[cursor] == new[cursor]:
+                    gap += 1
+                else:
+                    gap = 0
+                    run_end = cursor
+                cursor += 1
+
+            parts.append(
+                f"\033[{row};{column}H" + self._paint(new[index : run_end + 1])
+            )
+            column += sum(cell.width for cell in new[index : run_end + 1])
+            index = run_end + 1
+        return "".join(parts)
+
+    def _paint(self, cells: list[Cell]) -> str:
+        parts = []
+        style = None
+        for cell in cells:
+            if cell.style != style:
+                parts.append(RESET + cell.style)
+                style = cell.style
+            parts.append(cell.text)
+        parts.append(RESET)
+        return "".join(parts)
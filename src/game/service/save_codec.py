@@ -0,0 +1,100 @@
+import struct
+import sys
+from array import array
+from typing import Any, Optional, Tuple, Type
+from game.domain.crop import Crop
+from game.service.farm_system import FarmSystem
+from game.utils.clock import GameClock
+
+
+class JsonSaveCodec:
+    EXTENSION = ".json"
+
+    def encode(self, data: dict[str, Any], farm: FarmSystem) -> bytes:
+        import json
+
+        return json.dumps({**data, "farm": farm.to_dict()}).encode()
+
+    def decode(
+        self,
+        payload: bytes,
+        farm_cls: Type[FarmSystem],
+        clock: Optional[GameClock] = None,
+    ) -> Tuple[dict[str, Any], FarmSystem]:
+        import json
+
+        data = json.loads(payload)
+        farm = farm_cls.from_dict(data.pop("farm"), clock=clock)
+        return data, farm
+
+
+class BinarySaveCodec:
+    """Compact save: the small game state as JSON, then the farm as columns.
+
+    Crops are interned into a table written once, only occupied plots are
+    stored (index, crop id, planted-at as int64 epoch milliseconds) and each
+    column is dumped straight from an `array`.
+    """
+
+    EXTENSION = ".bin"
+    MAGIC = b"TFS1"
+    HEADER = struct.Struct("<4sIIII")
+
+    def encode(self, data: dict[str, Any], farm: FarmSystem) -> bytes:
+        import json
+
+        crops, indices, crop_ids, planted_ms = farm.export_columns()
+        state = json.dumps(data, separators=(",", ":")).encode()
+        crop_table = json.dumps([crop.to_dict() for crop in crops]).encode()
+        header = self.HEADER.pack(
+            self.MAGIC, len(state), len(crop_table), len(farm.plots), len(indices)
+        )
+        columns = [indices, crop_ids, planted_ms]
+        if sys.byteorder == "big":
+            for column in columns:
+                column.byteswap()
+        return b"".join(
+            [header, state, crop_table] + [column.tobytes() for column in columns]
+        )
+
+    def decode(
+        self,
+        payload: bytes,
+        farm_cls: Type[FarmSystem],
+        clock: Optional[GameClock] = None,
+    ) -> Tuple[dict[str, Any], FarmSystem]:
+        import json
+
+        magic, state_size, crops_size, plot_count, occupied = self.HEADER.unpack_from(
+            payload
+        )
+        if magic != self.MAGIC:
+            raise ValueError("Not a Terminal Farm binary save")
+
+        offset = self.HEADER.size
+        data = json.loads(payload[offset : offset + state_size])
+        offset += state_size
+        crops = [
+            Crop.from_dict(crop)
+            for crop in json.loads(payload[offset : offset + crops_size])
+        ]
+        offset += crops_size
+
+        columns = []
+        for typecode in ("I", "H", "q"):
+            column = array(typecode)
+            size = occupied * column.itemsize
+            column.frombytes(payload[offset : offset + size])
+            if sys.byteorder == "big":
+                column.byteswap()
+            columns.append(column)
+            offset += size
+
+        farm = farm_cls.from_columns(plot_count, crops, *columns, clock=clock)
+        return data, farm
+
+
+SAVE_CODECS = {
+    "json": JsonSaveCodec(),
+    "binary": BinarySaveCodec(),
+}
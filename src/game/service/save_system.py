@@ -0,0 +1,106 @@
+import os
+from typing import Any
+
+
+def write_atomic(path: str, payload: bytes):
+    """Write to a temp file next to `path` and rename it into place, so a crash
+    leaves either the old file or the new one, never half of each."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SaveJournal:
+    """Append-only log of actions on top of the last snapshot.
+
+    Every record holds the farm operations the action caused plus the small,
+    fixed-size rest of the game state, so writing one costs the same no matter
+    how big the farm is. Every COMPACT_EVERY records the game writes a fresh
+    snapshot and the journal starts over.
+    """
+
+    COMPACT_EVERY = 256
+
+    def __init__(self, save_file: str, codec: Any, seq: int = 0):
+        self.save_file = save_file
+        self.codec = codec
+        self.path = self.journal_path(save_file)
+        self.seq = seq
+        self.records_since_snapshot = 0
+        self.farm_ops: list[list[Any]] = []
+        self._handle = None
+
+    @staticmethod
+    def journal_path(save_file: str) -> str:
+        # Keep the codec's extension so a .json and a .bin save of the same
+        # farm never share (and truncate) one journal.
+        return save_file + ".journal"
+
+    @property
+    def needs_compaction(self) -> bool:
+        return self.records_since_snapshot >= self.COMPACT_EVERY
+
+    def farm_op(self, op: list[Any]):
+        self.farm_ops.append(op)
+
+    def append(self, action: str, state: dict[str, Any]):
+        import json
+
+        if self._handle is None:
+            self._handle = open(self.path, "a")
+
+        self.seq += 1
+        record = {
+            "seq": self.seq,
+            "action": action,
+            "farm": self.farm_ops,
+            "state": state,
+        }
+        self._handle.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self.farm_ops = []
+        self.records_since_snapshot += 1
+
+    def snapshot(self, data: dict[str, Any], farm: Any):
+        data["journal_seq"] = self.seq
+        write_atomic(self.save_file, self.codec.encode(data, farm))
+
+        # Records up to journal_seq now live in the snapshot; dropping them is
+        # safe even if we crash before the truncate, load skips them by seq.
+        self.close()
+        open(self.path, "w").close()
+        self.farm_ops = []
+        self.records_since_snapshot = 0
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    @classmethod
+    def discard(cls, save_file: str):
+        path = cls.journal_path(save_file)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def read(cls, save_file: str, snapshot_seq: int) -> list[dict[str, Any]]:
+        """Journal records newer than the snapshot at `snapshot_seq`."""
+        import json
+
+        records = []
+        path = cls.journal_path(save_file)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # torn write from a crash, nothing after it is valid
+                    if record["seq"] > snapshot_seq:
+                        records.append(record)
+        return records
@@ -0,0 +1,73 @@
+import heapq
+import itertools
+from typing import Any, Callable, Optional
+from game.utils.clock import GameClock
+
+
+class DeadlineScheduler:
+    """Min-heap of named deadlines in game-clock epoch seconds.
+
+    Each key has at most one live deadline. Scheduling a key again replaces
+    its deadline, and the old heap entry is skipped when it surfaces.
+    Re-arming a key with the same time is free, so owners can simply re-arm
+    everything after each tick.
+    """
+
+    def __init__(self, clock: GameClock):
+        self.clock = clock
+        self._heap: list[tuple[float, int, str]] = []
+        self._live: dict[str, tuple[float, int, Callable[[], Any]]] = {}
+        self._seq = itertools.count()
+        self.fired = 0
+
+    def schedule(self, key: str, when: float, callback: Callable[[], Any]):
+        live = self._live.get(key)
+        if live is not None and live[0] == when:
+            self._live[key] = (when, live[1], callback)
+            return
+
+        seq = next(self._seq)
+        self._live[key] = (when, seq, callback)
+        heapq.heappush(self._heap, (when, seq, key))
+
+    def cancel(self, key: str):
+        self._live.pop(key, None)
+
+    def _drop_stale(self):
+        heap, live = self._heap, self._live
+        while heap:
+            when, seq, key = heap[0]
+            entry = live.get(key)
+            if entry is not None and entry[1] == seq:
+                return
+            heapq.heappop(heap)
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """Game time of the earliest live deadline, None when nothing is armed."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def seconds_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Wall-clock seconds a loop may sleep before the next deadline."""
+        deadline = self.next_deadline
+        if deadline is None:
+            return None
+        now = self.clock.time() if now is None else now
+        return max(0.0, (deadline - now) / (self.clock.speed or 1.0))
+
+    def run_due(self, now: Optional[float] = None) -> list[Any]:
+        """Fire every deadline at or before `now`, returns the callbacks'
+        non-None results in deadline order."""
+        now = self.clock.time() if now is None else now
+        results = []
+        while True:
+            deadline = self.next_deadline
+            if deadline is None or deadline > now:
+                return results
+            _, _, key = heapq.heappop(self._heap)
+            _, _, callback = self._live.pop(key)
+            self.fired += 1
+            result = callback()
+            if result is not None:
+                results.append(result)
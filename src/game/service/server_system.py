@@ -0,0 +1,326 @@
+import asyncio
+import os
+import re
+from typing import Callable, Optional
+from game.service.game_state import GameState
+from game.service.save_codec import SAVE_CODECS
+from game.utils.selection import parse_plots
+
+FARM_NAME = re.compile(r"^[A-Za-z0-9_-]{1,32}$")
+
+HELP = (
+    "commands: farm <name> | status | plant <plots> <crop> | harvest [plots]"
+    " | next_day"
+    " | sleep | nap | buy <item_or_seed> | fish | sell_fish | help | quit"
+)
+
+
+class GameSession:
+    """One farm hosted by the server. Commands from every client attached to
+    the farm go through a single queue, so they never interleave."""
+
+    def __init__(self, name: str, game: GameState, guest: bool = False):
+        self.name = name
+        self.game = game
+        # Guest farms live only as long as their client and are never saved.
+        self.guest = guest
+        self.clients = 0
+        # Called with (command, response) after every command.
+        self.listeners: list[Callable[[str, str], None]] = []
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, command: str) -> str:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((command, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            command, future = await self.queue.get()
+            try:
+                with self.game.clock.frame():
+                    response = self.execute(command)
+            except Exception as e:
+                response = f"ERR {e}"
+            for listener in self.listeners:
+                listener(command, response)
+            if not future.done():
+                future.set_result(response)
+
+    def close(self):
+        self.task.cancel()
+
+    def execute(self, command: str) -> str:
+        game = self.game
+        parts = command.split()
+        if not parts:
+            return "ERR empty command"
+
+        name, args = parts[0].lower(), parts[1:]
+        game.tick()
+
+        if name == "status":
+            return "OK " + self.status()
+        elif name == "help":
+            return "OK " + HELP
+        elif name in ("plant", "harvest", "fish") and not game.can_work():
+            return "ERR It's too dark to work without a lantern!"
+        elif name == "plant":
+            if len(args) != 2:
+                return "ERR usage: plant <plots> <crop>, plots like 3, 1-9 or all"
+            if args[0].isdigit():
+                success, message = game.plant(int(args[0]) - 1, args[1].lower())
+            else:
+                try:
+                    plots = parse_plots(args[0], len(game.farm.plots))
+                except ValueError as e:
+                    return f"ERR {e}"
+                success, message = game.plant_many(args[1].lower(), plots)
+            return f"{'OK' if success else 'ERR'} {message}"
+        elif name == "harvest":
+            if len(args) > 1:
+                return "ERR usage: harvest [plots]"
+            try:
+                plots = parse_plots(args[0], len(game.farm.plots)) if args else None
+            except ValueError as e:
+                return f"ERR {e}"
+            had_stamina, value = game.harvest(plots)
+            if not had_stamina:
+                return "ERR Not enough stamina!"
+            return f"OK harvested ${value}"
+        elif name == "next_day":
+            success, message = game.next_day()
+            if not success:
+                return "ERR Not enough stamina!"
+            return f"OK day {game.time_system.day}" + (
+                f" | {message}" if message else ""
+            )
+        elif name == "sleep":
+            if not game.can_sleep():
+                return "ERR You can only sleep at night… try taking a nap."
+            message = game.sleep()
+            return f"OK day {game.time_system.day}" + (
+                f" | {message}" if message else ""
+            )
+        elif name == "nap":
+            game.nap()
+            return f"OK {game.day_cycle_system.get_current_part()}"
+        elif name == "buy":
+            if len(args) != 1:
+                return "ERR usage: buy <item_or_seed>"
+            if not game.merchant_available:
+                return "ERR Joji only trades in the morning."
+            if args[0] in game.merchant_system.seeds:
+                message = game.buy_seed(args[0])
+            else:
+                message = game.buy_item(args[0])
+            failed = message is None or any(
+                kw in message.lower() for kw in ("invalid", "not enough", "already")
+            )
+            return f"{'ERR' if failed else 'OK'} {message}"
+        elif name == "fish":
+            if not game.fishing_unlocked:
+                return "ERR You need a fishing rod."
+            message = game.fish()
+            return f"{'ERR' if message.startswith('Not enough') else 'OK'} {message}"
+        elif name == "sell_fish":
+            return f"OK {game.sell_fish()}"
+
+        return f"ERR unknown command {name!r}, try 'help'"
+
+    def status(self) -> str:
+        game = self.game
+        plots = game.farm.plots
+        planted = sum(1 for plot in plots if not plot.is_empty)
+        ready = game.farm.ready_count()
+        return (
+            f"farm={self.name} day={game.time_system.day}"
+            f" part={game.day_cycle_system.get_current_part()}"
+            f" season={game.day_cycle_system.get_season()}"
+            f" weather={game.weather_system.get_weather()}"
+            f" money={game.player.money}"
+            f" stamina={game.player.stamina}/{game.player.max_stamina}"
+            f" plots={len(plots)} planted={planted} ready={ready}"
+        )
+
+
+class GameServer:
+    """Hosts many farms in one process behind a line-oriented TCP/Unix socket.
+
+    Each line a client sends is one command and gets exactly one "OK ..." or
+    "ERR ..." line back. Farms are loaded on first attach and, with a save
+    directory, saved and unloaded when their last client disconnects.
+    """
+
+    def __init__(self, save_dir: Optional[str] = None, save_format: str = "json"):
+        self.save_dir = save_dir
+        self.save_format = save_format
+        self.sessions: dict[str, GameSession] = {}
+        self.guest_count = 0
+
+    def save_file(self, name: str) -> Optional[str]:
+        if not self.save_dir:
+            return None
+        return os.path.join(
+            self.save_dir, name + SAVE_CODECS[self.save_format].EXTENSION
+        )
+
+    def has_farm(self, name: str) -> bool:
+        """Whether the farm is hosted right now or has a save to load."""
+        if name in self.sessions:
+            return True
+        save_file = self.save_file(name)
+        return save_file is not None and os.path.exists(save_file)
+
+    def attach(self, name: str, guest: bool = False) -> GameSession:
+        session = self.sessions.get(name)
+        if session is None:
+            save_file = None if guest else self.save_file(name)
+            game = GameState(save_format=self.save_format, save_file=save_file)
+            if self.save_dir and not guest:
+                game.load()
+                game.enable_journal()
+            session = self.sessions[name] = GameSession(name, game, guest)
+        session.clients += 1
+        return session
+
+    def detach(self, session: GameSession):
+        session.clients -= 1
+        if session.clients > 0:
+            return
+
+        if self.save_dir and not session.guest:
+            session.game.save()
+            session.game.journal.close()
+        session.close()
+        del self.sessions[session.name]
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        session: Optional[GameSession] = None
+        writer.write(b"OK terminal-farm ready, try 'help'\n")
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Over the reader's limit; the rest of it would arrive
+                    # as commands of its own, so hang up.
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+
+                command = line.decode(errors="replace").strip()
+                if not command:
+                    continue
+
+                parts = command.split()
+                if parts[0].lower() == "quit":
+                    writer.write(b"OK bye\n")
+                    break
+                elif parts[0].lower() == "farm":
+                    if len(parts) != 2 or not FARM_NAME.match(parts[1]):
+                        response = "ERR usage: farm <name> (letters, digits, - and _)"
+                    else:
+                        if session is not None:
+                            self.detach(session)
+                        session = self.attach(parts[1])
+                        response = "OK " + session.status()
+                else:
+                    if session is None:
+                        # FARM_NAME has no ':', so no client can pick a
+                        # guest's farm with `farm`.
+                        self.guest_count += 1
+                        session = self.attach(f"guest:{self.guest_count}", guest=True)
+                    response = await session.submit(command)
+
+                writer.write(response.encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if session is not None:
+                self.detach(session)
+            writer.close()
+
+    async def handle_metrics(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """A minimal HTTP/1.1 responder for Prometheus scrapes of /metrics."""
+        from game.utils.metrics import METRICS
+
+        try:
+            request = await reader.readline()
+            while (await reader.readline()).strip():
+                pass
+            parts = request.decode(errors="replace").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                status = "200 OK"
+                body = METRICS.to_prometheus().encode()
+            else:
+                status = "404 Not Found"
+                body = b"try /metrics\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def watch_metrics(self):
+        from game.utils.metrics import METRICS
+
+        METRICS.gauge("farms", lambda: len(self.sessions))
+        METRICS.gauge("clients", lambda: sum(s.clients for s in self.sessions.values()))
+
+    async def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7777,
+        unix_path: Optional[str] = None,
+        metrics_port: Optional[int] = None,
+        http_port: Optional[int] = None,
+        web_dir: Optional[str] = None,
+    ):
+        if self.save_dir:
+            os.makedirs(self.save_dir, exist_ok=True)
+
+        if http_port is not None:
+            from game.service.http_system import FarmApi
+
+            api = FarmApi(self, web_dir)
+            http_server = await asyncio.start_server(api.handle, host, http_port)
+            print(f"Serving the web API on http://{host}:{http_port}/")
+
+        if metrics_port is not None:
+            self.watch_metrics()
+            metrics_server = await asyncio.start_server(
+                self.handle_metrics, host, metrics_port
+            )
+            print(f"Serving metrics on http://{host}:{metrics_port}/metrics")
+
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, unix_path)
+            print(f"Serving farms on unix:{unix_path}")
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+            print(f"Serving farms on {host}:{port}")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if metrics_port is not None:
+                metrics_server.close()
+            if http_port is not None:
+                http_server.close()
+                api.close()
@@ -0,0 +1,111 @@
+import time
+from typing import Any, Callable, Optional, Tuple
+from game.interfaces.player_policy import IPlayerPolicy
+from game.service.game_state import GameState
+from game.utils.clock import FakeClock
+
+
+class SimulationReport:
+    def __init__(self, days: int, actions: int, elapsed: float, game: GameState):
+        self.days = days
+        self.actions = actions
+        self.elapsed = elapsed
+        self.final_day = game.time_system.day
+        self.money = game.player.money
+        self.fishing_unlocked = game.fishing_unlocked
+        self.unlocked_crops = list(game.crop_system.unlocked_crops)
+
+    @property
+    def days_per_second(self) -> float:
+        return self.days / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def actions_per_second(self) -> float:
+        return self.actions / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "days": self.days,
+            "actions": self.actions,
+            "elapsed": self.elapsed,
+            "days_per_second": self.days_per_second,
+            "actions_per_second": self.actions_per_second,
+            "final_day": self.final_day,
+            "money": self.money,
+            "fishing_unlocked": self.fishing_unlocked,
+            "unlocked_crops": self.unlocked_crops,
+        }
+
+
+class HeadlessRunner:
+    """Drives a GameState through a policy without any terminal I/O.
+
+    Game time runs on a FakeClock and only moves when the policy sleeps: every
+    night advances it by SECONDS_PER_DAY, so crops planted during the day are
+    ready next morning, the same as after a full in-game day cycle. A game
+    passed in should be built with a FakeClock as well.
+    """
+
+    SECONDS_PER_DAY = 12 * 60
+    MAX_ACTIONS_PER_DAY = 200
+
+    def __init__(
+        self,
+        policy: IPlayerPolicy,
+        game: Optional[GameState] = None,
+        seed: Optional[int] = None,
+    ):
+        self.policy = policy
+        self.game = game or GameState(clock=FakeClock(), seed=seed)
+        self.actions = 0
+
+    def run(
+        self, days: int, on_day: Optional[Callable[[GameState], None]] = None
+    ) -> SimulationReport:
+        start_day = self.game.time_system.day
+        target_day = start_day + days
+        started = time.perf_counter()
+        self.game.event_system.queue_days(days)
+
+        while self.game.time_system.day < target_day:
+            for _ in range(self.MAX_ACTIONS_PER_DAY):
+                action = self.policy.decide(self.game)
+                self.perform(action)
+                if action[0] == "sleep":
+                    break
+            else:
+                self.perform(("sleep",))
+            if on_day is not None:
+                on_day(self.game)
+
+        elapsed = time.perf_counter() - started
+        return SimulationReport(
+            self.game.time_system.day - start_day, self.actions, elapsed, self.game
+        )
+
+    def perform(self, action: Tuple[Any, ...]) -> Optional[Any]:
+        self.actions += 1
+        kind = action[0]
+
+        if kind == "plant":
+            return self.game.plant(action[1], action[2])
+        elif kind == "harvest":
+            return self.game.harvest()
+        elif kind == "fish":
+            return self.game.fish()
+        elif kind == "sell_fish":
+            return self.game.sell_fish()
+        elif kind == "buy_seed":
+            return self.game.buy_seed(action[1])
+        elif kind == "buy_item":
+            return self.game.buy_item(action[1])
+        elif kind == "sleep":
+            day = self.game.time_system.day
+            message = self.game.sleep()
+            if self.game.time_system.day == day:
+                # Too tired to advance the day, the sleep above only restored stamina.
+                message = self.game.sleep()
+            self.game.clock.advance(self.SECONDS_PER_DAY)
+            return message
+
+        raise ValueError(f"Unknown action: {kind}")
@@ -1,8 +1,11 @@
-from interfaces.game_system import IGameSystem
+from game.interfaces.game_system import IGameSystem
 from typing import Any
+from game.utils.tracking import Tracked
 
 
-class TimeSystem(IGameSystem):
+class TimeSystem(Tracked, IGameSystem):
+    TRACKED = frozenset(("day",))
+
     def __init__(self):
         self.day = 1
 
@@ -1,29 +1,185 @@
-from datetime import datetime
-from service.game_state import GameState
+import getpass
+import io
+import os
+import re
+import select
 import time
 import sys
-from utils.constants import TUIConstants
+from contextlib import redirect_stdout
+from typing import Any, Callable, Hashable, Optional
+from game.service.game_state import GameState
+from game.service.input_system import KeyReader
+from game.service.render_system import ScreenRenderer
+from game.utils.constants import TUIConstants
+from game.utils.selection import parse_plots
+
+ANSI_ESCAPE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
 
 
 class TerminalUI:
     MENU_COOLDOWN_TIME = 2.6
+    FPS = 4
     SPACE_BETWEEN_CROP_INFO = " " * 3
 
     def display_status(self):
         weather = self.game.weather_system.get_weather()
+        header_width = self.last_box_width if hasattr(self, "last_box_width") else 50
+        print(
+            self._component(
+                "status",
+                (self.game.player.money, weather, header_width),
+                lambda: self._render_status(weather, header_width),
+            )
+        )
+
+    def _render_status(self, weather: str, header_width: int) -> str:
         weather_icon = TUIConstants.WEATHER_ICONS.get(weather, "")
         money_text = f"💰 Money: ${self.game.player.money}"
         weather_text = f"Weather: {weather_icon}  {weather.capitalize()}"
-
-        header_width = self.last_box_width if hasattr(self, "last_box_width") else 50
         content = f"{money_text}   {weather_text}"
 
-        print(self.color_text("═" * header_width, "bright_cyan"))
-        print(content)
-        print(self.color_text("═" * header_width, "bright_cyan"))
+        return "\n".join(
+            [
+                self.color_text("═" * header_width, "bright_cyan"),
+                content,
+                self.color_text("═" * header_width, "bright_cyan"),
+            ]
+        )
 
-    def display_farm(self):
-        self.clear_screen()
+    def display_farm(self, with_actions: bool = False):
+        self.present(lambda: self._farm_screen(with_actions))
+
+    def _farm_screen(self, with_actions: bool = False):
+        self._display_farm()
+        if with_actions:
+            self.display_actions()
+
+    def present(self, render: Callable[[], None], prompt: str = ""):
+        """Compose one frame from `render`, the live toasts and `prompt` and
+        hand it to the renderer, which only repaints what changed."""
+        started = time.perf_counter()
+        frame = io.StringIO()
+        with self.game.clock.frame(), redirect_stdout(frame):
+            for message in self.game.tick():
+                self.toast(message, "bright_cyan")
+            render()
+            if self.overlay:
+                self._display_overlay()
+            self._display_toasts()
+            print(prompt, end="")
+        self.renderer.present(frame.getvalue(), started)
+
+    def toast(self, message: str, color: str = "green", seconds: float = 0):
+        """Show `message` under the screen for a while without blocking."""
+        expires = time.monotonic() + (seconds or self.MENU_COOLDOWN_TIME)
+        self.toasts.append((expires, message, color))
+
+    def _display_toasts(self):
+        now = time.monotonic()
+        self.toasts = [toast for toast in self.toasts if toast[0] > now]
+        if self.toasts:
+            print()
+        for _, message, color in self.toasts:
+            print(self.color_text(message, color))
+
+    def toggle_overlay(self):
+        """Show or hide the profiler overlay. Profiling switched on here is
+        switched off again with the overlay, so hidden it costs nothing."""
+        from game.service.profiling_system import PROFILER
+
+        self.overlay = not self.overlay
+        if self.overlay and not PROFILER.enabled:
+            PROFILER.enable()
+            self._overlay_profiling = True
+        elif not self.overlay and self._overlay_profiling:
+            PROFILER.disable()
+            self._overlay_profiling = False
+        if self.overlay:
+            self.watch_metrics()
+
+    def watch_metrics(self):
+        from game.service.profiling_system import PROFILER
+
+        PROFILER.watch_game(self.game)
+        gauge = PROFILER.metrics.gauge
+        gauge("frames", lambda: self.renderer.frames)
+        gauge("last_frame_bytes", lambda: self.renderer.last_frame_bytes)
+        gauge("last_frame_ms", lambda: self.renderer.last_frame_time * 1000)
+
+    def _display_overlay(self, limit: int = 8):
+        from game.service.profiling_system import PROFILER
+
+        print(self.color_text("\n── profiler (d to hide) " + "─" * 38, "gray"))
+        print(
+            self.color_text(
+                f"{'call':<32} {'calls':>7} {'mean ms':>8} {'max ms':>8} {'total s':>8}",
+                "gray",
+            )
+        )
+        for name, timer in PROFILER.metrics.slowest(limit):
+            print(
+                f"{name[:32]:<32} {timer.count:>7} {timer.mean * 1000:>8.3f} "
+                f"{timer.max * 1000:>8.3f} {timer.total:>8.3f}"
+            )
+        stats = self.renderer.stats()
+        print(
+            self.color_text(
+                f"frames {stats['frames']}  last {stats['last_frame_ms']:.1f} ms"
+                f"  {stats['last_frame_bytes']} B  avg {stats['avg_frame_bytes']:.0f} B",
+                "gray",
+            )
+        )
+
+    def _frame_timeout(self) -> Optional[float]:
+        # Only animate while something on screen changes over time.
+        if self.toasts or self.game.farm.next_ready_at() is not None:
+            return self.frame_interval
+        return self.game.scheduler.seconds_until_next()
+
+    def ask(self, prompt: str, render: Callable[[], None], line: bool = False) -> str:
+        """Redraw `render` at the frame rate until the player answers.
+
+        In raw mode a single key answers at once; with `line=True` keys are
+        collected until Enter. Without a terminal this reads a whole line.
+        """
+        if not self.keys.raw:
+            return self._ask_line(prompt, render)
+
+        buffer = ""
+        while True:
+            self.present(render, prompt + buffer)
+            key = self.keys.read_key(self._frame_timeout())
+            if key is None:
+                continue
+            if not line:
+                return key
+            if key in ("\r", "\n"):
+                return buffer.strip()
+            elif key in ("\x7f", "\b"):
+                buffer = buffer[:-1]
+            elif key.isprintable():
+                buffer += key
+
+    def _ask_line(self, prompt: str, render: Callable[[], None]) -> str:
+        self.present(render)
+        if os.name == "nt" or not sys.stdin.isatty():
+            return input(prompt).strip()
+
+        # Sleep until the next game deadline or a line of input.
+        print(prompt, end="", flush=True)
+        while True:
+            timeout = self.game.scheduler.seconds_until_next()
+            readable, _, _ = select.select([sys.stdin], [], [], timeout)
+            if readable:
+                line = sys.stdin.readline()
+                if not line:
+                    raise EOFError
+                return line.strip()
+
+            self.present(render)
+            print(prompt, end="", flush=True)
+
+    def _display_farm(self):
         self.display_header()
         self.display_status()
 
@@ -38,9 +194,16 @@ class TerminalUI:
                 if crop:
                     bg_color = "green" if progress >= 1.0 else "yellow_pastel"
                     fg_color = "white" if progress >= 1.0 else "gray"
+                    filled = int(progress * 7)
+                    bar_text = (
+                        f" {'━' * filled}{'─' * (7 - filled)} "
+                        if progress < 1.0
+                        else ""
+                    )
                 else:
                     bg_color = "orange"
                     fg_color = "white"
+                    bar_text = ""
                 slot_text = str(plot_idx + 1).center(9)
                 content_text = crop.name[:7].center(9) if crop else "Empty".center(9)
                 spacer = " "
@@ -51,7 +214,9 @@ class TerminalUI:
                 row_lines[1] += (
                     self.bg_color_text(content_text, fg_color, bg_color) + spacer
                 )
-                row_lines[2] += self.bg_color_text(" " * 9, fg_color, bg_color) + spacer
+                row_lines[2] += (
+                    self.bg_color_text(bar_text.ljust(9), fg_color, bg_color) + spacer
+                )
 
             for line in row_lines:
                 print(line)
@@ -62,10 +227,29 @@ class TerminalUI:
         bg = TUIConstants.BG_COLORS.get(bg_color, "")
         return f"{bg}{fg}{text}{TUIConstants.COLORS['reset']}"
 
-    def __init__(self, game_state: GameState):
+    def __init__(self, game_state: GameState, fps: float = FPS):
         self.game = game_state
+        self.frame_interval = 1 / fps
+        self.keys = KeyReader()
+        self.toasts: list[tuple[float, str, str]] = []
+        self.renderer = ScreenRenderer()
+        self.username = getpass.getuser()
+        self._components: dict[str, tuple[Hashable, Any]] = {}
+        self.overlay = False
+        self._overlay_profiling = False
+
+    def _component(self, name: str, key: Hashable, render: Callable[[], Any]) -> Any:
+        """Return the cached render of a UI component while its key is unchanged."""
+        cached = self._components.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        value = render()
+        self._components[name] = (key, value)
+        return value
 
     def clear_screen(self):
+        self.renderer.invalidate()
         print("\033[H\033[J")
 
     def color_text(self, text: str, color: str) -> str:
@@ -74,10 +258,7 @@ class TerminalUI:
         )
 
     def strip_ansi(self, text: str) -> str:
-        import re
-
-        ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
-        return ansi_escape.sub("", text)
+        return ANSI_ESCAPE.sub("", text)
 
     def display_stamina(self, stamina: float, max_stamina: int) -> str:
         full_hearts = int(stamina)
@@ -93,7 +274,7 @@ class TerminalUI:
         return " ".join(hearts)
 
     def get_greeting(self) -> str:
-        hour = datetime.now().hour
+        hour = self.game.clock.now().hour
         if 5 <= hour < 12:
             return "Good morning"
         elif 12 <= hour < 17:
@@ -118,20 +299,31 @@ class TerminalUI:
         return f"\n{self.color_text(message, 'bright_cyan')} {cancel_text}"
 
     def display_header(self):
-        message = self.game.day_cycle_system.update()
-        if message:
-            print(self.color_text(message, "bright_cyan"))
-        import getpass
-
-        username = getpass.getuser()
-        greeting = self.get_greeting()
-        stamina_display = self.display_stamina(
-            self.game.player.stamina, self.game.player.max_stamina
+        key = (
+            self.get_greeting(),
+            self.game.player.stamina,
+            self.game.player.max_stamina,
+            self.game.time_system.day,
+            self.game.day_cycle_system.get_current_part(),
         )
+        header, self.last_box_width = self._component(
+            "header", key, lambda: self._render_header(*key)
+        )
+        print(header)
+
+    def _render_header(
+        self,
+        greeting: str,
+        stamina: float,
+        max_stamina: int,
+        day: int,
+        current_part: str,
+    ) -> tuple[str, int]:
+        username = self.username
+        stamina_display = self.display_stamina(stamina, max_stamina)
         season = self.game.day_cycle_system.get_season().capitalize()
-        current_part = self.game.day_cycle_system.get_current_part().capitalize()
+        current_part = current_part.capitalize()
         season_icon = self.get_season_icon()
-        day = self.game.time_system.day
 
         TITLE_LINE_LEFT = "🌱 TERMINAL FARM"
         TITLE_LINE_RIGHT = f"Day {day} ({current_part}) {season_icon} {season}"
@@ -158,23 +350,28 @@ class TerminalUI:
         padding = (BOX_WIDTH - 4) - len(self.strip_ansi(stamina_text))
         stamina_line = f"{self.color_text('║', 'bright_cyan')}  {stamina_text}{' ' * padding}  {self.color_text('║', 'bright_cyan')}"
 
-        print(self.color_text(f"╔{BOX_BORDER_HORIZONTAL}╗", "bright_cyan"))
-        print(title_line)
-        print(self.color_text(f"╠{BOX_BORDER_HORIZONTAL}╣", "bright_cyan"))
-        print(greeting_line)
-        print(stamina_line)
-        self.last_box_width = BOX_WIDTH
-        print(self.color_text(f"╚{BOX_BORDER_HORIZONTAL}╝", "bright_cyan"))
+        lines = [
+            self.color_text(f"╔{BOX_BORDER_HORIZONTAL}╗", "bright_cyan"),
+            title_line,
+            self.color_text(f"╠{BOX_BORDER_HORIZONTAL}╣", "bright_cyan"),
+            greeting_line,
+            stamina_line,
+            self.color_text(f"╚{BOX_BORDER_HORIZONTAL}╝", "bright_cyan"),
+        ]
+        return "\n".join(lines), BOX_WIDTH
 
     def plant_crop_menu(self):
-        self.display_farm()
         unlocked = self.game.crop_system.get_unlocked_crops()
-        self._display_crop_menu()
 
-        choice = input(
+        def render():
+            self._display_farm()
+            self._display_crop_menu()
+
+        choice = self.ask(
             self.display_action_message(
                 message="Choose crop to plant", cancellable=True
-            )
+            ),
+            render,
         )
         if choice == "0":
             return
@@ -182,44 +379,54 @@ class TerminalUI:
         try:
             crop = unlocked[int(choice) - 1]
         except (ValueError, IndexError):
-            input(f"{self.color_text('Invalid choice!', 'red')} Press Enter...")
+            self.toast("Invalid choice!", "red")
             return
 
         if not self.game.player.has_stamina(crop.stamina_cost):
-            input(f"{self.color_text('Not enough stamina!', 'red')} Press Enter...")
+            self.toast("Not enough stamina!", "red")
             return
 
         if not self.game.player.can_afford(crop.cost):
-            input(f"{self.color_text('Not enough money!', 'red')} Press Enter...")
+            self.toast("Not enough money!", "red")
             return
 
-        print(f"\n{self.color_text('Farm Layout:', 'bright_green')}")
-        for i in range(0, 9, 3):
-            print(f"{self.color_text(f'{i + 1}-{i + 3}', 'cyan')} ", end="")
-        print("\n")
+        def render_plots():
+            self._display_farm()
+            print(f"{self.color_text('Farm Layout:', 'bright_green')}")
+            for i in range(0, 9, 3):
+                print(f"{self.color_text(f'{i + 1}-{i + 3}', 'cyan')} ", end="")
+            print()
 
         try:
             plot = (
-                int(input(f"{self.color_text('Choose plot', 'bright_cyan')} (1-9): "))
+                int(
+                    self.ask(
+                        f"{self.color_text('Choose plot', 'bright_cyan')} (1-9): ",
+                        render_plots,
+                    )
+                )
                 - 1
             )
             if plot < 0 or plot > 8 or not self.game.farm.plots[plot].is_empty:
                 raise ValueError
         except ValueError:
-            input(
-                f"{self.color_text('Invalid or occupied plot!', 'red')} Press Enter..."
-            )
+            self.toast("Invalid or occupied plot!", "red")
             return
 
-        self.game.player.spend_money(crop.cost)
-        self.game.player.use_stamina(crop.stamina_cost)
-        self.game.farm.plant_crop(plot, crop)
+        crop_name = self.game.crop_system.unlocked_crops[int(choice) - 1]
+        success, message = self.game.plant(plot, crop_name)
+        self.toast(message, "green" if success else "red")
+
+    def _display_crop_menu(self):
         print(
-            f"\n{self.color_text(f'Planted {crop.name} in plot {plot + 1}!', 'green')}"
+            self._component(
+                "crop_menu",
+                tuple(self.game.crop_system.unlocked_crops),
+                self._render_crop_menu,
+            )
         )
-        time.sleep(self.MENU_COOLDOWN_TIME)
 
-    def _display_crop_menu(self):
+    def _render_crop_menu(self) -> str:
         unlocked = self.game.crop_system.get_unlocked_crops()
         max_name = max(
             len(c.name.replace(" [Rare]", "").replace(" [rare]", "")) for c in unlocked
@@ -229,292 +436,254 @@ class TerminalUI:
         max_stamina = max(len(f"{c.stamina_cost} ♥") for c in unlocked)
         max_time = max(len(f"{c.growth_time}s") for c in unlocked)
 
-        print(self.color_text("Available Crops:", "bright_blue"))
+        lines = [self.color_text("Available Crops:", "bright_blue")]
         for i, c in enumerate(unlocked, 1):
             name = c.name.replace(" [Rare]", "").replace(" [rare]", "").capitalize()
             rare = (
                 self.color_text(" [Rare]", "orange") if "rare" in c.name.lower() else ""
             )
-            print(
+            lines.append(
                 f"{self.color_text(f'{i}.', 'white')} {self.color_text(name.ljust(max_name), c.color)}{self.SPACE_BETWEEN_CROP_INFO}"
                 f"💰 Cost: {self.color_text(f'${c.cost}'.ljust(max_cost), 'yellow')}{self.SPACE_BETWEEN_CROP_INFO}"
                 f"💵 Sell: {self.color_text(f'${c.value}'.ljust(max_value), 'bright_yellow')}{self.SPACE_BETWEEN_CROP_INFO}"
                 f"❤️  Stamina: {self.color_text(f'{c.stamina_cost} ♥'.ljust(max_stamina), 'pink')}{self.SPACE_BETWEEN_CROP_INFO}"
                 f"⏱️  Time: {f'{c.growth_time}s'.ljust(max_time)}{rare}"
             )
+        return "\n".join(lines)
+
+    def harvest_menu(self, plot_indices: Optional[list[int]] = None):
+        had_stamina, harvested_value = self.game.harvest(plot_indices)
+        if not had_stamina:
+            self.toast("Not enough stamina!", "red")
+        elif harvested_value > 0:
+            self.toast(f"Harvested crops worth ${harvested_value}!")
+        else:
+            self.toast("Nothing ready to harvest yet!", "yellow")
+
+    def quick_command(self, command: str):
+        """`p <crop> [plots]` plants every empty plot of a selection such as
+        1-9 at once, `h [plots]` harvests one. Plots default to all."""
+        words = command.split()
+        planting = words[0] == "p"
+        if len(words) == 1:
+            usage = "Plant <crop> [plots]:" if planting else "Harvest [plots]:"
+            rest = self.ask(
+                self.display_action_message(True, usage),
+                lambda: self._farm_screen(True),
+                line=True,
+            )
+            words += rest.lower().split()
 
-    def harvest_menu(self):
-        if not self.game.player.has_stamina(0.5):
-            input(f"{self.color_text('Not enough stamina!', 'red')} Press Enter...")
+        args = words[1:]
+        if args[:1] == ["0"]:
+            return
+        size = len(self.game.farm.plots)
+        try:
+            if planting:
+                if not 1 <= len(args) <= 2:
+                    raise ValueError("Usage: p <crop> [plots], like p wheat 1-9")
+                plots = parse_plots(args[1] if len(args) == 2 else "all", size)
+            else:
+                if len(args) > 1:
+                    raise ValueError("Usage: h [plots], like h 1-9")
+                plots = parse_plots(args[0] if args else "all", size)
+        except ValueError as e:
+            self.toast(str(e), "red")
             return
 
-        harvested_value = self.game.farm.harvest_ready_crops()
-
-        if harvested_value > 0:
-            self.game.player.earn_money(harvested_value)
-            self.game.player.use_stamina(0.5)
-            print(
-                f"{self.color_text(f'Harvested crops worth ${harvested_value}!', 'green')}"
-            )
+        if planting:
+            success, message = self.game.plant_many(args[0], plots)
+            self.toast(message, "green" if success else "red")
         else:
-            print(f"{self.color_text('Nothing ready to harvest yet!', 'yellow')}")
-        time.sleep(self.MENU_COOLDOWN_TIME)
+            self.harvest_menu(plots)
 
     def sleep_menu(self):
-        self.clear_screen()
-        print(f"{self.color_text('😴 Sleep Options', 'bright_blue')}\n")
-        print(
-            f"{self.color_text('1.', 'cyan')} Sleep until next day {self.color_text(f'(Recover all {TUIConstants.EMOJI_HEART})', 'cyan')}"
-        )
-        print(
-            f"{self.color_text('2.', 'cyan')} Take a nap (advance time) {self.color_text(f'(+1 {TUIConstants.EMOJI_HEART})', 'cyan')}"
-        )
+        def render():
+            print(f"{self.color_text('😴 Sleep Options', 'bright_blue')}\n")
+            print(
+                f"{self.color_text('1.', 'cyan')} Sleep until next day {self.color_text(f'(Recover all {TUIConstants.EMOJI_HEART})', 'cyan')}"
+            )
+            print(
+                f"{self.color_text('2.', 'cyan')} Take a nap (advance time) {self.color_text(f'(+1 {TUIConstants.EMOJI_HEART})', 'cyan')}"
+            )
 
-        choice = input(self.display_action_message(cancellable=True))
+        choice = self.ask(self.display_action_message(cancellable=True), render)
         if choice == "1":
-            if not self.game.day_cycle_system.is_night() and not getattr(
-                self.game.player, "can_sleep_anytime", False
-            ):
-                print(
-                    self.color_text(
-                        "\nYou can only sleep at night… try taking a nap.", "red"
-                    )
-                )
-                time.sleep(self.MENU_COOLDOWN_TIME)
+            if not self.game.can_sleep():
+                self.toast("You can only sleep at night… try taking a nap.", "red")
                 return
-            _, message = self.game.next_day()
-            self.game.player.full_restore()
-            self.game.player.last_sleep_time = datetime.now()
+            message = self.game.sleep()
 
-            print(
-                self.color_text(
-                    "\nYou slept soundly and woke up refreshed the next day!",
-                    "bright_green",
-                )
+            self.toast(
+                "You slept soundly and woke up refreshed the next day!",
+                "bright_green",
             )
             if message:
-                print(f"{self.color_text('EVENT:', 'bright_blue')} {message}")
-            time.sleep(self.MENU_COOLDOWN_TIME)
+                self.toast(f"EVENT: {message}", "bright_blue")
         elif choice == "2":
-            self.game.player.restore_stamina(1)
+            self.game.nap()
+            self.toast(
+                f"You took a nap and time passed... (+1 {TUIConstants.EMOJI_HEART})"
+            )
 
-            self.game.day_cycle_system.current_part_index = (
-                self.game.day_cycle_system.current_part_index + 1
-            ) % len(self.game.day_cycle_system.PARTS)
-            self.game.day_cycle_system.last_update_time = datetime.now()
-            print(
-                self.color_text(
-                    f"\nYou took a nap and time passed... (+1 {TUIConstants.EMOJI_HEART})",
-                    "green",
-                )
+    def display_actions(self):
+        merchant_available = self.game.merchant_available
+        print(
+            self._component(
+                "actions",
+                (
+                    merchant_available,
+                    self.game.fishing_unlocked,
+                    self.game.player.has_farmdex,
+                ),
+                lambda: self._render_actions(merchant_available),
             )
-            time.sleep(self.MENU_COOLDOWN_TIME)
+        )
 
-    def start_game_loop(self):
-        while True:
-            self.display_farm()
-            print(self.color_text("Actions:", "bright_blue"))
+    def _render_actions(self, merchant_available: bool) -> str:
+        lines = [self.color_text("Actions:", "bright_blue")]
 
-            actions = []
-            actions.append(
-                f"{self.color_text('1.', 'cyan')} {self.color_text('Plant Crop', 'bright_green')}"
-            )
-            actions.append(
-                f"{self.color_text('2.', 'cyan')} {self.color_text('Harvest Crops', 'grey')}"
-            )
+        actions = []
+        actions.append(
+            f"{self.color_text('1.', 'cyan')} {self.color_text('Plant Crop', 'bright_green')}"
+        )
+        actions.append(
+            f"{self.color_text('2.', 'cyan')} {self.color_text('Harvest Crops', 'grey')}"
+        )
+        actions.append(
+            f"{self.color_text('3.', 'cyan')} {self.color_text('Next Day', 'grey')}"
+        )
+        actions.append(
+            f"{self.color_text('4.', 'cyan')} {self.color_text('Sleep/Rest', 'grey')}"
+        )
+        actions.append(
+            f"{self.color_text('5.', 'cyan')} {self.color_text('Save & Quit', 'grey')}"
+        )
+        actions.append(
+            f"{self.color_text('6.', 'cyan')} {self.color_text('Reset Game', 'red')}"
+        )
+
+        if merchant_available:
             actions.append(
-                f"{self.color_text('3.', 'cyan')} {self.color_text('Next Day', 'grey')}"
+                f"{self.color_text('7.', 'cyan')} {self.color_text('Joji the Merchant', 'bright_yellow')}"
             )
+
+        if self.game.fishing_unlocked:
             actions.append(
-                f"{self.color_text('4.', 'cyan')} {self.color_text('Sleep/Rest', 'grey')}"
+                f"{self.color_text('8.', 'cyan')} {self.color_text('Go Fishing', 'grey')}"
             )
+
+        if self.game.player.has_farmdex:
             actions.append(
-                f"{self.color_text('5.', 'cyan')} {self.color_text('Save & Quit', 'grey')}"
+                f"{self.color_text('9.', 'cyan')} {self.color_text('Farmdex', 'grey')}"
             )
-            actions.append(
-                f"{self.color_text('6.', 'cyan')} {self.color_text('Reset Game', 'red')}"
+
+        max_widths = [0, 0, 0]
+        for i, action in enumerate(actions):
+            col = i % 3
+            length = len(self.strip_ansi(action))
+            if length > max_widths[col]:
+                max_widths[col] = length
+
+        for i in range(0, len(actions), 3):
+            row = actions[i : i + 3]
+            padded_row = []
+            for j, action in enumerate(row):
+                col_width = max_widths[j]
+                raw = self.strip_ansi(action)
+                pad = col_width - len(raw)
+                padded_row.append(action + (" " * pad))
+            lines.append(" | ".join(padded_row))
+        lines.append(
+            self.color_text(
+                "p <crop> [plots] plants, h [plots] harvests, like p wheat 1-9", "grey"
             )
+        )
+        return "\n".join(lines)
 
-            if self.game.merchant_system.is_available(
-                self.game.day_cycle_system.get_current_part()
-            ):
-                actions.append(
-                    f"{self.color_text('7.', 'cyan')} {self.color_text('Joji the Merchant', 'bright_yellow')}"
-                )
+    def start_game_loop(self):
+        with self.keys:
+            while True:
+                self.handle_main_menu()
 
-            if self.game.merchant_system.fishing_unlocked:
-                actions.append(
-                    f"{self.color_text('8.', 'cyan')} {self.color_text('Go Fishing', 'grey')}"
-                )
+    def handle_main_menu(self):
+        choice = self.ask(
+            self.display_action_message(), lambda: self._farm_screen(True)
+        )
 
-            if self.game.player.has_farmdex:
-                actions.append(
-                    f"{self.color_text('9.', 'cyan')} {self.color_text('Farmdex', 'grey')}"
-                )
+        command = choice.lower()
+        quick = command.split()[:1] in (["p"], ["h"])
+        if (choice in ("1", "2", "8") or quick) and not self.game.can_work():
+            if choice != "8" or self.game.fishing_unlocked:
+                self.toast("It's too dark to work without a lantern!", "red")
+                return
 
-            max_widths = [0, 0, 0]
-            for i, action in enumerate(actions):
-                col = i % 3
-                length = len(self.strip_ansi(action))
-                if length > max_widths[col]:
-                    max_widths[col] = length
-
-            for i in range(0, len(actions), 3):
-                row = actions[i : i + 3]
-                padded_row = []
-                for j, action in enumerate(row):
-                    col_width = max_widths[j]
-                    raw = self.strip_ansi(action)
-                    pad = col_width - len(raw)
-                    padded_row.append(action + (" " * pad))
-                print(" | ".join(padded_row))
-
-            choice = input(self.display_action_message())
-
-            if choice == "1":
-                if (
-                    self.game.day_cycle_system.get_current_part() == "night"
-                    and not getattr(self.game.player, "has_lantern", False)
-                ):
-                    input(
-                        self.color_text(
-                            "It's too dark to work without a lantern!", "red"
-                        )
-                        + " Press Enter..."
-                    )
-                    continue
-                self.plant_crop_menu()
-            elif choice == "2":
-                if (
-                    self.game.day_cycle_system.get_current_part() == "night"
-                    and not getattr(self.game.player, "has_lantern", False)
-                ):
-                    input(
-                        self.color_text(
-                            "It's too dark to work without a lantern!", "red"
-                        )
-                        + " Press Enter..."
-                    )
-                    continue
-                self.harvest_menu()
-            elif choice == "3":
-                success, message = self.game.next_day()
-                if success:
-                    print(
-                        f"{self.color_text('Advanced to day', 'blue')} "
-                        f"{self.color_text(self.game.time_system.day, 'bright_blue')}!"
-                    )
-                    if message:
-                        print(f"{self.color_text('EVENT:', 'bright_blue')} {message}")
-                    time.sleep(self.MENU_COOLDOWN_TIME)
-                else:
-                    input(
-                        f"{self.color_text('Not enough stamina!', 'red')} Press Enter..."
-                    )
-            elif choice == "4":
-                self.sleep_menu()
-            elif choice == "5":
-                if self.game.save():
-                    print(f"\n{self.color_text('Game saved!', 'green')}")
-                    sys.exit()
-            elif choice == "6":
-                confirm = input(
-                    self.color_text("Are you sure you want to reset? (y/n): ", "red")
-                )
-                if confirm.lower() == "y":
-                    self.game.new_game()
-                    print(self.color_text("Game reset!", "green"))
-                    time.sleep(1)
-            elif choice == "7" and self.game.merchant_system.is_available(
-                self.game.day_cycle_system.get_current_part()
-            ):
-                self.merchant_menu()
-            elif choice == "8" and self.game.merchant_system.fishing_unlocked:
-                if (
-                    self.game.day_cycle_system.get_current_part() == "night"
-                    and not getattr(self.game.player, "has_lantern", False)
-                ):
-                    input(
-                        self.color_text(
-                            "It's too dark to work without a lantern!", "red"
-                        )
-                        + " Press Enter..."
-                    )
-                    continue
-                self.fishing_menu()
-            elif choice == "9" and self.game.player.has_farmdex:
-                self.farmdex_menu()
+        if quick:
+            self.quick_command(command)
+        elif choice == "1":
+            self.plant_crop_menu()
+        elif choice == "2":
+            self.harvest_menu()
+        elif choice == "3":
+            success, message = self.game.next_day()
+            if success:
+                self.toast(f"Advanced to day {self.game.time_system.day}!", "blue")
+                if message:
+                    self.toast(f"EVENT: {message}", "bright_blue")
             else:
-                print(f"{self.color_text('Invalid choice!', 'red')}")
-                time.sleep(self.MENU_COOLDOWN_TIME)
+                self.toast("Not enough stamina!", "red")
+        elif choice == "4":
+            self.sleep_menu()
+        elif choice == "5":
+            if self.game.save():
+                print(f"\n{self.color_text('Game saved!', 'green')}")
+                sys.exit()
+        elif choice == "6":
+            confirm = self.ask(
+                self.color_text("Are you sure you want to reset? (y/n): ", "red"),
+                lambda: self._farm_screen(True),
+            )
+            if confirm.lower() == "y":
+                self.game.new_game()
+                self.toast("Game reset!")
+        elif choice == "7" and self.game.merchant_available:
+            self.merchant_menu()
+        elif choice == "8" and self.game.fishing_unlocked:
+            self.fishing_menu()
+        elif choice == "9" and self.game.player.has_farmdex:
+            self.farmdex_menu()
+        elif choice.lower() == "d":
+            self.toggle_overlay()
+        else:
+            self.toast("Invalid choice!", "red")
 
     def farmdex_menu(self):
-        self.clear_screen()
-        print(self.color_text("🦖 Farmdex Collection", "bright_green"))
-        print(
-            self.color_text(
-                f"Fossils Discovered: {len(self.game.player.fossils_found)}/50", "cyan"
+        def render():
+            print(
+                self._component(
+                    "farmdex",
+                    self.game.collection_system["fossils"].bits,
+                    self._render_farmdex,
+                )
             )
-        )
-        print()
-        all_fossils = [
-            "Tyrannosaurus",
-            "Triceratops",
-            "Velociraptor",
-            "Brachiosaurus",
-            "Stegosaurus",
-            "Spinosaurus",
-            "Ankylosaurus",
-            "Parasaurolophus",
-            "Allosaurus",
-            "Diplodocus",
-            "Iguanodon",
-            "Archaeopteryx",
-            "Pteranodon",
-            "Deinonychus",
-            "Megalosaurus",
-            "Pachycephalosaurus",
-            "Corythosaurus",
-            "Oviraptor",
-            "Plateosaurus",
-            "Styracosaurus",
-            "Suchomimus",
-            "Troodon",
-            "Carnotaurus",
-            "Sauropelta",
-            "Albertosaurus",
-            "Mamenchisaurus",
-            "Edmontosaurus",
-            "Herrerasaurus",
-            "Giganotosaurus",
-            "Therizinosaurus",
-            "Kentrosaurus",
-            "Dilophosaurus",
-            "Coelophysis",
-            "Protoceratops",
-            "Sinraptor",
-            "Rugops",
-            "Lambeosaurus",
-            "Mononykus",
-            "Torosaurus",
-            "Rhabdodon",
-            "Ouranosaurus",
-            "Microceratus",
-            "Zuniceratops",
-            "Einiosaurus",
-            "Dromaeosaurus",
-            "Massospondylus",
-            "Lesothosaurus",
-            "Noasaurus",
-            "Gasparinisaura",
-            "Minmi",
+
+        self.ask(self.color_text("\n(Press Enter to return)", "white"), render)
+
+    def _render_farmdex(self) -> str:
+        fossils = self.game.collection_system["fossils"]
+        lines = [
+            self.color_text("🦖 Farmdex Collection", "bright_green"),
+            self.color_text(
+                f"Fossils Discovered: {fossils.count}/{len(fossils)}", "cyan"
+            ),
+            "",
         ]
         columns = 3
-        rows = (len(all_fossils) + columns - 1) // columns
+        rows = (len(fossils) + columns - 1) // columns
         fossil_entries = []
 
-        for name in all_fossils:
-            if name in self.game.player.fossils_found:
+        for i, name in enumerate(fossils.names):
+            if fossils.has_index(i):
                 fossil_entries.append(self.color_text(name, "bright_green"))
             else:
                 fossil_entries.append(self.color_text("?????", "gray"))
@@ -527,146 +696,88 @@ class TerminalUI:
                     entry = fossil_entries[idx]
                     entry_padded = entry + " " * (20 - len(self.strip_ansi(entry)))
                     line += entry_padded
-            print(line)
-        input(self.color_text("\n(Press Enter to return)", "white"))
+            lines.append(line)
+        return "\n".join(lines)
 
     def merchant_menu(self):
-        self.clear_screen()
-        print(self.color_text("🧙‍♂️ Joji, the Morning Merchant", "bright_yellow"))
-        print(self.color_text("═" * 40, "bright_cyan"))
-        print(self.color_text("Welcome! Take a look at my goods:", "white"))
-        print(self.color_text(f"\n💰 Money: ${self.game.player.money}", "white"))
-        print()
-
-        print(self.color_text("🌱 Seeds:", "bright_blue"))
-        for key, seed in self.game.merchant_system.inventory["seeds"].items():
-            already_unlocked = seed["crop"] in self.game.crop_system.unlocked_crops
-            item_name = self.color_text(key, "gray" if already_unlocked else "cyan")
-            unlock = self.color_text(f"(Unlocks {seed['crop'].capitalize()})", "grey")
-            inflated = (
-                hasattr(self.game, "market_inflated") and self.game.market_inflated
-            )
-            price_display = f"${seed['price'] * 2}" if inflated else f"${seed['price']}"
-            inflated_tag = self.color_text(" [INFLATED]", "red") if inflated else ""
-            print(f" - {item_name}: {price_display} {unlock}{inflated_tag}")
-
-        print()
-        print(self.color_text("🎁 Items:", "bright_blue"))
-        for key, item in self.game.merchant_system.inventory["items"].items():
-            already_owned = False
-            if (
-                item.get("unlocks") == "fishing"
-                and self.game.merchant_system.fishing_unlocked
-            ):
-                already_owned = True
-            elif (
-                item.get("effect") == "unlock_farmdex" and self.game.player.has_farmdex
-            ):
-                already_owned = True
-            elif item.get("effect") == "cosmetic":
-                already_owned = (
-                    hasattr(self.game.player, "bought_hat")
-                    and self.game.player.bought_hat
-                )
-            elif item.get("effect") == "unlock_night_work":
-                already_owned = getattr(self.game.player, "has_lantern", False)
-            elif (
-                item.get("effect") == "increase_event_chance"
-                and hasattr(self.game.player, "event_bonus")
-                and self.game.player.event_bonus == "lucky_egg"
-            ):
-                already_owned = True
-            elif (
-                item.get("effect") == "increase_max_stamina"
-                and self.game.player.max_stamina > 5
-            ):
-                already_owned = True
-            elif item.get("effect") == "cosmetic":
-                already_owned = (
-                    hasattr(self.game.player, "bought_hat")
-                    and self.game.player.bought_hat
-                )
-            elif item.get("effect") == "unlock_anytime_sleep":
-                already_owned = getattr(self.game.player, "can_sleep_anytime", False)
+        def render():
+            print(self.color_text("🧙‍♂️ Joji, the Morning Merchant", "bright_yellow"))
+            print(self.color_text("═" * 40, "bright_cyan"))
+            print(self.color_text("Welcome! Take a look at my goods:", "white"))
+            print(self.color_text(f"\n💰 Money: ${self.game.player.money}", "white"))
+            print()
 
-            item_name = self.color_text(key, "gray" if already_owned else "cyan")
-            if "unlocks" in item:
-                detail = self.color_text(
-                    f"(Unlocks {item['unlocks'].capitalize()})", "grey"
-                )
-            elif "effect" in item:
-                readable_effects = {
-                    "cosmetic": "Visual cosmetic item",
-                    "increase_event_chance": "Boosts daily events: 80% chance to occur each day!",
-                    "increase_max_stamina": "Double your max stamina",
-                    "unlock_night_work": "Allow you to work at night",
-                    "unlock_anytime_sleep": "Sleep anytime to recover stamina",
-                }
-                effect_description = readable_effects.get(item.get("effect", ""), "")
-                detail = (
-                    self.color_text(f"({effect_description})", "grey")
-                    if effect_description
-                    else ""
-                )
-            else:
-                detail = ""
-            inflated = (
-                hasattr(self.game, "market_inflated") and self.game.market_inflated
+            offers = self.game.merchant_system.offers().values()
+            inflated_tag = (
+                self.color_text(" [INFLATED]", "red")
+                if self.game.merchant_system.market_inflated
+                else ""
             )
-            price_display = f"${item['price'] * 2}" if inflated else f"${item['price']}"
-            inflated_tag = self.color_text(" [INFLATED]", "red") if inflated else ""
-            print(f" - {item_name}: {price_display} {detail}{inflated_tag}")
+            for kind, title in (("seed", "🌱 Seeds:"), ("item", "🎁 Items:")):
+                print(self.color_text(title, "bright_blue"))
+                for offer in offers:
+                    if offer.kind != kind:
+                        continue
+                    item_name = self.color_text(
+                        offer.key, "gray" if offer.owned else "cyan"
+                    )
+                    detail = (
+                        self.color_text(f"({offer.description})", "grey")
+                        if offer.description
+                        else ""
+                    )
+                    print(f" - {item_name}: ${offer.price} {detail}{inflated_tag}")
+                if kind == "seed":
+                    print()
 
-        choice = input(
+        choice = self.ask(
             self.display_action_message(
                 message="What would you like to buy?",
                 cancellable=True,
                 cancel_message=f"(type {self.color_text('item_key', 'cyan')} or '0' to cancel): ",
-            )
-        ).strip()
+            ),
+            render,
+            line=True,
+        )
 
         if choice == "0":
             return
-        narrative = False
-        item = None
-        if choice in self.game.merchant_system.inventory["seeds"]:
-            msg = self.game.merchant_system.buy_seed(choice)
-        elif choice in self.game.merchant_system.inventory["items"]:
-            item = self.game.merchant_system.inventory["items"][choice]
-            narrative = item.get("narrative", False)
-            msg = self.game.merchant_system.buy_item(choice)
-        else:
+        offer = self.game.merchant_system.offer(choice)
+        narrative = offer is not None and offer.narrative
+        if offer is None:
             msg = "Invalid option."
+        elif offer.kind == "seed":
+            msg = self.game.buy_seed(choice)
+        else:
+            msg = self.game.buy_item(choice)
 
         error_keywords = ["invalid", "not enough"]
         is_error = msg is None or any(kw in msg.lower() for kw in error_keywords)
 
         if is_error:
-            print(self.color_text(msg, "red"))
-            time.sleep(self.MENU_COOLDOWN_TIME)
+            self.toast(msg or "Invalid option.", "red")
         elif narrative:
-            print(self.color_text(msg, "green"))
-            input(self.color_text("\n(Press Enter to continue)", "white"))
+            self.ask(
+                self.color_text("\n(Press Enter to continue)", "white"),
+                lambda: print(self.color_text(msg, "green")),
+            )
         else:
-            print(self.color_text(msg, "green"))
-            time.sleep(self.MENU_COOLDOWN_TIME)
+            self.toast(msg)
 
     def fishing_menu(self):
-        self.clear_screen()
-        print(self.color_text("🎣 Fishing Spot\n", "bright_blue"))
-
-        print(
-            f"{self.color_text('1.', 'cyan')} Go fishing {self.color_text('(-2 ♥)', 'red')}"
-        )
-        print(f"{self.color_text('2.', 'cyan')} Sell all fish")
+        def render():
+            print(self.color_text("🎣 Fishing Spot\n", "bright_blue"))
+            print(
+                f"{self.color_text('1.', 'cyan')} Go fishing {self.color_text('(-2 ♥)', 'red')}"
+            )
+            print(f"{self.color_text('2.', 'cyan')} Sell all fish")
 
-        choice = input(self.display_action_message(cancellable=True))
+        choice = self.ask(self.display_action_message(cancellable=True), render)
         if choice == "1":
-            result = self.game.fishing_system.fish()
+            result = self.game.fish()
         elif choice == "2":
-            result = self.game.fishing_system.sell_all_fish()
+            result = self.game.sell_fish()
         else:
             return
 
-        print(self.color_text(result, "green"))
-        time.sleep(2)
+        self.toast(result)
@@ -1,17 +1,27 @@
 import random
-from interfaces.game_system import IGameSystem
-from typing import Any
+from game.interfaces.game_system import IGameSystem
+from typing import Any, Optional
+from game.utils.tracking import Tracked
 
 
-class WeatherSystem(IGameSystem):
+class WeatherSystem(Tracked, IGameSystem):
+    TRACKED = frozenset(("current_weather",))
     WEATHER_TYPES = ["sunny", "rainy", "cloudy", "windy"]
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.current_weather = "sunny"
+        self.rng = rng or random.Random()
 
     def update(self):
-        if random.random() < 0.2:
-            self.current_weather = random.choice(self.WEATHER_TYPES)
+        if self.rng.random() < 0.2:
+            self.current_weather = self.rng.choice(self.WEATHER_TYPES)
+
+    def advance(self, days: int):
+        """Same as calling update() `days` times, without the per-call overhead."""
+        rng, weather_types = self.rng, self.WEATHER_TYPES
+        for _ in range(days):
+            if rng.random() < 0.2:
+                self.current_weather = rng.choice(weather_types)
 
     def get_weather(self) -> str:
         return self.current_weather
@@ -20,7 +30,9 @@ class WeatherSystem(IGameSystem):
         return {"current_weather": self.current_weather}
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "WeatherSystem":
-        system = cls()
+    def from_dict(
+        cls, data: dict[str, Any], rng: Optional[random.Random] = None
+    ) -> "WeatherSystem":
+        system = cls(rng)
         system.current_weather = data["current_weather"]
         return system
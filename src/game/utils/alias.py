@@ -0,0 +1,33 @@
+from typing import Sequence
+
+
+class AliasTable:
+    """Vose's alias method: O(n) to build, then O(1) per weighted sample from
+    a single uniform draw."""
+
+    def __init__(self, weights: Sequence[float]):
+        total = float(sum(weights))
+        if not weights or total <= 0:
+            raise ValueError("AliasTable needs at least one positive weight")
+
+        n = len(weights)
+        scaled = [weight * n / total for weight in weights]
+        self.size = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding error and keeps prob=1.
+
+    def sample(self, u: float) -> int:
+        """Map a uniform draw in [0, 1) to an index."""
+        scaled = u * self.size
+        i = min(int(scaled), self.size - 1)
+        return i if scaled - i < self.prob[i] else self.alias[i]
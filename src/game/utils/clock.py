@@ -0,0 +1,93 @@
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+
+
+class GameClock:
+    """Source of "now" for the whole game.
+
+    Game time runs `speed` times faster than the wall clock (speed=60 makes one
+    game minute last one real second). Inside `frame()` the clock is frozen, so
+    everything rendered or updated in one tick sees the same instant.
+    """
+
+    def __init__(self, speed: float = 1.0):
+        self.speed = speed
+        self._wall_anchor = time.time()
+        self._game_anchor = self._wall_anchor
+        self._frozen: Optional[float] = None
+        self._frozen_now: Optional[datetime] = None
+        self._frame_depth = 0
+
+    def _read(self) -> float:
+        return self._game_anchor + (time.time() - self._wall_anchor) * self.speed
+
+    def time(self) -> float:
+        if self._frozen is not None:
+            return self._frozen
+        return self._read()
+
+    def now(self) -> datetime:
+        if self._frozen is not None:
+            if self._frozen_now is None:
+                self._frozen_now = datetime.fromtimestamp(self._frozen)
+            return self._frozen_now
+        return datetime.fromtimestamp(self._read())
+
+    def set_speed(self, speed: float):
+        self._game_anchor = self._read()
+        self._wall_anchor = time.time()
+        self.speed = speed
+
+    def resume(self, game_time: float, wall_time: Optional[float] = None):
+        """Carry on from a save written at `game_time`, on the wall clock at
+        `wall_time`. The time since passes at 1x, nothing ran while the game
+        was closed. Without `wall_time` (older saves) game time only moves
+        forward to `game_time` if it is behind."""
+        now = time.time()
+        if wall_time is None:
+            game_now = max(game_time, self._read())
+        else:
+            game_now = game_time + max(0.0, now - wall_time)
+        self._game_anchor = game_now
+        self._wall_anchor = now
+
+    @contextmanager
+    def frame(self):
+        if self._frame_depth == 0:
+            self._frozen = self._read()
+        self._frame_depth += 1
+        try:
+            yield self._frozen
+        finally:
+            self._frame_depth -= 1
+            if self._frame_depth == 0:
+                self._frozen = None
+                self._frozen_now = None
+
+
+class FakeClock(GameClock):
+    """A clock that only moves when told to, for tests and simulations."""
+
+    def __init__(self, start: Optional[float] = None):
+        super().__init__()
+        self._now = time.time() if start is None else start
+
+    def _read(self) -> float:
+        return self._now
+
+    def set_speed(self, speed: float):
+        self.speed = speed
+
+    def resume(self, game_time: float, wall_time: Optional[float] = None):
+        pass  # Time only moves when told to.
+
+    def advance(self, seconds: float):
+        self._now += seconds
+        if self._frozen is not None:
+            self._frozen = self._now
+            self._frozen_now = None
+
+
+DEFAULT_CLOCK = GameClock()
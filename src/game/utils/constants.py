@@ -1,4 +1,4 @@
-from domain.fish import Fish
+from game.domain.fish import Fish
 
 
 class TUIConstants:
@@ -38,6 +38,8 @@ class TUIConstants:
 
 
 class GameStateConstants:
+    # The part of the day Joji the merchant trades in.
+    MERCHANT_PART = "morning"
     FOSSILS = [
         "Tyrannosaurus",
         "Triceratops",
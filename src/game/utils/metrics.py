@@ -0,0 +1,155 @@
+import json
+import re
+import threading
+import time
+from typing import Any, Callable, Optional, TextIO
+
+PROMETHEUS_PREFIX = "terminal_farm"
+METRIC_NAME = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class TimerStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {"count": self.count, "total": self.total, "max": self.max}
+
+
+class Metrics:
+    """Process-wide timers, counters and gauges.
+
+    Nothing in the game calls into this on its own, the profiler installs
+    timing wrappers only while it is enabled. Gauges are callbacks, read
+    only when a snapshot or an export asks for them.
+    """
+
+    def __init__(self):
+        self.timers: dict[str, TimerStats] = {}
+        self.counters: dict[str, int] = {}
+        self.gauges: dict[str, Callable[[], float]] = {}
+        self.started = time.time()
+
+    def observe(self, name: str, seconds: float):
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = TimerStats()
+        timer.add(seconds)
+
+    def inc(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name: str, read: Callable[[], float]):
+        self.gauges[name] = read
+
+    def reset(self):
+        self.timers.clear()
+        self.counters.clear()
+        self.started = time.time()
+
+    def read_gauges(self) -> dict[str, float]:
+        values = {}
+        for name, read in list(self.gauges.items()):
+            try:
+                values[name] = read()
+            except Exception:
+                continue
+        return values
+
+    def snapshot(self, gauges: bool = True) -> dict[str, Any]:
+        """Plain-data copy of every metric. Pass gauges=False from other
+        threads, since gauge callbacks read live game state."""
+        return {
+            "ts": time.time(),
+            "uptime": time.time() - self.started,
+            "timers": {
+                name: timer.to_dict() for name, timer in list(self.timers.items())
+            },
+            "counters": dict(self.counters),
+            "gauges": self.read_gauges() if gauges else {},
+        }
+
+    def slowest(self, limit: int = 10) -> list[tuple[str, TimerStats]]:
+        """Timers by total time spent, largest first."""
+        timers = sorted(
+            self.timers.items(), key=lambda item: item[1].total, reverse=True
+        )
+        return timers[:limit]
+
+    def to_prometheus(self) -> str:
+        """The Prometheus text exposition format, version 0.0.4."""
+        name = f"{PROMETHEUS_PREFIX}_call_seconds"
+        lines = [
+            f"# HELP {name} Time spent in instrumented calls.",
+            f"# TYPE {name} summary",
+        ]
+        timers = list(self.timers.items())
+        for call, timer in timers:
+            lines.append(f'{name}_count{{call="{call}"}} {timer.count}')
+            lines.append(f'{name}_sum{{call="{call}"}} {timer.total:.9f}')
+        lines.append(f"# HELP {name}_max Slowest single instrumented call.")
+        lines.append(f"# TYPE {name}_max gauge")
+        for call, timer in timers:
+            lines.append(f'{name}_max{{call="{call}"}} {timer.max:.9f}')
+
+        for counter, value in list(self.counters.items()):
+            metric = f"{PROMETHEUS_PREFIX}_{METRIC_NAME.sub('_', counter)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for gauge, value in self.read_gauges().items():
+            metric = f"{PROMETHEUS_PREFIX}_{METRIC_NAME.sub('_', gauge)}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class JsonlDumper:
+    """Appends a snapshot of `metrics` to a JSON Lines file every `interval`
+    seconds from a daemon thread, and once more on stop()."""
+
+    def __init__(self, metrics: Metrics, path: str, interval: float = 10.0):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _write(self, stream: TextIO):
+        stream.write(json.dumps(self.metrics.snapshot(gauges=False)) + "\n")
+        stream.flush()
+
+    def _run(self):
+        with open(self.path, "a") as stream:
+            while not self._stop.wait(self.interval):
+                self._write(stream)
+            self._write(stream)
+
+    def start(self) -> "JsonlDumper":
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-jsonl", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+METRICS = Metrics()
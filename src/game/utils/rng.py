@@ -0,0 +1,90 @@
+import os
+import random
+from typing import Any, Optional
+
+try:
+    # The blake2 module directly, hashlib would also load OpenSSL at startup.
+    from _blake2 import blake2b
+except ImportError:
+    from hashlib import blake2b
+
+MASK64 = (1 << 64) - 1
+
+
+def derive_seed(seed: int, *labels: Any) -> int:
+    """A 64-bit seed for the sub-stream named by `labels`, e.g.
+    derive_seed(seed, "shard", 3). Stable across processes and machines,
+    unlike hash()."""
+    key = repr((seed,) + labels).encode()
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+class SplitMix64(random.Random):
+    """SplitMix64 behind the `random.Random` API.
+
+    The whole state is one 64-bit integer, so saving a stream costs a few
+    bytes instead of the 2.5 KB of a Mersenne Twister state.
+    """
+
+    def seed(self, a: Optional[int] = None, version: int = 2):
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "little")
+        self.state = int(a) & MASK64
+
+    def _next(self) -> int:
+        self.state = z = (self.state + 0x9E3779B97F4A7C15) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            return self._next() >> (64 - k)
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next() << shift
+        return bits & ((1 << k) - 1)
+
+    def getstate(self) -> int:
+        return self.state
+
+    def setstate(self, state: int):
+        self.state = state
+
+
+class RandomStreams:
+    """One independent stream per subsystem, all derived from a single seed,
+    so one subsystem drawing more or fewer numbers never shifts another."""
+
+    NAMES = ("weather", "events", "event_rolls", "fishing", "farm", "fossils")
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed
+        self.streams = {
+            name: SplitMix64(derive_seed(seed, name)) for name in self.NAMES
+        }
+
+    def __getitem__(self, name: str) -> SplitMix64:
+        return self.streams[name]
+
+    def fork(self, *labels: Any) -> "RandomStreams":
+        return RandomStreams(derive_seed(self.seed, *labels))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seed": self.seed,
+            "streams": {name: rng.getstate() for name, rng in self.streams.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RandomStreams":
+        streams = cls(data["seed"])
+        for name, state in data["streams"].items():
+            if name in streams.streams:
+                streams.streams[name].setstate(state)
+        return streams
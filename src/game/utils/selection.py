@@ -0,0 +1,30 @@
+from typing import Optional
+
+ALL = ("all", "*")
+
+
+def parse_plots(spec: str, size: int) -> Optional[list[int]]:
+    """Turn a selection of 1-based plots such as "3", "1-9", "1,4-6" or "all"
+    into sorted 0-based indices, None meaning every plot.
+
+    Raises ValueError for bad syntax, plots outside 1..size or plots
+    selected twice.
+    """
+    spec = spec.strip().lower()
+    if spec in ALL:
+        return None
+
+    selected: set[int] = set()
+    for part in spec.split(","):
+        first, dash, last = part.strip().partition("-")
+        if not first.isdigit() or (dash and not last.isdigit()):
+            raise ValueError(f"bad plot selection {spec!r}, try 3, 1-9 or all")
+        start = int(first)
+        end = int(last) if dash else start
+        if not 1 <= start <= end <= size:
+            raise ValueError(f"plots go from 1 to {size}")
+        plots = range(start - 1, end)
+        if not selected.isdisjoint(plots):
+            raise ValueError(f"bad plot selection {spec!r}, a plot is in it twice")
+        selected.update(plots)
+    return sorted(selected)
@@ -0,0 +1,113 @@
+import math
+from typing import Optional
+
+
+class Distribution:
+    """Streaming summary of a stream of numbers.
+
+    Count, mean and variance are kept with Welford's update. Percentiles and
+    histograms come from log-spaced buckets that grow by GROWTH (1% apart),
+    so memory stays at a few hundred counters however many values are
+    added, and two distributions merge exactly. Worker processes can
+    summarize their own runs and send only this object back.
+    """
+
+    GROWTH = 1.01
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.buckets: dict[tuple[int, int], int] = {}
+
+    @classmethod
+    def _bucket(cls, value: float) -> tuple[int, int]:
+        if value == 0:
+            return 0, 0
+        exponent = math.floor(math.log(abs(value)) / math.log(cls.GROWTH))
+        return (1 if value > 0 else -1), exponent
+
+    @classmethod
+    def _bucket_value(cls, key: tuple[int, int]) -> float:
+        sign, exponent = key
+        return sign * cls.GROWTH ** (exponent + 0.5)
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        key = self._bucket(value)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other: "Distribution"):
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            self.buckets = dict(other.buckets)
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for key, bucket_count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + bucket_count
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def _sorted_buckets(self) -> list[tuple[float, int]]:
+        return sorted(
+            (self._bucket_value(key), count) for key, count in self.buckets.items()
+        )
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Value below which `q` percent of the values fall, within ~1%."""
+        if not self.count:
+            return None
+
+        rank = q / 100 * (self.count - 1)
+        seen = 0
+        for value, count in self._sorted_buckets():
+            seen += count
+            if seen > rank:
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def histogram(self, bins: int = 10) -> list[tuple[float, float, int]]:
+        """(low, high, count) for `bins` equal-width bins between min and max."""
+        if not self.count:
+            return []
+
+        width = (self.max - self.min) / bins or 1.0
+        counts = [0] * bins
+        for value, count in self._sorted_buckets():
+            value = min(max(value, self.min), self.max)
+            counts[min(int((value - self.min) / width), bins - 1)] += count
+        return [
+            (self.min + i * width, self.min + (i + 1) * width, count)
+            for i, count in enumerate(counts)
+        ]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
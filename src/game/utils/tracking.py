@@ -0,0 +1,53 @@
+import itertools
+from typing import Any
+
+# One counter for every tracked object, so versions can be compared across
+# objects, including an object and the one that replaced it after a load.
+_versions = itertools.count(1)
+_UNSET = object()
+
+
+def next_version() -> int:
+    return next(_versions)
+
+
+class Tracked:
+    """Notices assignments to the attributes named in TRACKED.
+
+    Every change stamps the object with a new version and adds the attribute
+    to a dirty set that drain() hands out as {name: value}. Assigning an
+    equal value is not a change. A new object starts with every tracked
+    attribute dirty. Changing a value in place (appending to a list) is no
+    assignment, so call touch() afterwards.
+    """
+
+    TRACKED: frozenset[str] = frozenset()
+
+    def __setattr__(self, name: str, value: Any):
+        state = self.__dict__
+        if name in self.TRACKED and state.get(name, _UNSET) != value:
+            state["_version"] = next(_versions)
+            state.setdefault("_dirty", set()).add(name)
+        object.__setattr__(self, name, value)
+
+    @property
+    def version(self) -> int:
+        return self.__dict__.get("_version", 0)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self.__dict__.get("_dirty"))
+
+    def touch(self, *names: str):
+        state = self.__dict__
+        state["_version"] = next(_versions)
+        state.setdefault("_dirty", set()).update(names)
+
+    def drain(self) -> dict[str, Any]:
+        """The dirty attributes and their values, leaving none dirty."""
+        dirty = self.__dict__.get("_dirty")
+        if not dirty:
+            return {}
+        changes = {name: getattr(self, name) for name in dirty}
+        dirty.clear()
+        return changes
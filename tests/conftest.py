@@ -0,0 +1,54 @@
+import pytest
+from game.domain.crop import Crop
+from game.service import array_farm_system
+from game.service.array_farm_system import ArrayFarmSystem
+from game.service.crop_system import CropSystem
+from game.service.farm_system import FarmSystem
+from game.utils.clock import FakeClock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+START = 1_700_000_000.0
+
+
+@pytest.fixture
+def start() -> float:
+    """When the `clock` fixture starts."""
+    return START
+
+
+@pytest.fixture
+def clock(start) -> FakeClock:
+    return FakeClock(start)
+
+
+@pytest.fixture
+def crops() -> dict[str, Crop]:
+    return CropSystem().available_crops
+
+
+@pytest.fixture(params=["array", "numpy"])
+def array_backend(request, monkeypatch) -> str:
+    """ArrayFarmSystem on the array module, and on NumPy when installed."""
+    if request.param == "numpy" and numpy is None:
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(
+        array_farm_system, "np", numpy if request.param == "numpy" else None
+    )
+    return request.param
+
+
+@pytest.fixture(params=["list", "array", "numpy"])
+def farm_cls(request, monkeypatch) -> type[FarmSystem]:
+    """Every farm implementation, ArrayFarmSystem with and without NumPy."""
+    if request.param == "list":
+        return FarmSystem
+    if request.param == "numpy" and numpy is None:
+        pytest.skip("NumPy is not installed")
+    monkeypatch.setattr(
+        array_farm_system, "np", numpy if request.param == "numpy" else None
+    )
+    return ArrayFarmSystem
@@ -0,0 +1,28 @@
+import time
+from datetime import datetime, timedelta
+from game.domain.plot import Plot
+from game.utils.clock import GameClock
+
+
+def test_resume_continues_from_the_save():
+    clock = GameClock()
+    saved_at = time.time() + 3600  # Played an hour ahead at --speed.
+    clock.resume(saved_at, time.time() - 60)
+    assert abs(clock.time() - (saved_at + 60)) < 1
+
+
+def test_resume_without_wall_time_never_goes_back():
+    clock = GameClock()
+    clock.resume(0.0)
+    assert abs(clock.time() - time.time()) < 1
+
+    ahead = time.time() + 3600
+    clock.resume(ahead)
+    assert clock.time() >= ahead
+
+
+def test_growth_progress_stays_in_range(clock, crops):
+    future = Plot(crops["wheat"], clock.now() + timedelta(hours=1), clock)
+    assert future.growth_progress == 0.0
+    past = Plot(crops["wheat"], datetime.fromtimestamp(0), clock)
+    assert past.growth_progress == 1.0
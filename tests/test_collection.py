@@ -0,0 +1,43 @@
+import random
+from game.domain.collection import Collection
+
+NAMES = [f"item{i}" for i in range(200)]
+# Either side of the 64-bit word boundaries.
+FOUND = [0, 1, 62, 63, 64, 65, 127, 128, 129, 191, 192, 199]
+
+
+def test_bits_past_word_boundaries():
+    collection = Collection(NAMES)
+    for i in FOUND:
+        assert collection.add(NAMES[i])
+        assert not collection.add(NAMES[i])
+
+    assert collection.count == len(FOUND)
+    assert [i for i in range(len(NAMES)) if collection.has_index(i)] == FOUND
+    assert [name in collection for name in NAMES] == [
+        i in FOUND for i in range(len(NAMES))
+    ]
+    assert collection.bits == sum(1 << i for i in FOUND)
+    assert "item200" not in collection
+
+
+def test_bits_round_trip():
+    collection = Collection(NAMES)
+    for i in FOUND:
+        collection.add(NAMES[i])
+
+    restored = Collection(NAMES, int(format(collection.bits, "x"), 16))
+    assert restored.bits == collection.bits
+    assert restored.count == collection.count
+    assert restored.found() == [NAMES[i] for i in FOUND]
+
+
+def test_draws_only_missing_until_complete():
+    collection = Collection(NAMES, sum(1 << i for i in FOUND))
+    rng = random.Random(1)
+    while not collection.complete:
+        name = collection.draw_missing(rng)
+        assert name not in collection
+        assert collection.add(name)
+    assert collection.count == len(NAMES)
+    assert collection.draw_missing(rng) is None
@@ -0,0 +1,47 @@
+import random
+from collections import Counter
+import pytest
+from game.domain.player import Player
+from game.service.event_system import EventSystem
+from game.service.farm_system import FarmSystem
+from game.service.game_state import GameState
+from game.utils.alias import AliasTable
+
+
+def test_alias_table_follows_the_weights():
+    weights = [1.0, 0.0, 2.0, 3.0, 4.0]
+    table = AliasTable(weights)
+    draw = random.Random(7).random
+    samples = 100_000
+    counts = Counter(table.sample(draw()) for _ in range(samples))
+
+    assert counts[1] == 0
+    for index, weight in enumerate(weights):
+        assert counts[index] / samples == pytest.approx(weight / 10, abs=0.005)
+
+
+def test_impossible_events_are_never_picked(clock):
+    # An empty farm with no game attached: no crop, fishing or ghost events.
+    events = EventSystem(FarmSystem(size=9, clock=clock), Player(), random.Random(3))
+    for event in events.events:
+        event.effect = lambda system, name=event.name: name
+    possible = {event.name for event in events.events if event.is_possible(events)}
+    assert "storm" not in possible
+
+    picked = Counter(
+        events.trigger(index) for _ in range(200) for index in range(len(events.events))
+    )
+    assert set(picked) == possible
+
+
+def test_queued_rolls_are_saved(clock, tmp_path):
+    game = GameState(clock=clock, save_file=str(tmp_path / "farm"), seed=5)
+    game.player.max_stamina = game.player.stamina = 20
+    game.event_system.queue_days(10)
+    assert game.save()
+
+    loaded = GameState(clock=clock, save_file=str(tmp_path / "farm"), seed=6)
+    assert loaded.load()
+    played = [game.next_day() for _ in range(10)]
+    assert [loaded.next_day() for _ in range(10)] == played
+    assert loaded.player.money == game.player.money
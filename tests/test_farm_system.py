@@ -0,0 +1,80 @@
+import pytest
+from game.service.array_farm_system import ArrayFarmSystem
+from game.service.farm_system import FarmSystem
+
+PLANTED = [(0, "wheat"), (2, "corn"), (5, "pumpkin")]
+
+
+def planted_farm(farm_cls, clock, crops, size=9):
+    farm = farm_cls(size=size, clock=clock)
+    for plot_index, name in PLANTED:
+        farm.plant_crop(plot_index, crops[name])
+    return farm
+
+
+def test_empty_farm_has_nothing_coming(farm_cls, clock):
+    farm = farm_cls(size=9, clock=clock)
+    assert farm.next_ready_at() is None
+    assert farm.ready_count() == 0
+
+
+def test_next_ready_at_skips_empty_and_ready_plots(farm_cls, clock, crops, start):
+    farm = planted_farm(farm_cls, clock, crops)
+    assert farm.next_ready_at() == start + 10
+
+    clock.advance(10)
+    assert farm.ready_count() == 1
+    assert farm.next_ready_at() == start + 20
+
+    clock.advance(30)
+    assert farm.ready_count() == 3
+    assert farm.next_ready_at() is None
+
+
+@pytest.mark.parametrize("elapsed", [0, 9, 10, 15, 20, 39, 40, 100])
+def test_array_farm_matches_farm_system(array_backend, clock, crops, elapsed):
+    farm = planted_farm(FarmSystem, clock, crops)
+    array_farm = planted_farm(ArrayFarmSystem, clock, crops)
+    clock.advance(elapsed)
+
+    assert array_farm.next_ready_at() == farm.next_ready_at()
+    assert array_farm.ready_count() == farm.ready_count()
+    assert array_farm.harvest_ready_crops() == farm.harvest_ready_crops()
+    assert [plot.is_empty for plot in array_farm.plots] == [
+        plot.is_empty for plot in farm.plots
+    ]
+
+
+def test_looking_ahead_harvests_nothing_early(farm_cls, clock, crops, start):
+    farm = planted_farm(farm_cls, clock, crops)
+    assert farm.ready_count(start + 100) == 3
+    assert farm.next_ready_at(start + 15) == start + 20
+
+    assert farm.harvest_ready_crops() == 0
+    assert farm.harvest_plots([0, 2, 5]) == 0
+    assert farm.ready_count() == 0
+    assert farm.next_ready_at() == start + 10
+
+
+def test_looking_back_counts_what_was_ready_then(farm_cls, clock, crops, start):
+    farm = planted_farm(farm_cls, clock, crops)
+    clock.advance(25)
+    assert farm.ready_count() == 2
+    assert farm.ready_count(start + 15) == 1
+    assert farm.next_ready_at(start + 15) == start + 20
+
+
+def test_progress_stays_in_range(farm_cls, clock, crops):
+    farm = planted_farm(farm_cls, clock, crops)
+    clock.advance(-60)  # A clock that runs behind the save.
+    assert farm.get_plot_status(0) == (crops["wheat"], 0.0)
+    clock.advance(1000)
+    assert farm.get_plot_status(5) == (crops["pumpkin"], 1.0)
+
+
+def test_harvest_marks_only_the_harvested_plots(farm_cls, clock, crops):
+    farm = planted_farm(farm_cls, clock, crops)
+    farm.drain_plots()
+    clock.advance(20)
+    assert farm.harvest_ready_crops() > 0
+    assert farm.drain_plots() == [0, 2]
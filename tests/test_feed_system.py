@@ -0,0 +1,111 @@
+import asyncio
+import json
+from game.service.farm_system import FarmSystem
+from game.service.feed_system import MAX_BACKLOG, FarmFeed
+from game.service.game_state import GameState
+from game.service.server_system import GameSession
+
+
+def feed_test(clock, body):
+    """Run `body(session, feed)` on a fresh FakeClock farm."""
+
+    async def run():
+        game = GameState(farm=FarmSystem(size=9, clock=clock), clock=clock, seed=1)
+        session = GameSession("alice", game)
+        feed = FarmFeed(session)
+        try:
+            await body(session, feed)
+        finally:
+            feed.close()
+            session.close()
+
+    asyncio.run(run())
+
+
+async def next_event(queue: asyncio.Queue) -> tuple[str, dict]:
+    event = await asyncio.wait_for(queue.get(), 1)
+    _, name, data = event.decode().strip().split("\n")
+    return name.removeprefix("event: "), json.loads(data.removeprefix("data: "))
+
+
+def test_subscribers_start_from_a_snapshot(clock):
+    async def body(session, feed):
+        name, snapshot = await next_event(feed.subscribe())
+        assert name == "snapshot"
+        assert snapshot["plots"] == [None] * 9
+        assert snapshot["day"] == 1
+        assert snapshot["version"] == session.game.version
+
+    feed_test(clock, body)
+
+
+def test_a_command_sends_only_what_changed(clock, start):
+    async def body(session, feed):
+        queue = feed.subscribe()
+        await next_event(queue)
+        assert (await session.submit("plant 1 wheat")).startswith("OK")
+
+        name, delta = await next_event(queue)
+        assert name == "delta"
+        assert delta["plots"] == {
+            "0": {"crop": "wheat", "planted_at": start, "ready": False}
+        }
+        assert set(delta) == {"money", "stamina", "plots", "messages", "version"}
+        assert delta["messages"][0].startswith("Planted")
+        assert delta["version"] == session.game.version
+        assert queue.empty()
+
+    feed_test(clock, body)
+
+
+def test_crops_coming_ready_are_pushed(clock):
+    async def body(session, feed):
+        queue = feed.subscribe()
+        await next_event(queue)
+        await session.submit("plant 1 wheat")
+        await session.submit("plant 3 wheat")
+        while not queue.empty():
+            queue.get_nowait()
+
+        clock.advance(10)
+        feed.publish()
+        _, delta = await next_event(queue)
+        assert {i: plot["ready"] for i, plot in delta["plots"].items()} == {
+            "0": True,
+            "2": True,
+        }
+        assert feed.growing == []
+
+    feed_test(clock, body)
+
+
+def test_one_encoded_delta_goes_to_every_subscriber(clock):
+    async def body(session, feed):
+        queues = [feed.subscribe() for _ in range(3)]
+        for queue in queues:
+            await next_event(queue)
+        await session.submit("plant 1 wheat")
+        events = [await asyncio.wait_for(queue.get(), 1) for queue in queues]
+        assert all(event is events[0] for event in events)
+
+        feed.unsubscribe(queues[0])
+        await session.submit("plant 2 wheat")
+        await asyncio.wait_for(queues[1].get(), 1)
+        assert queues[0].empty()
+
+    feed_test(clock, body)
+
+
+def test_a_subscriber_too_far_behind_is_dropped(clock):
+    async def body(session, feed):
+        queue = feed.subscribe()  # Holding the snapshot.
+        for _ in range(MAX_BACKLOG - 1):
+            feed.broadcast(b"event")
+        assert queue in feed.subscribers
+        feed.broadcast(b"event")
+        assert queue not in feed.subscribers
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert len(events) == MAX_BACKLOG + 1
+        assert events[-1] is None
+
+    feed_test(clock, body)
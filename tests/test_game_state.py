@@ -0,0 +1,164 @@
+import pytest
+from game.service.game_state import GameState
+from game.utils.constants import EventConstants
+
+
+def test_merchant_is_not_built_to_check_availability(clock):
+    game = GameState(clock=clock, seed=1)
+    assert game.merchant_available == game.merchant_system.is_available(
+        game.day_cycle_system.get_current_part()
+    )
+
+    game = GameState(clock=clock, seed=1)
+    game.merchant_available
+    game.fishing_unlocked
+    assert game._merchant_system is None
+
+
+def farm_game(farm_cls, clock, money=100) -> GameState:
+    game = GameState(farm=farm_cls(size=9, clock=clock), clock=clock, seed=1)
+    game.player.money = money
+    game.player.max_stamina = game.player.stamina = 10
+    return game
+
+
+def planted(game: GameState) -> list[int]:
+    return [i for i, plot in enumerate(game.farm.plots) if not plot.is_empty]
+
+
+def test_plant_many_charges_once_for_the_empty_plots(farm_cls, clock):
+    game = farm_game(farm_cls, clock)
+    assert game.plant(1, "wheat")[0]
+    success, message = game.plant_many("wheat", [0, 1, 2])
+    assert success, message
+    assert message == "Planted wheat in 2 plots!"
+    assert planted(game) == [0, 1, 2]
+    assert game.player.money == 100 - 3 * 10
+    assert game.player.stamina == 10 - 3 * 0.5
+
+
+def test_plant_many_fills_the_farm(farm_cls, clock):
+    game = farm_game(farm_cls, clock)
+    assert game.plant_many("wheat")[0]
+    assert planted(game) == list(range(9))
+    assert game.plant_many("wheat") == (False, "No empty plots there!")
+
+
+@pytest.mark.parametrize(
+    "crop, plots, money",
+    [
+        ("corn", [0, 1], 100),  # Locked.
+        ("turnip", [0, 1], 100),  # No such crop.
+        ("wheat", [0, 9], 100),  # Off the farm.
+        ("wheat", [-1, 0], 100),
+        ("wheat", [0, 0], 100),  # Selected twice.
+        ("wheat", [0, 1, 2], 29),  # Money for two of three.
+        ("wheat", None, 89),
+    ],
+)
+def test_plant_many_is_all_or_nothing(farm_cls, clock, crop, plots, money):
+    game = farm_game(farm_cls, clock, money)
+    version = game.version
+    success, _ = game.plant_many(crop, plots)
+    assert not success
+    assert planted(game) == []
+    assert game.player.money == money
+    assert game.player.stamina == 10
+    assert game.version == version
+
+
+def test_plant_many_needs_stamina_for_every_plot(farm_cls, clock):
+    game = farm_game(farm_cls, clock)
+    game.player.stamina = 1.0
+    assert game.plant_many("wheat", [0, 1, 2]) == (
+        False,
+        "Not enough stamina for 3 plots!",
+    )
+    assert planted(game) == []
+    assert game.player.money == 100
+
+
+def test_harvest_takes_only_the_selection(farm_cls, clock):
+    game = farm_game(farm_cls, clock)
+    assert game.plant_many("wheat", [0, 1, 2, 3])[0]
+    clock.advance(10)
+    assert game.harvest([0, 2, 5]) == (True, 2 * 20)
+    assert planted(game) == [1, 3]
+    assert game.harvest() == (True, 2 * 20)
+    assert planted(game) == []
+
+
+@pytest.mark.parametrize("plots", [[0, 0], [9], [-1]])
+def test_harvest_rejects_bad_selections(farm_cls, clock, plots):
+    game = farm_game(farm_cls, clock)
+    assert game.plant_many("wheat", [0, 8])[0]
+    clock.advance(10)
+    with pytest.raises(ValueError):
+        game.harvest(plots)
+    assert planted(game) == [0, 8]
+    assert game.player.money == 100 - 2 * 10
+
+
+def idle_game(clock, seed=0) -> GameState:
+    game = GameState(clock=clock, seed=seed)
+    game.player.max_stamina = game.player.stamina = 100
+    game.player.has_farmdex = True  # Fossils turn up every other day.
+    return game
+
+
+def days_state(game: GameState) -> tuple:
+    return (
+        game.time_system.day,
+        game.player.money,
+        game.player.max_stamina,
+        game.lazy_day_active,
+        sorted(game.crop_system.unlocked_crops),
+        game.collection_system["fossils"].bits,
+        game.weather_system.get_weather(),
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_advance_days_matches_playing_each_day(clock, seed):
+    batched, played = idle_game(clock, seed), idle_game(clock, seed)
+    money = played.player.money
+    result = batched.advance_days(30)
+    for _ in range(30):
+        assert played.next_day()[0]
+
+    assert days_state(batched) == days_state(played)
+    assert result.money_delta == played.player.money - money
+
+
+def test_advance_days_reports_what_happened(clock):
+    game = idle_game(clock)
+    fossils = game.collection_system["fossils"]
+    money = game.player.money
+    result = game.advance_days(30)
+
+    assert (result.start_day, result.end_day, result.days) == (1, 31, 30)
+    assert result.money_delta == game.player.money - money
+    assert result.unlocked_crops == ["corn", "pumpkin", "lazy_ghost"]
+    assert result.fossils_found
+    assert all(name in fossils for name in result.fossils_found)
+    assert [day for day, _ in result.messages] == sorted(
+        day for day, _ in result.messages
+    )
+    lazy_days = [day for day, message in result.messages if "lazy" in message]
+    assert lazy_days == [11, 30]
+    # Both penalties were given back the night after.
+    assert game.player.max_stamina == 100
+    assert not game.lazy_day_active
+    assert game.advance_days(0).days == 0
+
+
+def test_a_lazy_day_wears_off_overnight(clock):
+    game = idle_game(clock)
+    game.event_system._lazy_day_event()
+    lazy = 100 - EventConstants.DEBUFF_STAMINA_LAZY_DAY
+    assert game.player.max_stamina == game.player.stamina == lazy
+
+    assert game.next_day() == (True, None)
+    assert not game.lazy_day_active
+    assert game.player.max_stamina == 100
+    assert game.player.stamina == lazy - 1
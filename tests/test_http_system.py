@@ -0,0 +1,101 @@
+import asyncio
+import time
+import pytest
+from game.service.http_system import (
+    SESSION_IDLE_TIMEOUT,
+    FarmApi,
+    HttpError,
+    HttpRequest,
+    HttpResponse,
+)
+from game.service.server_system import GameServer
+
+
+def get(api: FarmApi, path: str, **headers: str):
+    return api.dispatch(HttpRequest("GET", path, "HTTP/1.1", headers))
+
+
+def post(api: FarmApi, path: str, body: bytes):
+    return api.dispatch(HttpRequest("POST", path, "HTTP/1.1", {}, body))
+
+
+def test_unknown_farms_are_not_created(tmp_path):
+    async def run():
+        server = GameServer(save_dir=str(tmp_path))
+        api = FarmApi(server)
+        try:
+            for path in ("/api/farms/nobody", "/api/farms/nobody/events"):
+                with pytest.raises(HttpError) as error:
+                    await get(api, path)
+                assert error.value.status == 404
+        finally:
+            api.close()
+        assert not server.sessions
+        assert not list(tmp_path.iterdir())
+
+    asyncio.run(run())
+
+
+def test_idle_farms_are_released(tmp_path):
+    async def run():
+        server = GameServer(save_dir=str(tmp_path))
+        server.detach(server.attach("alice"))  # Saved by a socket player.
+        api = FarmApi(server)
+        try:
+            response = await get(api, "/api/farms/alice")
+            assert response.status == 200
+            assert "alice" in server.sessions
+
+            api.release_idle(time.monotonic() + SESSION_IDLE_TIMEOUT / 2)
+            assert "alice" in server.sessions
+
+            api.release_idle(time.monotonic() + SESSION_IDLE_TIMEOUT + 1)
+            assert "alice" not in server.sessions
+            assert not api.sessions
+        finally:
+            api.close()
+
+    asyncio.run(run())
+
+
+def test_farm_state_is_cached_by_etag(tmp_path):
+    async def run():
+        server = GameServer(save_dir=str(tmp_path))
+        session = server.attach("alice")
+        session.game.player.has_lantern = True  # Plant whatever the hour.
+        api = FarmApi(server)
+        try:
+            response = await get(api, "/api/farms/alice")
+            assert response.status == 200
+            assert response.body
+            etag = response.headers["ETag"]
+
+            response = await get(api, "/api/farms/alice", **{"if-none-match": etag})
+            assert response.status == 304
+            assert response.headers["ETag"] == etag
+
+            response = await post(
+                api, "/api/farms/alice/plant", b'{"plot": 1, "crop": "wheat"}'
+            )
+            assert response.status == 200
+            planted = response.headers["ETag"]
+            assert planted != etag
+
+            response = await get(api, "/api/farms/alice", **{"if-none-match": etag})
+            assert response.status == 200
+            assert response.headers["ETag"] == planted
+        finally:
+            api.close()
+            server.detach(session)
+
+    asyncio.run(run())
+
+
+def test_not_modified_has_no_body_headers():
+    response = HttpResponse(304, headers={"ETag": '"1-2"'})
+    header = response.encode(keep_alive=True).decode("latin-1")
+    assert header.startswith("HTTP/1.1 304 Not Modified\r\n")
+    assert header.endswith("\r\n\r\n")
+    assert 'ETag: "1-2"' in header
+    assert "Content-Length" not in header
+    assert "Content-Type" not in header
@@ -0,0 +1,34 @@
+from game.service.game_state import GameState
+
+
+def test_offers_are_rebuilt_only_when_they_change(clock):
+    game = GameState(clock=clock, seed=1)
+    game.player.money = 10_000
+    merchant = game.merchant_system
+
+    offers = merchant.offers()
+    assert merchant.offers() is offers
+    assert offers["lantern"].price == 2000
+    assert not offers["lantern"].owned
+
+    game.market_inflated = True
+    inflated = merchant.offers()
+    assert inflated is not offers
+    assert inflated["lantern"].price == 2000 * merchant.MARKET_INFLATION
+    assert merchant.offers() is inflated
+
+    game.market_inflated = False
+    game.time_system.update()
+    tomorrow = merchant.offers()
+    assert tomorrow is not inflated
+    assert tomorrow["lantern"].price == 2000
+
+    assert merchant.buy_item("lantern").startswith("You bought a lantern")
+    bought = merchant.offers()
+    assert bought is not tomorrow
+    assert bought["lantern"].owned
+    assert merchant.buy_item("lantern") == "You already own this item."
+    assert game.player.money == 10_000 - 2000
+
+    assert merchant.buy_seed("eggplant_seed")
+    assert merchant.offers()["eggplant_seed"].owned
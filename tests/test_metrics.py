@@ -0,0 +1,54 @@
+import json
+from game.utils.metrics import JsonlDumper, Metrics
+
+
+def sample_metrics() -> Metrics:
+    metrics = Metrics()
+    metrics.observe("GameState.next_day", 0.25)
+    metrics.observe("GameState.next_day", 0.5)
+    metrics.observe("FarmSystem.harvest_ready_crops", 0.125)
+    metrics.inc("saves.written", 3)
+    metrics.gauge("farms", lambda: 2)
+    metrics.gauge("broken", lambda: 1 / 0)
+    return metrics
+
+
+def test_prometheus_text_format():
+    assert sample_metrics().to_prometheus() == (
+        "# HELP terminal_farm_call_seconds Time spent in instrumented calls.\n"
+        "# TYPE terminal_farm_call_seconds summary\n"
+        'terminal_farm_call_seconds_count{call="GameState.next_day"} 2\n'
+        'terminal_farm_call_seconds_sum{call="GameState.next_day"} 0.750000000\n'
+        'terminal_farm_call_seconds_count{call="FarmSystem.harvest_ready_crops"} 1\n'
+        'terminal_farm_call_seconds_sum{call="FarmSystem.harvest_ready_crops"} 0.125000000\n'
+        "# HELP terminal_farm_call_seconds_max Slowest single instrumented call.\n"
+        "# TYPE terminal_farm_call_seconds_max gauge\n"
+        'terminal_farm_call_seconds_max{call="GameState.next_day"} 0.500000000\n'
+        'terminal_farm_call_seconds_max{call="FarmSystem.harvest_ready_crops"} 0.125000000\n'
+        "# TYPE terminal_farm_saves_written_total counter\n"
+        "terminal_farm_saves_written_total 3\n"
+        "# TYPE terminal_farm_farms gauge\n"
+        "terminal_farm_farms 2\n"
+    )
+
+
+def test_jsonl_appends_snapshots(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    path.write_text('{"earlier": true}\n')
+    metrics = sample_metrics()
+
+    dumper = JsonlDumper(metrics, str(path), interval=3600).start()
+    dumper.stop()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    snapshot = json.loads(lines[1])
+    assert set(snapshot) == {"ts", "uptime", "timers", "counters", "gauges"}
+    assert snapshot["timers"]["GameState.next_day"] == {
+        "count": 2,
+        "total": 0.75,
+        "max": 0.5,
+    }
+    assert snapshot["counters"] == {"saves.written": 3}
+    # Gauges read live game state, the dumper's thread leaves them out.
+    assert snapshot["gauges"] == {}
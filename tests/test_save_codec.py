@@ -0,0 +1,60 @@
+import pytest
+from game.service.array_farm_system import ArrayFarmSystem
+from game.service.farm_system import FarmSystem
+from game.service.save_codec import SAVE_CODECS, BinarySaveCodec
+
+STATE = {"player": {"money": 120}, "saved_at": 1_700_000_000.0}
+
+
+@pytest.fixture(params=sorted(SAVE_CODECS))
+def codec(request):
+    return SAVE_CODECS[request.param]
+
+
+def full_farm(farm_cls, clock, crops, size=64):
+    farm = farm_cls(size=size, clock=clock)
+    names = sorted(crops)
+    for i in range(size):
+        farm.plant_crop(i, crops[names[i % len(names)]])
+        clock.advance(1)
+    return farm
+
+
+def round_trip(codec, farm, farm_cls, clock):
+    data, decoded = codec.decode(codec.encode(dict(STATE), farm), farm_cls, clock)
+    assert data == STATE
+    assert isinstance(decoded, farm_cls)
+    return decoded
+
+
+def test_empty_farm(codec, farm_cls, clock):
+    farm = farm_cls(size=9, clock=clock)
+    decoded = round_trip(codec, farm, farm_cls, clock)
+    assert len(decoded.plots) == 9
+    assert decoded.to_dict() == farm.to_dict()
+    assert decoded.next_ready_at() is None
+
+
+def test_full_farm(codec, farm_cls, clock, crops):
+    farm = full_farm(farm_cls, clock, crops)
+    decoded = round_trip(codec, farm, farm_cls, clock)
+    assert decoded.to_dict() == farm.to_dict()
+    assert decoded.ready_count() == farm.ready_count()
+    assert decoded.next_ready_at() == farm.next_ready_at()
+    assert decoded.harvest_ready_crops() == farm.harvest_ready_crops()
+
+
+@pytest.mark.parametrize("target", [FarmSystem, ArrayFarmSystem])
+def test_saves_load_into_either_farm(codec, farm_cls, clock, crops, target):
+    farm = full_farm(farm_cls, clock, crops, size=12)
+    farm.harvest_plots([0, 1, 2])
+    decoded = round_trip(codec, farm, target, clock)
+    assert decoded.to_dict() == farm.to_dict()
+
+
+def test_binary_rejects_other_files(clock):
+    codec = BinarySaveCodec()
+    payload = bytearray(codec.encode(dict(STATE), FarmSystem(size=3, clock=clock)))
+    payload[:4] = b"NOPE"
+    with pytest.raises(ValueError):
+        codec.decode(bytes(payload), FarmSystem, clock)
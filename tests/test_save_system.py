@@ -0,0 +1,146 @@
+import pytest
+from game.service.game_state import GameState
+from game.service.save_system import SaveJournal
+
+
+@pytest.fixture(params=["json", "binary"])
+def save_format(request) -> str:
+    return request.param
+
+
+def new_game(farm_cls, clock, tmp_path, save_format) -> GameState:
+    return GameState(
+        farm=farm_cls(size=9, clock=clock),
+        clock=clock,
+        save_format=save_format,
+        save_file=str(tmp_path / "farm"),
+        seed=1,
+    )
+
+
+def state(game: GameState) -> dict:
+    # Without the clock readings to_dict() stamps it with.
+    data = game.to_dict()
+    del data["saved_at"], data["saved_wall_time"]
+    return data
+
+
+def play(game: GameState, clock) -> list[dict]:
+    """A journaled session touching every farm op, returns the state after
+    each recorded action."""
+    game.player.money = 500
+    game.player.max_stamina = game.player.stamina = 20
+    game.crop_system.unlock_crop("corn")
+    game.enable_journal()
+    game.save()
+
+    states = []
+
+    def record(done):
+        assert done is None or done[0] is not False
+        states.append(state(game))
+
+    record(game.plant(0, "wheat"))
+    game.save()  # Compaction, the rest is only in the journal.
+    record(game.plant_many("wheat", [2, 3, 4]))
+    record(game.plant_many("corn", None))
+    clock.advance(10)
+    record(game.harvest([0, 2]))
+    game.farm.apply_growth_bonus(50)
+    record(game.nap())
+    clock.advance(5)
+    record(game.harvest())
+    return states
+
+
+def test_snapshot_and_journal_reproduce_the_game(
+    farm_cls, clock, tmp_path, save_format
+):
+    game = new_game(farm_cls, clock, tmp_path, save_format)
+    states = play(game, clock)
+    game.journal.close()
+
+    loaded = new_game(farm_cls, clock, tmp_path, save_format)
+    assert loaded.load()
+    assert state(loaded) == states[-1]
+
+
+def test_torn_last_record_loses_only_that_action(
+    farm_cls, clock, tmp_path, save_format
+):
+    game = new_game(farm_cls, clock, tmp_path, save_format)
+    states = play(game, clock)
+    game.journal.close()
+
+    path = SaveJournal.journal_path(game.save_file)
+    with open(path) as f:
+        lines = f.readlines()
+    assert len(lines) == 5  # Every action after the compaction.
+    with open(path, "w") as f:
+        f.write("".join(lines[:-1]) + lines[-1][: len(lines[-1]) // 2])
+
+    loaded = new_game(farm_cls, clock, tmp_path, save_format)
+    assert loaded.load()
+    assert state(loaded) == states[-2]
+
+
+def test_records_older_than_the_snapshot_are_skipped(farm_cls, clock, tmp_path):
+    game = new_game(farm_cls, clock, tmp_path, "json")
+    states = play(game, clock)
+    game.journal.close()
+
+    # A crash between writing the snapshot and emptying the journal.
+    path = SaveJournal.journal_path(game.save_file)
+    with open(path) as f:
+        records = f.read()
+    game.save()
+    with open(path, "w") as f:
+        f.write(records)
+
+    loaded = new_game(farm_cls, clock, tmp_path, "json")
+    assert loaded.load()
+    assert state(loaded) == states[-1]
+
+
+def test_each_save_format_keeps_its_own_journal(farm_cls, clock, tmp_path):
+    json_game = new_game(farm_cls, clock, tmp_path, "json")
+    json_states = play(json_game, clock)
+    json_game.journal.close()
+
+    binary_game = new_game(farm_cls, clock, tmp_path, "binary")
+    binary_game.enable_journal()
+    binary_game.save()
+    binary_game.journal.close()
+
+    loaded = new_game(farm_cls, clock, tmp_path, "json")
+    assert loaded.load()
+    assert state(loaded) == json_states[-1]
+
+
+def test_loading_catches_up_on_the_time_away(farm_cls, clock, tmp_path, save_format):
+    game = new_game(farm_cls, clock, tmp_path, save_format)
+    game.player.max_stamina, game.player.stamina = 10, 5
+    assert game.plant(0, "wheat")[0]
+    clock.advance(10)  # Wheat is ready before the save.
+    assert game.plant(1, "wheat")[0]
+    assert game.plant(2, "wheat")[0]
+    assert game.save()
+
+    clock.advance(5 * 3600 + 7 * 60)
+    loaded = new_game(farm_cls, clock, tmp_path, save_format)
+    assert loaded.load()
+
+    progress = loaded.offline_progress
+    assert progress.away_seconds == 5 * 3600 + 7 * 60
+    # 12-minute spring days: 25 whole cycles, then morning and afternoon.
+    assert progress.day_parts_passed == 25 * 4 + 2
+    assert progress.current_part == "evening"
+    assert progress.crops_matured == 2
+    assert progress.stamina_restored == 2  # A heart every 2 hours.
+    assert progress.summary().startswith("You were away for 5h 7m: 102 parts")
+
+    assert loaded.farm.ready_count() == 3
+    assert loaded.day_cycle_system.get_current_part() == "evening"
+    assert loaded.player.stamina == 5 - 3 * 0.5 + 2
+    assert loaded.time_system.day == 1
+    assert loaded.day_cycle_system.get_season() == "spring"
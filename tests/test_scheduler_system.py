@@ -0,0 +1,36 @@
+from game.service.scheduler_system import DeadlineScheduler
+
+
+def test_deadlines_fire_in_order(clock, start):
+    scheduler = DeadlineScheduler(clock)
+    scheduler.schedule("c", start + 30, lambda: "c")
+    scheduler.schedule("a", start + 10, lambda: "a")
+    scheduler.schedule("b", start + 20, lambda: "b")
+    scheduler.schedule("quiet", start + 15, lambda: None)
+    assert scheduler.next_deadline == start + 10
+    assert scheduler.seconds_until_next() == 10
+
+    assert scheduler.run_due(start + 5) == []
+    clock.advance(25)
+    assert scheduler.run_due() == ["a", "b"]
+    assert scheduler.fired == 3
+    assert scheduler.next_deadline == start + 30
+    assert scheduler.run_due(start + 100) == ["c"]
+    assert scheduler.next_deadline is None
+    assert scheduler.seconds_until_next() is None
+
+
+def test_rescheduling_and_cancelling(clock, start):
+    scheduler = DeadlineScheduler(clock)
+    scheduler.schedule("a", start + 10, lambda: "old")
+    scheduler.schedule("a", start + 20, lambda: "moved")
+    scheduler.schedule("b", start + 15, lambda: "b")
+    scheduler.schedule("b", start + 15, lambda: "rearmed")
+    scheduler.schedule("c", start + 5, lambda: "c")
+    scheduler.cancel("c")
+    scheduler.cancel("missing")
+
+    assert scheduler.next_deadline == start + 15
+    assert scheduler.run_due(start + 100) == ["rearmed", "moved"]
+    assert scheduler.fired == 2
+    assert scheduler.next_deadline is None
@@ -0,0 +1,34 @@
+import pytest
+from game.utils.selection import parse_plots
+
+
+@pytest.mark.parametrize(
+    "spec, plots",
+    [
+        ("3", [2]),
+        ("1-3", [0, 1, 2]),
+        ("1,4-6", [0, 3, 4, 5]),
+        (" 9, 2 ", [1, 8]),
+        ("5-5", [4]),
+        ("all", None),
+        ("ALL", None),
+        ("*", None),
+    ],
+)
+def test_selections(spec, plots):
+    assert parse_plots(spec, 9) == plots
+
+
+@pytest.mark.parametrize(
+    "spec",
+    ["", "x", "1-", "-3", "1,,2", "1-2-3", "3-1", "0", "10", "1-10", "-1", "1.5"],
+)
+def test_bad_selections(spec):
+    with pytest.raises(ValueError):
+        parse_plots(spec, 9)
+
+
+@pytest.mark.parametrize("spec", ["1,1", "1-3,2", "4-6,1-4"])
+def test_plots_selected_twice(spec):
+    with pytest.raises(ValueError, match="twice"):
+        parse_plots(spec, 9)
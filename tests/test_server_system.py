@@ -0,0 +1,96 @@
+import asyncio
+from game.service.server_system import HELP, GameServer
+
+
+def serve(tmp_path, body):
+    """Run `body(server, port)` against a game server on a free local port."""
+
+    async def run():
+        server = GameServer(save_dir=str(tmp_path))
+        listener = await asyncio.start_server(server.handle_client, "127.0.0.1", 0)
+        try:
+            await body(server, listener.sockets[0].getsockname()[1])
+        finally:
+            listener.close()
+            await listener.wait_closed()
+
+    asyncio.run(run())
+
+
+class Client:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, port: int) -> "Client":
+        client = cls(*await asyncio.open_connection("127.0.0.1", port))
+        assert (await client.reader.readline()).startswith(b"OK terminal-farm")
+        return client
+
+    async def send(self, line: str) -> str:
+        self.writer.write(line.encode() + b"\n")
+        return (await self.reader.readline()).decode().strip()
+
+    async def quit(self):
+        assert await self.send("quit") == "OK bye"
+        assert await self.reader.read() == b""  # Detached by now.
+        self.writer.close()
+
+
+def test_commands_run_on_a_guest_farm_that_is_not_saved(tmp_path):
+    async def body(server, port):
+        client = await Client.connect(port)
+        assert await client.send("help") == "OK " + HELP
+        assert (await client.send("status")).startswith("OK farm=guest:1 day=1 ")
+        assert (await client.send("dance")).startswith("ERR unknown command")
+        assert list(server.sessions) == ["guest:1"]
+
+        other = await Client.connect(port)
+        assert (await other.send("farm guest:1")).startswith("ERR usage")
+        assert (await other.send("farm guest-1")).startswith("OK farm=guest-1 ")
+        assert sorted(server.sessions) == ["guest-1", "guest:1"]
+
+        await client.quit()
+        await other.quit()
+        assert not server.sessions
+        assert [path.name for path in tmp_path.glob("guest*.json")] == ["guest-1.json"]
+
+    serve(tmp_path, body)
+
+
+def test_a_farm_is_shared_and_saved_when_its_last_client_leaves(tmp_path):
+    async def body(server, port):
+        alice = await Client.connect(port)
+        bob = await Client.connect(port)
+        assert (await alice.send("farm alice")).startswith("OK farm=alice ")
+        assert (await bob.send("farm alice")).startswith("OK farm=alice ")
+        assert server.sessions["alice"].clients == 2
+
+        await alice.quit()
+        assert server.sessions["alice"].clients == 1
+        assert (await bob.send("nap")).startswith("OK")
+        status = await bob.send("status")
+
+        assert (await bob.send("farm bob")).startswith("OK farm=bob ")
+        assert list(server.sessions) == ["bob"]
+        await bob.quit()
+        assert not server.sessions
+
+        alice = await Client.connect(port)
+        assert await alice.send("farm alice") == status
+        await alice.quit()
+
+    serve(tmp_path, body)
+
+
+def test_an_overlong_line_ends_the_connection(tmp_path):
+    async def body(server, port):
+        client = await Client.connect(port)
+        assert (await client.send("farm alice")).startswith("OK")
+        assert await client.send("x" * 100_000) == "ERR line too long"
+        assert await client.reader.read() == b""
+        client.writer.close()
+        assert not server.sessions
+
+    serve(tmp_path, body)
@@ -0,0 +1,55 @@
+from game.domain.player import Player
+from game.utils.tracking import Tracked
+
+
+class Point(Tracked):
+    TRACKED = frozenset(("x", "y"))
+
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.label = "origin"
+
+
+def test_assignments_bump_the_version_and_drain_once():
+    point = Point()
+    assert point.drain() == {"x": 0, "y": 0}  # New objects start dirty.
+    assert not point.dirty
+    assert point.drain() == {}
+
+    version = point.version
+    point.x = 0  # Equal value, not a change.
+    point.label = "moved"  # Not tracked.
+    assert point.version == version
+    assert not point.dirty
+
+    point.x = 3
+    assert point.version > version
+    assert point.dirty
+    version = point.version
+    point.x = 4
+    assert point.version > version
+    assert point.drain() == {"x": 4}
+    assert not point.dirty
+    assert point.drain() == {}
+
+
+def test_touch_marks_in_place_changes():
+    point = Point()
+    point.drain()
+    version = point.version
+    point.touch("y")
+    assert point.version > version
+    assert point.drain() == {"y": 0}
+
+
+def test_versions_order_changes_across_objects():
+    first, second = Point(), Point()
+    first.x = 1
+    assert first.version > second.version
+
+    player = Player()
+    player.drain()
+    player.money += 10
+    assert player.version > first.version
+    assert player.drain() == {"money": player.money}
@@ -0,0 +1,21 @@
+from game.service.farm_system import FarmSystem
+from game.service.game_state import GameState
+from game.service.tui_system import TerminalUI
+
+
+def test_notices_survive_a_redraw(clock, monkeypatch):
+    game = GameState(farm=FarmSystem(size=9, clock=clock), clock=clock, seed=1)
+    assert game.plant(0, "wheat")[0]
+    game.tick()
+
+    ui = TerminalUI(game)
+    frames = []
+    monkeypatch.setattr(
+        ui.renderer, "present", lambda frame, started=None: frames.append(frame)
+    )
+    clock.advance(10)
+    ui.display_farm()
+    ui.display_farm()  # The next frame, before the toast expires.
+
+    assert len(frames) == 2
+    assert all("Crops ready to harvest: 1" in frame for frame in frames)
@@ -4,9 +4,23 @@ document.addEventListener("DOMContentLoaded", () => {
   const actionsBlock = document.querySelector('.actions-block');
   const mainMenu = document.querySelector('.main-menu');
   const plantMenu = document.querySelector('.plant-menu');
+  const plantList = document.querySelector('.plant-scroll-wrapper');
+  const grid = document.querySelector('.grid');
   const title = document.querySelector('.actions-title');
 
+  // Served by `python run.py serve --http-port 8080`, pick a farm with ?farm=name.
+  // The API only serves farms that exist, start one with `farm <name>` first.
+  const farm = new URLSearchParams(location.search).get('farm') || 'web';
+  const api = `/api/farms/${encodeURIComponent(farm)}`;
+  const SEASONS = { spring: '🌸 Spring', summer: '☀️ Summer', autumn: '🍂 Autumn', winter: '❄️ Winter' };
+
+  // The farm as the server's event stream describes it, see FarmFeed.
+  let state = null;
+  let crops = {};
+  let selectedPlot = null;
+
   function showPlantMenu() {
+    renderPlantMenu();
     mainMenu.classList.add('hidden');
     plantMenu.classList.remove('hidden');
     backButton.classList.remove('hidden');
@@ -20,6 +34,15 @@ document.addEventListener("DOMContentLoaded", () => {
     title.textContent = 'Actions';
   }
 
+  function showMessage(message) {
+    title.textContent = message;
+    setTimeout(() => {
+      if (title.textContent === message) {
+        title.textContent = plantMenu.classList.contains('hidden') ? 'Actions' : 'Choose a Seed';
+      }
+    }, 2500);
+  }
+
   plantButton.addEventListener('click', showPlantMenu);
   backButton.addEventListener('click', showMainMenu);
 
@@ -45,5 +68,151 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   }
 
-  renderHearts(12.5);
-});
\ No newline at end of file
+  function capitalize(name) {
+    return name.charAt(0).toUpperCase() + name.slice(1);
+  }
+
+  function plotState(plot) {
+    if (!plot) {
+      return 'empty';
+    }
+    return plot.ready ? 'ready' : 'growing';
+  }
+
+  function renderHeader() {
+    document.querySelector('.day').textContent = String(state.day).padStart(2, '0');
+    document.querySelector('.time-season').textContent =
+      `${capitalize(state.part)} | ${SEASONS[state.season]}`;
+    document.querySelector('.money').textContent = `$${state.money.toLocaleString()}`;
+    renderHearts(state.stamina);
+  }
+
+  function renderPlots(changed) {
+    const plots = state.plots;
+    while (grid.children.length > plots.length) {
+      grid.lastElementChild.remove();
+    }
+    while (grid.children.length < plots.length) {
+      const index = grid.children.length;
+      const slot = document.createElement('div');
+      slot.className = 'slot';
+      slot.dataset.slotId = index + 1;
+      slot.innerHTML = '<div class="crop-image"></div><div class="crop-status"></div>';
+      slot.addEventListener('click', () => {
+        selectedPlot = index;
+        if (plotState(state.plots[index]) === 'ready') {
+          act('harvest');
+        } else if (!state.plots[index]) {
+          showPlantMenu();
+        }
+      });
+      grid.appendChild(slot);
+    }
+    for (const index of changed || plots.keys()) {
+      const plot = plots[index];
+      const slot = grid.children[index];
+      slot.dataset.state = plotState(plot);
+      slot.querySelector('.crop-status').textContent = plot
+        ? capitalize(plot.crop)
+        : `Slot ${String(Number(index) + 1).padStart(2, '0')}`;
+    }
+  }
+
+  function renderPlantMenu() {
+    plantList.innerHTML = '';
+    for (const name of state ? state.unlocked_crops : []) {
+      const crop = crops[name];
+      if (!crop) {
+        continue;
+      }
+      const button = document.createElement('button');
+      button.className = 'action';
+      button.innerHTML = `
+        <div class="crop-left"></div>
+        <div class="crop-right">
+          <span class="crop-cost">-$${crop.cost}</span>
+          <span class="crop-profit">+$${crop.value}</span>
+          <span class="crop-time">⧗${crop.growth_time}s</span>
+          <span class="crop-stamina"><img src="assets/full_h.svg" alt="heart" />${crop.stamina_cost}</span>
+        </div>`;
+      button.querySelector('.crop-left').textContent = capitalize(name);
+      button.addEventListener('click', () => plant(name));
+      plantList.appendChild(button);
+    }
+  }
+
+  // One snapshot on connect, then only what changed. EventSource reconnects
+  // on its own and the server starts over with a fresh snapshot.
+  function listen() {
+    const events = new EventSource(`${api}/events`);
+    events.addEventListener('snapshot', (event) => {
+      state = JSON.parse(event.data);
+      renderHeader();
+      renderPlots();
+    });
+    events.addEventListener('delta', (event) => {
+      const delta = JSON.parse(event.data);
+      const { plots, size, messages, ...fields } = delta;
+      Object.assign(state, fields);
+      if (size !== undefined) {
+        state.plots.length = size;
+      }
+      for (const [index, plot] of Object.entries(plots || {})) {
+        state.plots[index] = plot;
+      }
+      renderHeader();
+      renderPlots(size === undefined ? Object.keys(plots || {}) : undefined);
+      (messages || []).forEach(showMessage);
+    });
+    events.onerror = () => showMessage('Reconnecting to the farm…');
+  }
+
+  async function act(action, body = {}) {
+    const response = await fetch(`${api}/${action}`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(body),
+    });
+    const result = await response.json();
+    if (!result.ok) {
+      showMessage(result.message || result.error);
+    }
+  }
+
+  function plant(name) {
+    const plots = state.plots;
+    let index = selectedPlot;
+    if (index === null || plots[index]) {
+      index = plots.findIndex((plot) => !plot);
+    }
+    selectedPlot = null;
+    showMainMenu();
+    if (index === -1) {
+      showMessage('Every plot is planted!');
+      return;
+    }
+    act('plant', { plot: index + 1, crop: name });
+  }
+
+  document.querySelectorAll('[data-action]').forEach((button) => {
+    button.addEventListener('click', () => {
+      let action = button.dataset.action;
+      if (action === 'rest') {
+        action = state && (state.part === 'night' || state.can_sleep_anytime) ? 'sleep' : 'nap';
+      }
+      act(action);
+    });
+  });
+
+  renderHearts(0);
+  fetch('/api/crops')
+    .then((response) => response.json())
+    .then((catalog) => { crops = catalog; });
+  fetch(api, { method: 'HEAD' }).then((response) => {
+    if (response.status === 404) {
+      title.textContent = `No farm named ${farm} yet`;
+    } else {
+      listen();
+    }
+  });
+});